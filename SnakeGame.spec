@@ -1,4 +1,16 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import shutil
+import sys
+
+sys.path.insert(0, SPECPATH)
+from src.render.asset_cache import prebake_assets
+
+# Pré-calculer l'atlas des sprites : l'exécutable l'embarque et ne lance
+# pas Pillow au démarrage (cache en lecture seule, voir asset_cache.py)
+asset_cache_dir = os.path.join(SPECPATH, 'build', 'asset_cache')
+shutil.rmtree(asset_cache_dir, ignore_errors=True)
+prebake_assets(asset_cache_dir)
 
 
 a = Analysis(
@@ -9,6 +21,7 @@ a = Analysis(
         ('assets/images', 'assets/images'),
         ('assets/sounds', 'assets/sounds'),
         ('assets/data', 'assets/data'),
+        (asset_cache_dir, 'assets/cache'),
     ],
     hiddenimports=[],
     hookspath=[],
@@ -14,16 +14,251 @@ Contrôles:
     Échap - Pause
     X - Quitter
 
+Mode sans affichage (serveurs sans écran):
+    python main.py --headless --games 1000 --workers 8 --policy greedy
+
+Front-end pygame (SDL_VIDEODRIVER=dummy pour mesurer sans écran):
+    python main.py --frontend pygame [--cols 80 --rows 60 --cell-size 10]
+    python main.py --frontend pygame --autoplay --speed uncapped --max-ticks 100000
+
+Mode terminal (curses, par exemple par SSH):
+    python main.py --tui
+
+Mesure du temps de lancement (durée de chaque phase jusqu'à la première image):
+    python main.py --startup-profile
+
+Mesure de chaque image (histogrammes JSON à la fermeture, --profile-live pour l'afficher):
+    python main.py --profile-frames [profil.json] [--profile-live]
+
+Lecture d'un replay (← / → pour reculer / avancer):
+    python main.py --replay partie.snkr [--speed uncapped] [--seek 5000] [--headless]
+
 Auteur: Baddsu51
 Version: 2.0 (refactorisation complète)
 """
 
-from src.core.game import Game
+import argparse
+import json
+import os
+import sys
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Analyse les arguments de la ligne de commande.
+
+    Args:
+        argv: Liste des arguments (None pour sys.argv).
+
+    Returns:
+        Les arguments analysés.
+    """
+    parser = argparse.ArgumentParser(description="Snake Game")
+    parser.add_argument("--headless", action="store_true",
+                        help="Joue des parties sans fenêtre (aucun import de Tk)")
+    parser.add_argument("--games", type=int, default=100,
+                        help="Nombre de parties en mode headless")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Nombre de processus en mode headless")
+    parser.add_argument("--policy", default="greedy",
+                        help="Politique de jeu en mode headless (random, greedy)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Graine de la session (base des graines en mode headless)")
+    parser.add_argument("--record", nargs="?", const="", default=None, metavar="DIR",
+                        help="Enregistre le replay de chaque partie (dossier utilisateur par défaut)")
+    parser.add_argument("--max-ticks", type=int, default=None,
+                        help="Nombre maximal de pas par partie headless")
+    parser.add_argument("--output", default=None,
+                        help="Fichier de résultats (JSON lines) ; stdout par défaut")
+    parser.add_argument("--tui", action="store_true",
+                        help="Joue dans le terminal (curses), sans fenêtre")
+    parser.add_argument("--frontend", choices=("turtle", "pygame"), default="turtle",
+                        help="Interface graphique du jeu")
+    parser.add_argument("--cols", type=int, default=None,
+                        help="Nombre de colonnes du plateau (front-end pygame)")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="Nombre de lignes du plateau (front-end pygame)")
+    parser.add_argument("--cell-size", type=int, default=None,
+                        help="Taille d'une case en pixels (front-end pygame)")
+    parser.add_argument("--autoplay", action="store_true",
+                        help="La politique --policy joue à la place du clavier (front-end pygame)")
+    parser.add_argument("--renderer", choices=("turtle", "canvas"), default=None,
+                        help="Moteur de rendu de la fenêtre (canvas : dessin direct sur le canvas Tk)")
+    parser.add_argument("--replay", default=None, metavar="FILE",
+                        help="Lit un replay enregistré (avec --headless : sans fenêtre)")
+    parser.add_argument("--speed", choices=("realtime", "uncapped"), default="realtime",
+                        help="Vitesse de lecture du replay")
+    parser.add_argument("--seek", type=int, default=0, metavar="TICK",
+                        help="Pas auquel commencer la lecture du replay")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Affiche la durée de chaque phase du démarrage (fenêtre Turtle)")
+    parser.add_argument("--profile-frames", nargs="?", const="", default=None, metavar="FILE",
+                        help="Mesure chaque phase des images et écrit les histogrammes en JSON "
+                             "à la fermeture (dossier utilisateur par défaut)")
+    parser.add_argument("--profile-live", action="store_true",
+                        help="Affiche en direct le p95 de chaque phase (active --profile-frames)")
+    args = parser.parse_args(argv)
+
+    # Les front-ends pygame et terminal ne savent pas lire un replay
+    if args.replay and not args.headless and args.frontend == "pygame":
+        parser.error("--replay n'est pas disponible avec --frontend pygame "
+                     "(fenêtre Turtle ou --headless)")
+    if args.replay and not args.headless and args.tui:
+        parser.error("--replay n'est pas disponible avec --tui "
+                     "(fenêtre Turtle ou --headless)")
+    return args
+
+
+def replay_dir(args: argparse.Namespace):
+    """
+    Retourne le dossier des replays demandé par --record.
+
+    Args:
+        args: Arguments de la ligne de commande.
+
+    Returns:
+        Le dossier, ou None si l'enregistrement n'est pas demandé.
+    """
+    if args.record is None:
+        return None
+    if args.record:
+        return args.record
+
+    from src.config import REPLAY_DIR
+    return REPLAY_DIR
+
+
+def run_headless(args: argparse.Namespace):
+    """
+    Lance un lot de parties sans affichage et affiche le résumé sur stderr.
+
+    Args:
+        args: Arguments de la ligne de commande.
+    """
+    from src.core.headless import run_headless as run_batch
+    from src.core.policies import POLICIES
+
+    if args.policy not in POLICIES:
+        sys.exit(f"Politique inconnue: {args.policy} "
+                 f"(disponibles: {', '.join(POLICIES)})")
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        summary = run_batch(args.games, args.workers, args.policy,
+                            seed=args.seed or 0, max_ticks=args.max_ticks, output=output,
+                            record_dir=replay_dir(args))
+    finally:
+        if args.output:
+            output.close()
+
+    print(f"{summary['games']} parties - score moyen {summary['mean_score']:.2f}, "
+          f"meilleur {summary['best_score']}, "
+          f"{summary['ticks_per_second']:.0f} pas/s", file=sys.stderr)
+
+
+def load_player(args: argparse.Namespace):
+    """
+    Charge le replay demandé par --replay et se place au pas --seek.
+
+    Args:
+        args: Arguments de la ligne de commande.
+
+    Returns:
+        Le lecteur de replay.
+    """
+    from src.core.replay import ReplayPlayer, load_replay
+
+    try:
+        player = ReplayPlayer(load_replay(args.replay))
+    except (IOError, OSError, ValueError) as e:
+        sys.exit(f"Impossible de lire le replay {args.replay} - {e}")
+
+    player.seek(args.seek)
+    return player
+
+
+def play_replay_headless(args: argparse.Namespace):
+    """
+    Lit un replay sans affichage et écrit le résultat final (JSON).
+
+    Args:
+        args: Arguments de la ligne de commande.
+    """
+    player = load_player(args)
+    player.play(args.speed)
+
+    engine = player.engine
+    print(json.dumps({
+        "replay": args.replay,
+        "seed": engine.seed,
+        "score": engine.score,
+        "ticks": engine.ticks,
+        "alive": engine.alive,
+    }))
+
+
+def run_pygame(args: argparse.Namespace):
+    """
+    Lance le front-end pygame et affiche les statistiques sur stderr.
+
+    Args:
+        args: Arguments de la ligne de commande.
+    """
+    from src.config import CELL_SIZE, GRID_COLS, GRID_ROWS
+    from src.core.pygame_game import PygameGame
+
+    game = PygameGame(seed=args.seed,
+                      cols=args.cols or GRID_COLS,
+                      rows=args.rows or GRID_ROWS,
+                      cell_size=args.cell_size or CELL_SIZE,
+                      replay_dir=replay_dir(args),
+                      policy_name=args.policy if args.autoplay else None,
+                      uncapped=args.speed == "uncapped",
+                      max_ticks=args.max_ticks)
+    stats = game.run()
+    print(f"{stats['frames']} images, {stats['ticks']} pas, {stats['games']} parties "
+          f"en {stats['seconds']} s - {stats['fps']:.0f} images/s", file=sys.stderr)
 
 
 def main():
     """Point d'entrée principal du jeu."""
-    game = Game()
+    args = parse_args()
+
+    if args.replay and args.headless:
+        play_replay_headless(args)
+        return
+
+    if args.headless:
+        run_headless(args)
+        return
+
+    if args.tui:
+        from src.core.tui_game import TuiGame
+        TuiGame(seed=args.seed, replay_dir=replay_dir(args)).run()
+        return
+
+    if args.frontend == "pygame":
+        run_pygame(args)
+        return
+
+    from src.core.startup_profile import StartupProfile
+    profile = StartupProfile(enabled=args.startup_profile)
+
+    # Import tardif : le mode headless ne doit pas dépendre de Tk
+    with profile.phase("imports"):
+        from src.core.game import Game
+
+    options = {"renderer": args.renderer} if args.renderer else {}
+    options["startup_profile"] = profile
+    if args.profile_frames is not None or args.profile_live:
+        from src.core.frame_profile import FrameProfiler
+        from src.config import FRAME_PROFILE_FILE
+        options["frame_profiler"] = FrameProfiler(
+            output_path=args.profile_frames or FRAME_PROFILE_FILE, live=args.profile_live)
+    if args.replay:
+        game = Game(replay=load_player(args), replay_speed=args.speed, **options)
+    else:
+        game = Game(seed=args.seed, replay_dir=replay_dir(args), **options)
     game.run()
 
 
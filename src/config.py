@@ -4,7 +4,6 @@ Configuration du jeu Snake - Constantes et chemins des ressources
 
 import os
 import sys
-import tempfile
 
 
 def resource_path(relative_path: str) -> str:
@@ -25,6 +24,8 @@ def get_user_data_path(filename: str) -> str:
     """
     Obtient le chemin pour sauvegarder les données utilisateur de manière persistante.
     Utilise le dossier AppData sur Windows, .local/share sur Linux, et Application Support sur macOS.
+    Le dossier n'est pas créé ici (l'import de la configuration ne touche pas
+    au disque) : chaque écriture le crée si nécessaire.
     """
     if sys.platform == "win32":
         # Windows: %APPDATA%\SnakeGame
@@ -39,9 +40,6 @@ def get_user_data_path(filename: str) -> str:
         data_dir = os.path.join(os.path.expanduser(
             '~'), '.local', 'share', 'SnakeGame')
 
-    # Créer le dossier s'il n'existe pas
-    os.makedirs(data_dir, exist_ok=True)
-
     return os.path.join(data_dir, filename)
 
 
@@ -53,16 +51,20 @@ WINDOW_TITLE = "Snake Game"
 # Taille des cases de la grille
 CELL_SIZE = 40
 
+# Dimensions de la grille (en cases)
+GRID_COLS = WINDOW_WIDTH // CELL_SIZE
+GRID_ROWS = WINDOW_HEIGHT // CELL_SIZE
+
 # Vitesse du jeu (délai entre chaque frame en secondes)
 GAME_SPEED = 0.17
 
-# Limites du terrain de jeu
-BOUNDARY_X = 390
-BOUNDARY_Y = 290
+# Case initiale du serpent (colonne, ligne ; la ligne 0 est en bas)
+SNAKE_START_COL = 9
+SNAKE_START_ROW = 7
 
-# Position initiale du serpent
-SNAKE_START_X = -20
-SNAKE_START_Y = 0
+# Zone masquée par l'affichage du score (en cases, coin haut gauche)
+SCORE_ZONE_COLS = 2
+SCORE_ZONE_ROWS = 2
 
 # Couleurs
 BACKGROUND_COLOR = "black"
@@ -73,9 +75,6 @@ SCORE_COLOR = "#E0E0E0"  # Gris clair visible sur fond sombre
 IMAGE_SIZE = (40, 40)
 APPLE_SIZE = (35, 35)
 
-# Dossier temporaire pour les images GIF converties
-TEMP_DIR = tempfile.gettempdir()
-
 # Chemins des assets
 ASSETS_DIR = resource_path("./assets")
 
@@ -88,17 +87,29 @@ GRID_IMAGE = resource_path("./assets/images/grid.png")
 # Sons
 SOUND_EAT = resource_path("./assets/sounds/apple_munch_noice.wav")
 SOUND_HIT = resource_path("./assets/sounds/punch_whistle_noice.wav")
+SOUND_QUEUE_SIZE = 8              # Demandes de lecture en attente au maximum
+SOUND_INIT_TIMEOUT = 1.0          # Attente max. de l'init audio à la fermeture (s)
 
 # Fichier de score (persistant dans le dossier utilisateur)
 SCORE_FILE = get_user_data_path("highscore.txt")
 
-# Chemins des fichiers temporaires pour les images GIF
-TEMP_APPLE_GIF = os.path.join(TEMP_DIR, "snake_temp_apple.gif")
-TEMP_BODY_GIF = os.path.join(TEMP_DIR, "snake_temp_body.gif")
-TEMP_HEAD_NORTH_GIF = os.path.join(TEMP_DIR, "snake_temp_head_north.gif")
-TEMP_HEAD_SOUTH_GIF = os.path.join(TEMP_DIR, "snake_temp_head_south.gif")
-TEMP_HEAD_EAST_GIF = os.path.join(TEMP_DIR, "snake_temp_head_east.gif")
-TEMP_HEAD_WEST_GIF = os.path.join(TEMP_DIR, "snake_temp_head_west.gif")
+# Dossier des replays (utilisé avec l'option --record)
+REPLAY_DIR = get_user_data_path("replays")
+REPLAY_KEYFRAME_INTERVAL = 250    # Pas entre deux images clés (recherche rapide)
+REPLAY_SEEK_TICKS = 50            # Pas sautés par les flèches pendant un replay
+
+# Profil des images (main.py --profile-frames)
+FRAME_PROFILE_FILE = get_user_data_path("frame_profile.json")
+FRAME_PROFILE_BUCKETS = 24        # Tranches de l'histogramme (puissances de 2 à partir de 1 µs)
+FRAME_PROFILE_LIVE_MS = 500       # Délai entre deux mises à jour de l'affichage en direct
+
+# Cache de l'atlas des sprites (clé : empreinte des images sources et des conversions)
+ASSET_CACHE_DIR = get_user_data_path("asset_cache")
+# Cache pré-calculé embarqué dans l'exécutable PyInstaller (lecture seule)
+BUNDLED_ASSET_CACHE_DIR = resource_path("./assets/cache")
+
+# Rotations de l'image de la tête (degrés, sens antihoraire) : nord, sud, est, ouest
+HEAD_ROTATIONS = (0, 180, 270, 90)
 
 # Contrôles clavier (ZQSD pour clavier AZERTY français)
 KEY_UP = "z"
@@ -114,6 +125,10 @@ KEY_ARROW_DOWN = "Down"
 KEY_ARROW_LEFT = "Left"
 KEY_ARROW_RIGHT = "Right"
 
+# File des directions (touches appliquées une par pas)
+INPUT_QUEUE_SIZE = 3              # Directions en attente au maximum
+INPUT_LATENCY_SAMPLES = 1000      # Mesures gardées pour les centiles touche → image
+
 # Directions
 DIRECTION_UP = "Up"
 DIRECTION_DOWN = "Down"
@@ -135,6 +150,8 @@ OPPOSITE_DIRECTIONS = {
 SPEED_INITIAL = 0.18              # Vitesse de départ (en secondes)
 SPEED_MIN = 0.08                  # Vitesse maximale (rapide)
 SPEED_DECREASE_PER_POINT = 0.008  # Accélération progressive par point
+GAME_FRAME_MS = 16                # Délai entre deux images (le serpent glisse entre les cases)
+GAME_MAX_CATCHUP = 5              # Pas de jeu rattrapés au plus par image
 
 # ============================================
 # ANIMATIONS
@@ -147,6 +164,9 @@ POPUP_RISE_DISTANCE = 40          # Distance parcourue par le popup
 
 # Trainée du serpent
 TRAIL_LENGTH = 4                  # Nombre de positions pour la trainée
+TRAIL_SIZE_START = 1.0            # Taille de la position la plus proche de la queue
+TRAIL_SIZE_STEP = 0.15            # Réduction de taille d'une position à la suivante
+TRAIL_SIZE_MIN = 0.3              # Taille minimale
 TRAIL_COLORS = [                  # Couleurs vives pour la trainée
     "#8BC34A",                    # Vert clair
     "#689F38",                    # Vert moyen
@@ -158,11 +178,24 @@ TRAIL_COLORS = [                  # Couleurs vives pour la trainée
 APPLE_PULSE_MIN = 0.95            # Taille minimale (facteur)
 APPLE_PULSE_MAX = 1.05            # Taille maximale (facteur)
 APPLE_PULSE_SPEED = 80            # Millisecondes par étape de pulsation
+APPLE_PULSE_FRAMES = 6            # Images pré-calculées entre la taille minimale et maximale
+APPLE_FLASH_SCALE = 1.5           # Taille de la pomme au moment où elle est mangée
 
 # Animation de mort
-DEATH_ANIMATION_STEPS = 10        # Nombre d'étapes pour l'animation de mort
+DEATH_ANIMATION_STEPS = 10        # Étapes au plus (les segments sont cachés par lots)
 DEATH_ANIMATION_DELAY = 30        # Millisecondes entre chaque étape (rapide)
 
+# Moteur de rendu par défaut ("turtle" ou "canvas" : dessin direct sur le canvas Tk)
+RENDERER = "turtle"
+
+# Front-end pygame (main.py --frontend pygame)
+PYGAME_FPS = 60                   # Images par seconde (hors mode uncapped)
+PYGAME_MAX_CATCHUP = 5            # Pas de jeu rattrapés au plus par image
+
+# Textes avec contour (rendus une seule fois avec Pillow, puis réutilisés)
+TEXT_CACHE_SIZE = 64              # Nombre d'images de texte gardées en mémoire (LRU)
+TEXT_POINT_SCALE = 96 / 72        # Pixels par point de police (écran à 96 ppp, comme Tk)
+
 # Frame rate pour les animations
 ANIMATION_FRAME_MS = 20           # ~50 FPS
 
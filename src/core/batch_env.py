@@ -0,0 +1,245 @@
+"""
+Environnement Snake vectorisé - N parties simulées en parallèle avec NumPy
+
+Reprend les règles de GameEngine (murs, collision avec soi-même,
+croissance, apparition de la pomme hors zone du score) mais garde
+l'état de toutes les parties dans des tableaux NumPy, avancés d'un
+seul appel vectorisé à step(actions).
+"""
+
+from typing import NamedTuple, Optional
+
+from src.config import (
+    GRID_COLS,
+    GRID_ROWS,
+    SNAKE_START_COL,
+    SNAKE_START_ROW,
+    SCORE_ZONE_COLS,
+    SCORE_ZONE_ROWS,
+)
+from src.core.engine import ACTION_UP, ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+# Codes des causes de mort
+CAUSE_NONE = 0
+CAUSE_WALL = 1
+CAUSE_SELF = 2
+
+
+class BatchStepResult(NamedTuple):
+    """Résultat d'un pas vectorisé (un élément par partie)."""
+    ate: "np.ndarray"
+    dead: "np.ndarray"
+    death_cause: "np.ndarray"
+    score: "np.ndarray"
+    ticks: "np.ndarray"
+
+
+class BatchSnakeEnv:
+    """
+    Simule N parties de Snake en parallèle dans des tableaux NumPy.
+    Les parties terminées sont réinitialisées automatiquement ; leur
+    score et leur durée finaux sont renvoyés par step().
+
+    Méthodes publiques:
+        - reset(): Réinitialise toutes les parties
+        - step(actions: np.ndarray) -> BatchStepResult: Avance toutes les parties d'un pas
+        - num_games (propriété): Nombre de parties simulées
+        - heads (propriété): Case (indice aplati) de la tête de chaque partie
+        - apples (propriété): Case (indice aplati) de la pomme de chaque partie
+        - lengths (propriété): Nombre de segments derrière la tête
+        - scores (propriété): Score courant de chaque partie
+        - occupancy (propriété): Grilles d'occupation (num_games, rows, cols)
+    """
+
+    def __init__(self, num_games: int, cols: int = GRID_COLS, rows: int = GRID_ROWS,
+                 seed: Optional[int] = None):
+        """
+        Initialise l'environnement vectorisé.
+
+        Args:
+            num_games: Nombre de parties simulées en parallèle.
+            cols: Nombre de colonnes de la grille.
+            rows: Nombre de lignes de la grille.
+            seed: Graine du générateur aléatoire (None pour une graine aléatoire).
+        """
+        if np is None:
+            raise ImportError("numpy est requis pour BatchSnakeEnv")
+
+        self._n = num_games
+        self._cols = cols
+        self._rows = rows
+        self._cells = cols * rows
+        # Une case de plus que la grille : l'anneau ne déborde jamais
+        self._capacity = self._cells + 1
+        self._rng = np.random.default_rng(seed)
+
+        self._games = np.arange(num_games)
+        self._start = SNAKE_START_ROW * cols + SNAKE_START_COL
+
+        # Déplacements (colonne, ligne) indexés par code d'action
+        self._delta_col = np.array([0, 0, -1, 1], dtype=np.int32)
+        self._delta_row = np.array([1, -1, 0, 0], dtype=np.int32)
+        self._opposite = np.array(
+            [ACTION_DOWN, ACTION_UP, ACTION_RIGHT, ACTION_LEFT], dtype=np.int8)
+
+        # Cases où la pomme ne peut pas apparaître (zone du score)
+        score_zone = np.zeros((rows, cols), dtype=bool)
+        score_zone[rows - SCORE_ZONE_ROWS:, :SCORE_ZONE_COLS] = True
+        self._spawnable = ~score_zone.ravel()
+
+        # État de toutes les parties
+        self._ring = np.zeros((num_games, self._capacity), dtype=np.int32)
+        self._head_ptr = np.zeros(num_games, dtype=np.int64)
+        self._size = np.zeros(num_games, dtype=np.int64)
+        self._occupied = np.zeros((num_games, self._cells), dtype=bool)
+        self._apple = np.zeros(num_games, dtype=np.int64)
+        self._direction = np.zeros(num_games, dtype=np.int8)
+        self._score = np.zeros(num_games, dtype=np.int32)
+        self._ticks = np.zeros(num_games, dtype=np.int32)
+
+        self.reset()
+
+    def reset(self):
+        """Réinitialise toutes les parties."""
+        self._reset_games(self._games)
+
+    def _reset_games(self, games: "np.ndarray"):
+        """
+        Réinitialise un sous-ensemble de parties.
+
+        Args:
+            games: Indices des parties à réinitialiser.
+        """
+        if games.size == 0:
+            return
+
+        self._occupied[games] = False
+        self._ring[games, 0] = self._start
+        self._head_ptr[games] = 0
+        self._size[games] = 1
+        self._occupied[games, self._start] = True
+        # Comme après le compte à rebours : départ vers la droite
+        self._direction[games] = ACTION_RIGHT
+        self._score[games] = 0
+        self._ticks[games] = 0
+        self._spawn_apples(games)
+
+    def _spawn_apples(self, games: "np.ndarray"):
+        """
+        Place une pomme sur une case libre aléatoire pour chaque partie donnée.
+
+        Args:
+            games: Indices des parties concernées.
+        """
+        free = ~self._occupied[games] & self._spawnable
+        counts = free.sum(axis=1)
+        # Tirer le rang de la case libre, puis le retrouver par somme cumulée
+        ranks = (self._rng.random(games.size) *
+                 np.maximum(counts, 1)).astype(np.int64)
+        apples = np.argmax(free.cumsum(axis=1) > ranks[:, None], axis=1)
+
+        # Fallback si toutes les cases sont occupées
+        full = counts == 0
+        if full.any():
+            apples[full] = self._rng.integers(0, self._cells, int(full.sum()))
+
+        self._apple[games] = apples
+
+    def step(self, actions: "np.ndarray") -> BatchStepResult:
+        """
+        Avance toutes les parties d'un pas.
+
+        Args:
+            actions: Code d'action (ACTION_UP, ...) de chaque partie.
+                Un demi-tour est ignoré, comme dans GameEngine.
+
+        Returns:
+            BatchStepResult ; pour les parties mortes pendant ce pas, score
+            et ticks sont les valeurs finales, avant la réinitialisation.
+        """
+        games = self._games
+        actions = np.asarray(actions, dtype=np.int8)
+
+        # Empêcher le demi-tour
+        turn = actions != self._opposite[self._direction]
+        self._direction = np.where(turn, actions, self._direction)
+
+        # Calculer la nouvelle case de la tête
+        head = self._ring[games, self._head_ptr]
+        new_col = head % self._cols + self._delta_col[self._direction]
+        new_row = head // self._cols + self._delta_row[self._direction]
+        wall = ((new_col < 0) | (new_col >= self._cols) |
+                (new_row < 0) | (new_row >= self._rows))
+        new_head = np.where(wall, 0, new_row * self._cols + new_col)
+
+        ate = ~wall & (new_head == self._apple)
+
+        # La queue libère sa case, sauf si le serpent grandit
+        movers = np.flatnonzero(~wall & ~ate)
+        tail_ptr = (self._head_ptr[movers] +
+                    self._size[movers] - 1) % self._capacity
+        self._occupied[movers, self._ring[movers, tail_ptr]] = False
+        self._size[movers] -= 1
+
+        # Collision avec soi-même
+        bitten = ~wall & self._occupied[games, new_head]
+        dead = wall | bitten
+
+        # Avancer la tête des survivants
+        alive = np.flatnonzero(~dead)
+        self._head_ptr[alive] = (self._head_ptr[alive] - 1) % self._capacity
+        self._ring[alive, self._head_ptr[alive]] = new_head[alive]
+        self._occupied[alive, new_head[alive]] = True
+        self._size[alive] += 1
+
+        self._ticks += 1
+        self._score += ate
+        self._spawn_apples(np.flatnonzero(ate))
+
+        death_cause = np.where(wall, CAUSE_WALL,
+                               np.where(bitten, CAUSE_SELF, CAUSE_NONE)).astype(np.int8)
+        result = BatchStepResult(ate, dead, death_cause,
+                                 self._score.copy(), self._ticks.copy())
+
+        # Réinitialiser automatiquement les parties terminées
+        self._reset_games(np.flatnonzero(dead))
+
+        return result
+
+    @property
+    def num_games(self) -> int:
+        """Nombre de parties simulées."""
+        return self._n
+
+    @property
+    def heads(self) -> "np.ndarray":
+        """Case (indice aplati ligne * cols + colonne) de la tête de chaque partie."""
+        return self._ring[self._games, self._head_ptr]
+
+    @property
+    def apples(self) -> "np.ndarray":
+        """Case (indice aplati) de la pomme de chaque partie."""
+        return self._apple.copy()
+
+    @property
+    def lengths(self) -> "np.ndarray":
+        """Nombre de segments derrière la tête de chaque partie."""
+        return self._size - 1
+
+    @property
+    def scores(self) -> "np.ndarray":
+        """Score courant de chaque partie."""
+        return self._score.copy()
+
+    @property
+    def occupancy(self) -> "np.ndarray":
+        """Grilles d'occupation (num_games, rows, cols), en lecture seule."""
+        view = self._occupied.reshape(self._n, self._rows, self._cols)
+        view = view.view()
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,561 @@
+"""
+Moteur de jeu Snake - Règles du jeu indépendantes de l'affichage
+
+Ce module ne dépend ni de Turtle ni de Tk : il peut être exécuté
+des millions de fois par minute pour l'équilibrage ou les bots.
+"""
+
+from array import array
+import random
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.config import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    CELL_SIZE,
+    GRID_COLS,
+    GRID_ROWS,
+    SNAKE_START_COL,
+    SNAKE_START_ROW,
+    SCORE_ZONE_COLS,
+    SCORE_ZONE_ROWS,
+    DIRECTION_UP,
+    DIRECTION_DOWN,
+    DIRECTION_LEFT,
+    DIRECTION_RIGHT,
+    DIRECTION_STOP,
+    OPPOSITE_DIRECTIONS,
+    TRAIL_LENGTH,
+)
+from src.core.varint import read_varint, write_varint
+
+# Une case de la grille : (colonne, ligne), la ligne 0 étant en bas
+Cell = Tuple[int, int]
+
+# Taille des graines (elles tiennent sur 64 bits dans les replays)
+SEED_BITS = 63
+_MASK_64 = (1 << 64) - 1
+
+# Causes de mort
+DEATH_WALL = "wall"
+DEATH_SELF = "self"
+
+# Déplacement (colonne, ligne) associé à chaque direction
+DIRECTION_DELTAS = {
+    DIRECTION_UP: (0, 1),
+    DIRECTION_DOWN: (0, -1),
+    DIRECTION_LEFT: (-1, 0),
+    DIRECTION_RIGHT: (1, 0),
+}
+
+# Codes entiers des actions (pour les bots et les environnements)
+ACTION_DIRECTIONS = (DIRECTION_UP, DIRECTION_DOWN,
+                     DIRECTION_LEFT, DIRECTION_RIGHT)
+ACTION_UP = 0
+ACTION_DOWN = 1
+ACTION_LEFT = 2
+ACTION_RIGHT = 3
+
+# Codes des directions dans les instantanés (STOP compris)
+_DIRECTION_CODES = ACTION_DIRECTIONS + (DIRECTION_STOP,)
+# Code de déplacement entre deux cases voisines (même ordre que les actions)
+_DELTA_CODES = {DIRECTION_DELTAS[d]: code for code,
+                d in enumerate(ACTION_DIRECTIONS)}
+
+
+def cell_to_pixel(cell: Cell) -> Tuple[float, float]:
+    """
+    Convertit une case de la grille en coordonnées Turtle (centre de la case).
+    Les entités ne stockent que des cases : cette conversion n'a lieu
+    qu'au moment de dessiner.
+
+    Args:
+        cell: Case (colonne, ligne).
+
+    Returns:
+        Tuple (x, y) en pixels.
+    """
+    col, row = cell
+    x = col * CELL_SIZE + CELL_SIZE // 2 - WINDOW_WIDTH // 2
+    y = row * CELL_SIZE + CELL_SIZE // 2 - WINDOW_HEIGHT // 2
+    return (x, y)
+
+
+class StepResult(NamedTuple):
+    """Résultat d'un pas de simulation."""
+    moved: bool
+    ate: bool
+    dead: bool
+    death_cause: Optional[str]
+
+
+class GameEngine:
+    """
+    État complet d'une partie de Snake sur une grille de cases entières.
+    Aucune dépendance graphique : les classes Snake, Apple et Game
+    ne sont que des vues sur ce moteur.
+
+    Méthodes publiques:
+        - reset(seed: Optional[int] = None): Remet la partie à son état initial
+        - set_direction(direction: str) -> bool: Change la direction (empêche les demi-tours)
+        - step(action: Optional[str] = None) -> StepResult: Avance la partie d'un pas
+        - is_occupied(cell: Cell) -> bool: Indique si une case est occupée par le serpent
+        - cell_at(offset: int) -> Optional[Cell]: Case à une distance donnée de la tête (historique compris)
+        - snapshot() -> bytes: Retourne un instantané compact de l'état
+        - restore(data: bytes): Restaure l'état depuis un instantané
+        - head (propriété): Case de la tête
+        - body (propriété): Cases du serpent, de la tête vers la queue
+        - apple (propriété): Case de la pomme
+        - length (propriété): Nombre de segments derrière la tête
+        - score (propriété): Nombre de pommes mangées
+        - direction (propriété): Direction actuelle
+        - alive (propriété): True tant que le serpent n'est pas mort
+        - ticks (propriété): Nombre de pas simulés depuis le début de la partie
+        - seed (propriété): Graine de la partie en cours
+        - cols, rows (propriétés): Dimensions de la grille
+    """
+
+    def __init__(self, cols: int = GRID_COLS, rows: int = GRID_ROWS,
+                 history: int = TRAIL_LENGTH, seed: Optional[int] = None):
+        """
+        Initialise le moteur.
+
+        Args:
+            cols: Nombre de colonnes de la grille.
+            rows: Nombre de lignes de la grille.
+            history: Nombre de cases quittées par la queue à conserver
+                (utilisé pour la trainée).
+            seed: Graine de la première partie (None pour une graine aléatoire).
+        """
+        self._cols = cols
+        self._rows = rows
+        self._start: Cell = (SNAKE_START_COL, SNAKE_START_ROW)
+        self._cells = [(col, row) for col in range(cols)
+                       for row in range(rows)]
+
+        # Cases où la pomme peut apparaître (hors zone du score), calculées une seule fois
+        self._free_template = [
+            self._index(cell) for cell in self._cells
+            if not self._is_score_zone(cell)
+        ]
+
+        # Corps du serpent dans un tampon circulaire de capacité fixe :
+        # avancer n'écrit que la case de la tête, et les cases quittées
+        # par la queue restent lisibles juste derrière elle (historique)
+        self._capacity = cols * rows + history + 1
+        self._trail_history = history  # Cases quittées utiles à la trainée
+        self._ring = array("i", [0]) * self._capacity
+        self._head_ptr = 0  # Emplacement de la tête dans l'anneau
+        self._size = 0  # Nombre de cases occupées (tête comprise)
+        self._history = 0  # Nombre d'emplacements valides dans l'anneau
+        # Grille d'occupation (1 octet par case) pour des collisions en O(1)
+        self._occupied = bytearray(cols * rows)
+        # Index des cases libres : tableau dense + position de chaque case
+        # dans ce tableau (-1 si absente), pour un tirage en O(1)
+        self._free: List[int] = []
+        self._free_pos: List[int] = []
+        self._apple: Cell = (0, 0)
+        self._direction = DIRECTION_STOP
+        self._next_direction = DIRECTION_STOP
+        self._score = 0
+        self._ticks = 0
+        self._alive = True
+
+        # Générateur aléatoire propre à la partie (SplitMix64 : rejouable
+        # à partir de la graine, et son état tient sur 8 octets)
+        self._rng_state = 0
+        self._seed = 0
+
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        Remet la partie à son état initial.
+
+        Args:
+            seed: Graine de la nouvelle partie (None pour une graine aléatoire).
+        """
+        if seed is None:
+            seed = random.getrandbits(SEED_BITS)
+        self._seed = seed
+        self._rng_state = seed & _MASK_64
+
+        self._head_ptr = 0
+        self._size = 0
+        self._history = 0
+        self._occupied = bytearray(self._cols * self._rows)
+        self._set_free(self._free_template)
+        self._push_head(self._index(self._start))
+        self._direction = DIRECTION_STOP
+        self._next_direction = DIRECTION_STOP
+        self._score = 0
+        self._ticks = 0
+        self._alive = True
+        self._spawn_apple()
+
+    def _random(self) -> int:
+        """
+        Tire un entier aléatoire de 64 bits (SplitMix64).
+
+        Returns:
+            Entier pseudo-aléatoire.
+        """
+        self._rng_state = (self._rng_state + 0x9E3779B97F4A7C15) & _MASK_64
+        z = self._rng_state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        return z ^ (z >> 31)
+
+    def _index(self, cell: Cell) -> int:
+        """
+        Retourne l'indice d'une case dans la grille d'occupation.
+
+        Args:
+            cell: Case (colonne, ligne).
+
+        Returns:
+            Indice entier de la case.
+        """
+        return cell[1] * self._cols + cell[0]
+
+    def _push_head(self, index: int):
+        """
+        Ajoute une nouvelle tête dans l'anneau et occupe sa case.
+
+        Args:
+            index: Indice de la case de la nouvelle tête.
+        """
+        self._head_ptr = (self._head_ptr - 1) % self._capacity
+        self._ring[self._head_ptr] = index
+        self._size += 1
+        if self._history < self._capacity:
+            self._history += 1
+        self._occupy(index)
+
+    def _pop_tail(self):
+        """Retire la queue du serpent et libère sa case (elle reste dans l'historique)."""
+        self._size -= 1
+        self._release(self._ring[(self._head_ptr + self._size) % self._capacity])
+
+    def _set_free(self, free: List[int]):
+        """
+        Remplace l'index des cases libres.
+
+        Args:
+            free: Indices des cases libres, dans l'ordre du tableau dense.
+        """
+        self._free = list(free)
+        self._free_pos = [-1] * (self._cols * self._rows)
+        for pos, index in enumerate(self._free):
+            self._free_pos[index] = pos
+
+    def _occupy(self, index: int):
+        """
+        Marque une case comme occupée et la retire de l'index des cases libres.
+
+        Args:
+            index: Indice de la case.
+        """
+        self._occupied[index] = 1
+        pos = self._free_pos[index]
+        if pos >= 0:
+            # Retrait par échange avec le dernier élément
+            last = self._free.pop()
+            if last != index:
+                self._free[pos] = last
+                self._free_pos[last] = pos
+            self._free_pos[index] = -1
+
+    def _release(self, index: int):
+        """
+        Libère une case et la remet dans l'index des cases libres.
+
+        Args:
+            index: Indice de la case.
+        """
+        self._occupied[index] = 0
+        if self._free_pos[index] < 0 and not self._is_score_zone(self._cell(index)):
+            self._free_pos[index] = len(self._free)
+            self._free.append(index)
+
+    def _cell(self, index: int) -> Cell:
+        """
+        Retourne la case correspondant à un indice.
+
+        Args:
+            index: Indice de la case.
+
+        Returns:
+            Case (colonne, ligne).
+        """
+        return (index % self._cols, index // self._cols)
+
+    def is_occupied(self, cell: Cell) -> bool:
+        """
+        Indique si une case est occupée par le serpent.
+
+        Args:
+            cell: Case (colonne, ligne), supposée dans la grille.
+
+        Returns:
+            True si un segment du serpent occupe la case.
+        """
+        return self._occupied[self._index(cell)] != 0
+
+    def cell_at(self, offset: int) -> Optional[Cell]:
+        """
+        Retourne la case située à une distance donnée de la tête dans l'anneau.
+        0 est la tête, length est la queue, et les valeurs suivantes sont
+        les dernières cases quittées par la queue.
+
+        Args:
+            offset: Distance depuis la tête.
+
+        Returns:
+            La case, ou None si l'historique ne remonte pas aussi loin.
+        """
+        if offset >= self._history:
+            return None
+        return self._cell(self._ring[(self._head_ptr + offset) % self._capacity])
+
+    def _is_score_zone(self, cell: Cell) -> bool:
+        """
+        Indique si une case se trouve sous l'affichage du score (en haut à gauche).
+
+        Args:
+            cell: Case (colonne, ligne).
+
+        Returns:
+            True si la case est masquée par le score.
+        """
+        col, row = cell
+        return col < SCORE_ZONE_COLS and row >= self._rows - SCORE_ZONE_ROWS
+
+    def _spawn_apple(self):
+        """
+        Place la pomme sur une case libre aléatoire (hors serpent et zone du score).
+        Le tirage dépend de l'ordre de l'index des cases libres : cet ordre
+        est enregistré dans les instantanés pour que la suite soit rejouable.
+        """
+        if self._free:
+            self._apple = self._cell(self._free[self._random() % len(self._free)])
+        else:
+            # Fallback si toutes les cases sont occupées
+            self._apple = self._cells[self._random() % len(self._cells)]
+
+    def set_direction(self, direction: str) -> bool:
+        """
+        Change la direction du serpent.
+        Empêche le demi-tour (aller dans la direction opposée).
+
+        Args:
+            direction: Nouvelle direction (Up, Down, Left, Right).
+
+        Returns:
+            True si la direction a été acceptée, False sinon.
+        """
+        if direction not in DIRECTION_DELTAS:
+            return False
+
+        # Vérifier par rapport à la direction actuelle OU la prochaine direction
+        current = self._direction if self._direction != DIRECTION_STOP else self._next_direction
+        if current == OPPOSITE_DIRECTIONS.get(direction):
+            return False
+
+        self._next_direction = direction
+        return True
+
+    def step(self, action: Optional[str] = None) -> StepResult:
+        """
+        Avance la partie d'un pas.
+
+        Args:
+            action: Direction à appliquer avant le pas (None pour garder l'actuelle).
+
+        Returns:
+            StepResult décrivant ce qui s'est passé pendant ce pas.
+        """
+        if not self._alive:
+            return StepResult(False, False, True, None)
+
+        if action is not None:
+            self.set_direction(action)
+
+        # Appliquer la direction en attente
+        self._direction = self._next_direction
+        if self._direction == DIRECTION_STOP:
+            return StepResult(False, False, False, None)
+
+        self._ticks += 1
+
+        # Calculer la nouvelle case de la tête
+        dx, dy = DIRECTION_DELTAS[self._direction]
+        col, row = self.head
+        new_head = (col + dx, row + dy)
+
+        # Collision avec les murs
+        if not (0 <= new_head[0] < self._cols and 0 <= new_head[1] < self._rows):
+            self._alive = False
+            return StepResult(True, False, True, DEATH_WALL)
+
+        ate = new_head == self._apple
+
+        # La queue libère sa case, sauf si le serpent grandit
+        if not ate:
+            self._pop_tail()
+
+        # Collision avec soi-même
+        new_index = self._index(new_head)
+        if self._occupied[new_index]:
+            self._alive = False
+            return StepResult(True, False, True, DEATH_SELF)
+
+        self._push_head(new_index)
+
+        if ate:
+            self._score += 1
+            self._spawn_apple()
+
+        return StepResult(True, ate, False, None)
+
+    def snapshot(self) -> bytes:
+        """
+        Retourne un instantané compact de l'état de la partie.
+        Le corps (et l'historique de la trainée) est encodé comme la case
+        de la tête suivie d'un déplacement de 2 bits par segment, puis
+        l'index des cases libres dans son ordre (dont dépendent les
+        prochaines pommes).
+
+        Returns:
+            L'instantané, à passer à restore().
+        """
+        data = bytearray()
+        flags = (int(self._alive)
+                 | _DIRECTION_CODES.index(self._direction) << 1
+                 | _DIRECTION_CODES.index(self._next_direction) << 4)
+        # Le corps et la trainée suffisent : l'historique plus ancien n'est plus lu
+        chain_length = min(self._history, self._size + self._trail_history)
+        chain = [self.cell_at(offset) for offset in range(chain_length)]
+        for value in (self._ticks, self._score, self._seed, self._rng_state,
+                      self._index(self._apple), flags, self._size,
+                      len(chain), self._index(chain[0])):
+            write_varint(data, value)
+
+        # Déplacements entre cases consécutives, 4 par octet
+        moves = [
+            _DELTA_CODES[(nxt[0] - cur[0], nxt[1] - cur[1])]
+            for cur, nxt in zip(chain, chain[1:])
+        ]
+        for i in range(0, len(moves), 4):
+            byte = 0
+            for shift, code in enumerate(moves[i:i + 4]):
+                byte |= code << (2 * shift)
+            data.append(byte)
+
+        write_varint(data, len(self._free))
+        for index in self._free:
+            write_varint(data, index)
+
+        return bytes(data)
+
+    def restore(self, data: bytes):
+        """
+        Restaure l'état de la partie depuis un instantané.
+
+        Args:
+            data: Instantané produit par snapshot().
+        """
+        values = []
+        pos = 0
+        for _ in range(9):
+            value, pos = read_varint(data, pos)
+            values.append(value)
+        (self._ticks, self._score, self._seed, self._rng_state, apple,
+         flags, size, chain_length, head) = values
+
+        self._alive = bool(flags & 1)
+        self._direction = _DIRECTION_CODES[(flags >> 1) & 0x7]
+        self._next_direction = _DIRECTION_CODES[(flags >> 4) & 0x7]
+        self._apple = self._cell(apple)
+
+        # Reconstruire l'anneau à partir de la tête et des déplacements
+        col, row = self._cell(head)
+        self._head_ptr = 0
+        self._ring[0] = head
+        for i in range(1, chain_length):
+            code = (data[pos + (i - 1) // 4] >> (2 * ((i - 1) % 4))) & 0x3
+            dx, dy = DIRECTION_DELTAS[ACTION_DIRECTIONS[code]]
+            col, row = col + dx, row + dy
+            self._ring[i] = self._index((col, row))
+        self._size = size
+        self._history = chain_length
+        pos += (chain_length + 2) // 4
+
+        self._occupied = bytearray(self._cols * self._rows)
+        for i in range(size):
+            self._occupied[self._ring[i]] = 1
+
+        free_count, pos = read_varint(data, pos)
+        free = []
+        for _ in range(free_count):
+            index, pos = read_varint(data, pos)
+            free.append(index)
+        self._set_free(free)
+
+    @property
+    def head(self) -> Cell:
+        """Case de la tête."""
+        return self._cell(self._ring[self._head_ptr])
+
+    @property
+    def body(self) -> List[Cell]:
+        """Cases du serpent, de la tête vers la queue."""
+        return [
+            self._cell(self._ring[(self._head_ptr + offset) % self._capacity])
+            for offset in range(self._size)
+        ]
+
+    @property
+    def apple(self) -> Cell:
+        """Case de la pomme."""
+        return self._apple
+
+    @property
+    def length(self) -> int:
+        """Nombre de segments derrière la tête."""
+        return self._size - 1
+
+    @property
+    def score(self) -> int:
+        """Nombre de pommes mangées."""
+        return self._score
+
+    @property
+    def direction(self) -> str:
+        """Direction actuelle."""
+        return self._direction
+
+    @property
+    def alive(self) -> bool:
+        """True tant que le serpent n'est pas mort."""
+        return self._alive
+
+    @property
+    def seed(self) -> int:
+        """Graine de la partie en cours."""
+        return self._seed
+
+    @property
+    def cols(self) -> int:
+        """Nombre de colonnes de la grille."""
+        return self._cols
+
+    @property
+    def rows(self) -> int:
+        """Nombre de lignes de la grille."""
+        return self._rows
+
+    @property
+    def ticks(self) -> int:
+        """Nombre de pas simulés depuis le début de la partie."""
+        return self._ticks
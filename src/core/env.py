@@ -0,0 +1,419 @@
+"""
+Environnements Snake de type Gym - API reset()/step() pour l'entraînement de bots
+
+SnakeEnv enveloppe un GameEngine ; SubprocVectorEnv répartit de nombreux
+environnements sur plusieurs processus et échange les observations
+via multiprocessing.shared_memory plutôt que par sérialisation.
+"""
+
+import multiprocessing
+import os
+import random
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config import GRID_COLS, GRID_ROWS, DIRECTION_RIGHT
+from src.core.engine import (
+    ACTION_DIRECTIONS,
+    DEATH_WALL,
+    DEATH_SELF,
+    SEED_BITS,
+    Cell,
+    GameEngine,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+# Valeurs des cases dans une observation
+OBS_EMPTY = 0
+OBS_BODY = 1
+OBS_HEAD = 2
+OBS_APPLE = 3
+
+# Récompenses
+REWARD_APPLE = 1.0
+REWARD_DEATH = -1.0
+REWARD_STEP = 0.0
+
+# Codes des causes de mort dans la mémoire partagée (index = code)
+DEATH_CAUSES = (None, DEATH_WALL, DEATH_SELF)
+
+
+class SnakeEnv:
+    """
+    Environnement Snake avec l'API reset()/step() de Gym.
+    L'observation est une grille d'octets (une case par octet, ligne par
+    ligne, OBS_EMPTY/OBS_BODY/OBS_HEAD/OBS_APPLE), mise à jour de façon
+    incrémentale à chaque pas.
+
+    Méthodes publiques:
+        - reset() -> memoryview: Commence une nouvelle partie et retourne l'observation
+        - step(action: int) -> Tuple[memoryview, float, bool, Dict]: Avance la partie d'un pas
+        - observation_size (propriété): Taille d'une observation en octets
+        - close(): Libère la zone mémoire de l'observation
+        - engine (propriété): Le moteur de jeu sous-jacent
+    """
+
+    def __init__(self, cols: int = GRID_COLS, rows: int = GRID_ROWS,
+                 max_ticks: Optional[int] = None,
+                 obs_buffer: Optional[memoryview] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialise l'environnement.
+
+        Args:
+            cols: Nombre de colonnes de la grille.
+            rows: Nombre de lignes de la grille.
+            max_ticks: Nombre maximal de pas par partie (None pour illimité).
+            obs_buffer: Zone mémoire où écrire l'observation (par exemple une
+                tranche de mémoire partagée) ; un tampon privé sinon.
+            seed: Graine qui détermine les graines des parties successives
+                (None pour des graines aléatoires).
+        """
+        self._engine = GameEngine(cols, rows)
+        self._rng = random.Random(seed)
+        self._cols = cols
+        self._max_ticks = max_ticks
+        self._obs = obs_buffer if obs_buffer is not None else memoryview(
+            bytearray(cols * rows))
+
+    def _index(self, cell: Cell) -> int:
+        """Retourne l'indice d'une case dans l'observation."""
+        return cell[1] * self._cols + cell[0]
+
+    def _write_full_observation(self):
+        """Réécrit entièrement l'observation depuis l'état du moteur."""
+        obs = self._obs
+        obs[:] = bytes(len(obs))
+        for cell in self._engine.body:
+            obs[self._index(cell)] = OBS_BODY
+        obs[self._index(self._engine.head)] = OBS_HEAD
+        obs[self._index(self._engine.apple)] = OBS_APPLE
+
+    def reset(self) -> memoryview:
+        """
+        Commence une nouvelle partie.
+
+        Returns:
+            L'observation initiale.
+        """
+        self._engine.reset(self._rng.getrandbits(SEED_BITS))
+        # Comme après le compte à rebours : départ vers la droite
+        self._engine.set_direction(DIRECTION_RIGHT)
+        self._write_full_observation()
+        return self._obs
+
+    def step(self, action: int) -> Tuple[memoryview, float, bool, Dict[str, Any]]:
+        """
+        Avance la partie d'un pas.
+
+        Args:
+            action: Code d'action (ACTION_UP, ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT).
+
+        Returns:
+            Tuple (observation, récompense, terminé, infos).
+        """
+        engine = self._engine
+        result = engine.step(ACTION_DIRECTIONS[action])
+
+        info = {
+            "score": engine.score,
+            "ticks": engine.ticks,
+            "death_cause": result.death_cause,
+        }
+
+        if result.dead:
+            return self._obs, REWARD_DEATH, True, info
+
+        # Mise à jour incrémentale : seules la queue, l'ancienne tête,
+        # la nouvelle tête et la pomme peuvent changer
+        obs = self._obs
+        if not result.ate:
+            vacated = engine.cell_at(engine.length + 1)
+            if vacated is not None:
+                obs[self._index(vacated)] = OBS_EMPTY
+        if engine.length > 0:
+            obs[self._index(engine.cell_at(1))] = OBS_BODY
+        obs[self._index(engine.head)] = OBS_HEAD
+        obs[self._index(engine.apple)] = OBS_APPLE
+
+        done = self._max_ticks is not None and engine.ticks >= self._max_ticks
+        reward = REWARD_APPLE if result.ate else REWARD_STEP
+        return obs, reward, done, info
+
+    def close(self):
+        """Libère la zone mémoire de l'observation (nécessaire avant de fermer une mémoire partagée)."""
+        self._obs.release()
+
+    @property
+    def observation_size(self) -> int:
+        """Taille d'une observation en octets."""
+        return len(self._obs)
+
+    @property
+    def engine(self) -> GameEngine:
+        """Le moteur de jeu sous-jacent."""
+        return self._engine
+
+
+class _SharedLayout:
+    """
+    Découpage du bloc de mémoire partagée de SubprocVectorEnv.
+    Les tableaux de 4 octets sont placés en premier pour rester alignés.
+    """
+
+    def __init__(self, buf: memoryview, num_envs: int, obs_size: int):
+        """
+        Crée les vues typées sur le bloc.
+
+        Args:
+            buf: Le bloc de mémoire partagée.
+            num_envs: Nombre d'environnements.
+            obs_size: Taille d'une observation en octets.
+        """
+        n = num_envs
+        self.rewards = buf[0:4 * n].cast("f")
+        self.scores = buf[4 * n:8 * n].cast("i")
+        self.ticks = buf[8 * n:12 * n].cast("i")
+        self.actions = buf[12 * n:13 * n]
+        self.dones = buf[13 * n:14 * n]
+        self.causes = buf[14 * n:15 * n]
+        self.observations = buf[15 * n:15 * n + n * obs_size]
+
+    @staticmethod
+    def size(num_envs: int, obs_size: int) -> int:
+        """Taille totale du bloc en octets."""
+        return num_envs * (15 + obs_size)
+
+    def release(self):
+        """Libère toutes les vues (nécessaire avant de fermer le bloc)."""
+        for view in (self.rewards, self.scores, self.ticks, self.actions,
+                     self.dones, self.causes, self.observations):
+            view.release()
+
+
+def _vector_worker(conn, shm_name: str, num_envs: int, first_env: int,
+                   count: int, seed: Optional[int], env_kwargs: Dict[str, Any]):
+    """
+    Boucle d'un processus de SubprocVectorEnv.
+    Actions, observations, récompenses et infos passent par la mémoire
+    partagée ; le pipe ne transporte que les commandes.
+
+    Args:
+        conn: Extrémité du pipe côté processus.
+        shm_name: Nom du bloc de mémoire partagée.
+        num_envs: Nombre total d'environnements.
+        first_env: Indice global du premier environnement géré.
+        count: Nombre d'environnements gérés par ce processus.
+        seed: Graine de base (l'environnement i reçoit seed + i), None pour
+            des graines aléatoires.
+        env_kwargs: Arguments passés à chaque SnakeEnv.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    obs_size = env_kwargs.get("cols", GRID_COLS) * \
+        env_kwargs.get("rows", GRID_ROWS)
+    shared = _SharedLayout(shm.buf, num_envs, obs_size)
+    indices = range(first_env, first_env + count)
+    envs = [
+        SnakeEnv(obs_buffer=shared.observations[i * obs_size:(i + 1) * obs_size],
+                 seed=None if seed is None else seed + i, **env_kwargs)
+        for i in indices
+    ]
+
+    try:
+        while True:
+            command = conn.recv()
+            if command == "reset":
+                for env in envs:
+                    env.reset()
+            elif command == "step":
+                for i, env in zip(indices, envs):
+                    _, reward, done, info = env.step(shared.actions[i])
+                    shared.rewards[i] = reward
+                    shared.dones[i] = done
+                    shared.scores[i] = info["score"]
+                    shared.ticks[i] = info["ticks"]
+                    shared.causes[i] = DEATH_CAUSES.index(info["death_cause"])
+                    if done:
+                        # Réinitialisation automatique
+                        env.reset()
+            else:
+                break
+            conn.send(None)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        # Libérer les vues avant de fermer la mémoire partagée
+        for env in envs:
+            env.close()
+        shared.release()
+        shm.close()
+        conn.close()
+
+
+class SubprocVectorEnv:
+    """
+    Répartit de nombreux SnakeEnv sur plusieurs processus.
+    Les observations de tous les environnements sont rangées côte à côte
+    dans un bloc multiprocessing.shared_memory, avec les actions, les
+    récompenses et les infos ; rien n'est sérialisé à chaque pas.
+    Les environnements terminés sont réinitialisés automatiquement.
+
+    Méthodes publiques:
+        - reset() -> memoryview: Réinitialise tous les environnements
+        - step(actions: Sequence[int]) -> Tuple[memoryview, List[float], List[bool], List[Dict]]:
+          Avance tous les environnements d'un pas
+        - observation(index: int) -> memoryview: Observation d'un environnement
+        - close(): Arrête les processus et libère la mémoire partagée
+        - num_envs (propriété): Nombre d'environnements
+        - observation_size (propriété): Taille d'une observation en octets
+    """
+
+    def __init__(self, num_envs: int, num_workers: Optional[int] = None,
+                 seed: Optional[int] = None, **env_kwargs):
+        """
+        Lance les processus.
+
+        Args:
+            num_envs: Nombre total d'environnements.
+            num_workers: Nombre de processus (par défaut, un par cœur).
+            seed: Graine de base : l'environnement i reçoit seed + i, ce qui
+                rend les parties reproductibles (None pour des graines aléatoires).
+            **env_kwargs: Arguments passés à chaque SnakeEnv (cols, rows, max_ticks).
+        """
+        self._num_envs = num_envs
+        self._obs_size = env_kwargs.get("cols", GRID_COLS) * \
+            env_kwargs.get("rows", GRID_ROWS)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_SharedLayout.size(num_envs, self._obs_size))
+        self._shared = _SharedLayout(self._shm.buf, num_envs, self._obs_size)
+        self._closed = False
+
+        num_workers = min(num_envs, num_workers or os.cpu_count() or 1)
+        self._connections = []
+        self._processes = []
+
+        context = multiprocessing.get_context()
+        start = 0
+        for worker in range(num_workers):
+            # Répartir les environnements le plus équitablement possible
+            count = num_envs // num_workers + \
+                (1 if worker < num_envs % num_workers else 0)
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_vector_worker,
+                args=(child_conn, self._shm.name, num_envs,
+                      start, count, seed, env_kwargs),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+            start += count
+
+    def _run(self, command: str):
+        """
+        Envoie une commande à tous les processus et attend leur fin.
+
+        Args:
+            command: "reset" ou "step".
+        """
+        for conn in self._connections:
+            conn.send(command)
+        for conn in self._connections:
+            conn.recv()
+
+    def reset(self) -> memoryview:
+        """
+        Réinitialise tous les environnements.
+
+        Returns:
+            Les observations de tous les environnements, côte à côte.
+        """
+        self._run("reset")
+        return self._shared.observations
+
+    def step(self, actions: Sequence[int]) -> Tuple[memoryview, List[float], List[bool], List[Dict[str, Any]]]:
+        """
+        Avance tous les environnements d'un pas.
+
+        Args:
+            actions: Code d'action de chaque environnement.
+
+        Returns:
+            Tuple (observations, récompenses, terminés, infos) ; les observations
+            sont une vue sur la mémoire partagée.
+        """
+        shared = self._shared
+        if np is not None:
+            # Copie directe dans la mémoire partagée (tableau NumPy ou liste)
+            np.frombuffer(shared.actions, dtype=np.uint8)[:] = np.asarray(actions, dtype=np.uint8)
+        else:
+            shared.actions[:] = bytes(actions)
+        self._run("step")
+
+        infos = [
+            {"score": score, "ticks": ticks, "death_cause": DEATH_CAUSES[cause]}
+            for score, ticks, cause in zip(shared.scores, shared.ticks, shared.causes)
+        ]
+        return shared.observations, shared.rewards.tolist(), \
+            [bool(done) for done in shared.dones], infos
+
+    def observation(self, index: int) -> memoryview:
+        """
+        Retourne l'observation d'un environnement.
+
+        Args:
+            index: Indice de l'environnement.
+
+        Returns:
+            Vue sur la mémoire partagée.
+        """
+        return self._shared.observations[index * self._obs_size:(index + 1) * self._obs_size]
+
+    def close(self):
+        """Arrête les processus et libère la mémoire partagée."""
+        if self._closed:
+            return
+        self._closed = True
+
+        for conn in self._connections:
+            try:
+                conn.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+
+        self._shm.unlink()
+        try:
+            self._shared.release()
+            self._shm.close()
+        except BufferError:
+            # Des vues sur les observations sont encore utilisées
+            pass
+
+    @property
+    def num_envs(self) -> int:
+        """Nombre d'environnements."""
+        return self._num_envs
+
+    @property
+    def observation_size(self) -> int:
+        """Taille d'une observation en octets."""
+        return self._obs_size
+
+    def __del__(self):
+        """Libère les ressources si close() n'a pas été appelé."""
+        try:
+            self.close()
+        except (AttributeError, OSError):
+            pass
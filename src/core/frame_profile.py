@@ -0,0 +1,231 @@
+"""
+Profil des images - Durée de chaque phase de la boucle de jeu
+
+Utilisé par `main.py --profile-frames` pour savoir si une saccade vient
+des règles du jeu (moteur, collisions) ou du dessin Tk (screen.update).
+Chaque phase a un histogramme de taille fixe (tranches en puissances de
+2, à partir de 1 µs) : la mémoire ne grandit pas avec la durée de la
+partie. Un profil désactivé ne fait qu'entrer et sortir d'un gestionnaire
+de contexte vide.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from src.config import FRAME_PROFILE_FILE, FRAME_PROFILE_BUCKETS
+
+
+class PhaseHistogram:
+    """
+    Histogramme des durées d'une phase.
+    La tranche i compte les durées de 2^i à 2^(i+1) µs (la première
+    compte aussi les plus courtes, la dernière les plus longues).
+
+    Méthodes publiques:
+        - add(nanoseconds: int): Ajoute une durée
+        - percentile(rank: float) -> float: Borne supérieure du centile (en µs)
+        - to_dict() -> Dict[str, Any]: Résumé et tranches de l'histogramme
+    """
+
+    def __init__(self, buckets: int = FRAME_PROFILE_BUCKETS):
+        """
+        Initialise un histogramme vide.
+
+        Args:
+            buckets: Nombre de tranches.
+        """
+        self._buckets: List[int] = [0] * buckets
+        self._count = 0
+        self._total_ns = 0
+        self._max_ns = 0
+
+    def add(self, nanoseconds: int):
+        """
+        Ajoute une durée.
+
+        Args:
+            nanoseconds: Durée mesurée avec time.perf_counter_ns().
+        """
+        index = (nanoseconds // 1000).bit_length() - 1
+        self._buckets[min(len(self._buckets) - 1, max(0, index))] += 1
+        self._count += 1
+        self._total_ns += nanoseconds
+        if nanoseconds > self._max_ns:
+            self._max_ns = nanoseconds
+
+    def percentile(self, rank: float) -> float:
+        """
+        Retourne la borne supérieure de la tranche qui contient le centile.
+
+        Args:
+            rank: Centile demandé (de 0 à 100).
+
+        Returns:
+            Durée en microsecondes (au plus la durée maximale mesurée).
+        """
+        if not self._count:
+            return 0.0
+        target = rank / 100 * self._count
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if count and seen >= target:
+                return round(min(float(2 ** (index + 1)), self._max_ns / 1000), 1)
+        return round(self._max_ns / 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Résume l'histogramme (durées en microsecondes).
+
+        Returns:
+            Nombre de mesures, moyenne, maximum, centiles 50/95/99 et
+            tranches non vides ([borne supérieure, nombre]).
+        """
+        return {
+            "count": self._count,
+            "mean_us": round(self._total_ns / self._count / 1000, 1) if self._count else 0.0,
+            "max_us": round(self._max_ns / 1000, 1),
+            "p50_us": self.percentile(50),
+            "p95_us": self.percentile(95),
+            "p99_us": self.percentile(99),
+            "buckets": [[2 ** (index + 1), count]
+                        for index, count in enumerate(self._buckets) if count],
+        }
+
+    @property
+    def count(self) -> int:
+        """Nombre de durées mesurées."""
+        return self._count
+
+
+class _PhaseTimer:
+    """Gestionnaire de contexte qui ajoute la durée du bloc à un histogramme."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: PhaseHistogram):
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> bool:
+        self._histogram.add(time.perf_counter_ns() - self._start)
+        return False
+
+
+class _NullTimer:
+    """Gestionnaire de contexte vide (profil désactivé)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class FrameProfiler:
+    """
+    Mesure les phases de la boucle de jeu avec time.perf_counter_ns().
+
+    Méthodes publiques:
+        - phase(name: str): Gestionnaire de contexte qui mesure une phase
+        - snapshot() -> Dict[str, Dict[str, Any]]: Résumé de chaque phase
+        - summary_text() -> str: Résumé court (p95 de chaque phase) pour l'affichage en direct
+        - dump() -> Optional[str]: Écrit le résumé en JSON
+        - enabled (propriété): True si le profil mesure les phases
+        - live (propriété): True si le résumé doit être affiché pendant le jeu
+    """
+
+    def __init__(self, enabled: bool = True, output_path: str = FRAME_PROFILE_FILE,
+                 live: bool = False):
+        """
+        Initialise le profil.
+
+        Args:
+            enabled: False pour un profil qui ne mesure rien.
+            output_path: Fichier JSON écrit par dump().
+            live: True pour afficher le résumé pendant le jeu.
+        """
+        self._enabled = enabled
+        self._output_path = output_path
+        self._live = enabled and live
+        self._histograms: Dict[str, PhaseHistogram] = {}
+        self._timers: Dict[str, _PhaseTimer] = {}
+
+    def phase(self, name: str):
+        """
+        Retourne le gestionnaire de contexte qui mesure une phase.
+
+        Args:
+            name: Nom de la phase.
+
+        Returns:
+            Un gestionnaire de contexte (vide si le profil est désactivé).
+        """
+        if not self._enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            histogram = self._histograms[name] = PhaseHistogram()
+            timer = self._timers[name] = _PhaseTimer(histogram)
+        return timer
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Résume chaque phase mesurée.
+
+        Returns:
+            Résumé de l'histogramme de chaque phase (voir PhaseHistogram.to_dict).
+        """
+        return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+
+    def summary_text(self) -> str:
+        """
+        Résume les phases, une par ligne : p95 de chaque phase en millisecondes.
+
+        Returns:
+            Le résumé (vide si rien n'a été mesuré).
+        """
+        return "\n".join(f"{name} p95 {histogram.percentile(95) / 1000:6.2f} ms"
+                         for name, histogram in self._histograms.items() if histogram.count)
+
+    def dump(self) -> Optional[str]:
+        """
+        Écrit le résumé de chaque phase dans le fichier JSON.
+
+        Returns:
+            Le chemin du fichier, ou None si le profil est désactivé ou
+            si le fichier n'a pas pu être écrit.
+        """
+        if not self._enabled:
+            return None
+
+        try:
+            directory = os.path.dirname(self._output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._output_path, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+        except (IOError, OSError) as e:
+            print(f"Avertissement: Impossible d'écrire le profil des images - {e}")
+            return None
+        return self._output_path
+
+    @property
+    def enabled(self) -> bool:
+        """True si le profil mesure les phases."""
+        return self._enabled
+
+    @property
+    def live(self) -> bool:
+        """True si le résumé doit être affiché pendant le jeu."""
+        return self._live
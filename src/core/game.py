@@ -2,7 +2,12 @@
 Classe Game - Classe principale orchestrant le jeu Snake
 """
 
+import math
+import os
+import random
+import time
 import turtle
+from typing import Any, Dict, List, Optional
 
 from src.config import (
     WINDOW_WIDTH,
@@ -28,13 +33,32 @@ from src.config import (
     SPEED_INITIAL,
     SPEED_MIN,
     SPEED_DECREASE_PER_POINT,
+    GAME_FRAME_MS,
+    GAME_MAX_CATCHUP,
+    REPLAY_SEEK_TICKS,
+    RENDERER,
+    FRAME_PROFILE_LIVE_MS,
 )  # imports des constantes de configuration
 
+from src.core.engine import GameEngine, StepResult, SEED_BITS, cell_to_pixel  # règles du jeu
+from src.core.replay import (  # enregistrement et lecture des parties
+    ReplayPlayer,
+    ReplayRecorder,
+    SPEED_REALTIME,
+    SPEED_UNCAPPED,
+)
 from src.entities.snake import Snake  # classe Snake
 from src.entities.apple import Apple  # classe Apple
 from src.managers.score_manager import ScoreManager  # gestionnaire de score
 from src.managers.sound_manager import SoundManager  # gestionnaire de son
 from src.managers.animations import AnimationManager  # gestionnaire d'animations
+from src.managers.turtle_pool import TurtlePool  # réserve de turtles
+from src.render import create_renderer  # moteurs de rendu
+from src.render.text_sprites import TextSpriteCache  # textes avec contour
+from src.render.sprite_atlas import SpriteAtlas  # images du jeu
+from src.core.startup_profile import StartupProfile  # mesure du démarrage
+from src.core.frame_profile import FrameProfiler  # mesure des images
+from src.core.input_queue import InputQueue, LatencyStats  # touches en attente
 
 
 class Game:
@@ -44,36 +68,124 @@ class Game:
 
     Méthodes publiques:
         run: Lance le jeu.
+        frame_profile: Résumé des durées de chaque phase de la boucle de jeu.
     """
 
-    def __init__(self):
-        """Initialise le jeu et tous ses composants."""
+    def __init__(self, seed: Optional[int] = None, replay_dir: Optional[str] = None,
+                 replay: Optional[ReplayPlayer] = None, replay_speed: str = SPEED_REALTIME,
+                 renderer: str = RENDERER, startup_profile: Optional[StartupProfile] = None,
+                 frame_profiler: Optional[FrameProfiler] = None):
+        """
+        Initialise le jeu et tous ses composants.
+
+        Args:
+            seed: Graine de la session (None pour une graine aléatoire) ;
+                chaque partie reçoit une graine tirée de celle-ci.
+            replay_dir: Dossier où enregistrer le replay de chaque partie
+                (None pour ne pas les sauvegarder).
+            replay: Lecteur de replay à afficher à la place d'une partie
+                jouée (None pour jouer normalement).
+            replay_speed: Vitesse de lecture du replay (SPEED_REALTIME ou SPEED_UNCAPPED).
+            renderer: Moteur de rendu ("turtle" ou "canvas").
+            startup_profile: Profil du démarrage à compléter et afficher à la
+                première image (None pour ne rien mesurer).
+            frame_profiler: Profil des phases de la boucle de jeu, écrit en
+                JSON à la fermeture (None pour ne rien mesurer).
+        """
+        self._startup = startup_profile or StartupProfile(enabled=False)
+        self._profiler = frame_profiler or FrameProfiler(enabled=False)
+        self._profile_display: Optional[turtle.Turtle] = None  # Affichage en direct
+        self._profile_shown_at = 0.0  # Dernière mise à jour de l'affichage (perf_counter)
         self._running = False
         self._paused = False
         self._game_over = False
         self._countdown_active = False  # Indique si le compte à rebours est actif
         self._current_speed = SPEED_INITIAL
         self._game_loop_id = 0  # ID pour identifier la boucle de jeu active
+        self._next_tick: Optional[float] = None  # Échéance du prochain pas (perf_counter)
+        # Directions appliquées une par pas, et délai touche → image
+        self._inputs = InputQueue()
+        self._input_latency = LatencyStats()
+        self._unshown_inputs: List[float] = []  # Appuis appliqués, pas encore affichés
         self._window_closed = False  # Indique si la fenêtre a été fermée
 
-        self._screen = self._setup_screen()  # Initialiser l'écran
+        with self._startup.phase("fenêtre"):
+            self._screen = self._setup_screen()  # Initialiser l'écran
+            # Sprites créés par le moteur de rendu et recyclés d'une partie
+            # à l'autre (segments, popups, textes)
+            self._renderer = create_renderer(renderer, self._screen)
+            self._turtle_pool = TurtlePool(self._renderer.create_sprite)
+
+        with self._startup.phase("images"):
+            # Textes avec contour, dessinés une fois puis réutilisés
+            self._text_sprites = TextSpriteCache(self._screen, self._renderer)
+            # Images du jeu (orientations de la tête, pulsation de la pomme)
+            self._sprite_atlas = SpriteAtlas(self._screen, self._renderer)
+
+        # Générateur de la session : fournit la graine de chaque partie
+        self._rng = random.Random(seed)
+        self._replay_dir = replay_dir
+        self._replay = replay
+        self._replay_speed = replay_speed
+
+        # Initialiser le moteur (règles du jeu, sans affichage) ;
+        # en lecture de replay, c'est le moteur du lecteur qui est affiché
+        if replay is not None:
+            self._engine = replay.engine
+            self._recorder = None
+        else:
+            self._engine = GameEngine(seed=self._next_seed())
+            self._recorder = self._create_recorder()
 
         # Initialiser les composants
-        self._sound_manager = SoundManager()
-        self._score_manager = ScoreManager()
-        self._snake = Snake(self._screen)
-        self._apple = Apple(self._screen)
-        self._animation_manager = AnimationManager(self._screen)
+        with self._startup.phase("audio"):
+            self._sound_manager = SoundManager()
+
+        with self._startup.phase("composants"):
+            self._score_manager = ScoreManager(self._turtle_pool, self._text_sprites)
+            self._snake = Snake(self._screen, self._engine, self._turtle_pool, self._sprite_atlas)
+            self._animation_manager = AnimationManager(
+                self._screen, self._turtle_pool, self._text_sprites)
+            self._apple = Apple(self._screen, self._engine, self._turtle_pool,
+                                self._sprite_atlas, self._animation_manager)
 
-        # Affichage de la pause
-        self._pause_display = self._create_pause_display()
+            # Affichage de la pause
+            self._pause_display = self._create_pause_display()
 
-        # Affichage des contrôles
-        self._controls_display = self._create_controls_display()
+            # Affichage des contrôles
+            self._controls_display = self._create_controls_display()
 
         # Configurer les contrôles
         self._setup_controls()
 
+        # Un replay peut commencer ailleurs qu'au premier pas (--seek)
+        if replay is not None:
+            self._sync_views()
+
+    def _next_seed(self) -> int:
+        """Tire la graine de la prochaine partie."""
+        return self._rng.getrandbits(SEED_BITS)
+
+    def _create_recorder(self) -> ReplayRecorder:
+        """Commence l'enregistrement de la partie en cours du moteur."""
+        return ReplayRecorder(self._engine.seed, self._engine.cols, self._engine.rows)
+
+    def _finish_recording(self):
+        """Termine l'enregistrement de la partie et le sauvegarde si demandé."""
+        if self._recorder is None:
+            return
+
+        self._recorder.finish(self._engine.ticks)
+        if not self._replay_dir:
+            return
+
+        filename = f"replay_{time.strftime('%Y%m%d_%H%M%S')}_{self._engine.seed:016x}.snkr"
+        try:
+            os.makedirs(self._replay_dir, exist_ok=True)
+            self._recorder.save(os.path.join(self._replay_dir, filename))
+        except (IOError, OSError) as e:
+            print(f"Avertissement: Impossible de sauvegarder le replay - {e}")
+
     def _setup_screen(self) -> turtle._Screen:
         """
         Configure et retourne l'écran de jeu.
@@ -103,40 +215,27 @@ class Game:
         Returns:
             Objet Turtle pour afficher "Pause".
         """
-        pause_turtle = turtle.Turtle()
-        pause_turtle.speed(0)
-        pause_turtle.color("white")
-        pause_turtle.penup()
-        pause_turtle.hideturtle()
-        pause_turtle.goto(1000, 1000)  # Hors écran
-        return pause_turtle
+        return self._turtle_pool.acquire("text_sprite")
 
     def _write_with_outline(self, writer: turtle.Turtle, text: str, x: float, y: float,
-                            color: str, font: tuple, align: str = "center"):
+                            color: str, font: tuple, align: str = "center",
+                            persist: bool = False):
         """
         Écrit du texte avec un contour noir pour meilleure visibilité.
+        Le texte et son contour forment une seule image, gardée en cache.
 
         Args:
-            writer: Turtle utilisée pour écrire.
+            writer: Turtle (sprite) qui affiche le texte.
             text: Texte à afficher.
             x: Position X.
             y: Position Y.
             color: Couleur du texte.
             font: Tuple (nom, taille, style) pour la police.
             align: Alignement du texte.
+            persist: True pour un texte fixe, gardé aussi dans le cache disque.
         """
-        # Dessiner le contour noir (8 directions)
-        writer.color("black")
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    writer.goto(x + dx, y + dy)
-                    writer.write(text, align=align, font=font)
-
-        # Dessiner le texte en couleur par-dessus
-        writer.color(color)
-        writer.goto(x, y)
-        writer.write(text, align=align, font=font)
+        self._text_sprites.write(writer, text, x, y, color, font, align=align,
+                                 persist=persist)
 
     def _create_controls_display(self) -> turtle.Turtle:
         """
@@ -145,39 +244,31 @@ class Game:
         Returns:
             Objet Turtle pour afficher les contrôles.
         """
-        controls_turtle = turtle.Turtle()
-        controls_turtle.speed(0)
-        controls_turtle.color("white")
-        controls_turtle.penup()
-        controls_turtle.hideturtle()
-        controls_turtle.goto(0, -270)
-        return controls_turtle
+        return self._turtle_pool.acquire("text_sprite")
 
     def _show_controls(self):
         """Affiche les instructions des contrôles à l'écran."""
-        self._controls_display.clear()
+        if self._replay is not None:
+            text = "REPLAY | ←/→ : Reculer/Avancer | ESC : Pause | X : Quitter | ESPACE : Revoir"
+        else:
+            text = "ZQSD/Flèches : Déplacer | ESC : Pause | X : Quitter | ESPACE : Rejouer"
 
         # Contour noir plus subtil (1 pixel au lieu de 2)
-        text = "ZQSD/Flèches : Déplacer | ESC : Pause | X : Quitter | ESPACE : Rejouer"
-        font = ("Arial", 12, "normal")
-
-        self._controls_display.color("black")
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    self._controls_display.goto(0 + dx, -270 + dy)
-                    self._controls_display.write(
-                        text, align="center", font=font)
-
-        # Texte en couleur par-dessus
-        self._controls_display.color("#90CAF9")
-        self._controls_display.goto(0, -270)
-        self._controls_display.write(text, align="center", font=font)
+        self._text_sprites.write(
+            self._controls_display, text, 0, -270, "#90CAF9",
+            ("Arial", 12, "normal"), outline=1, persist=True)
 
     def _setup_controls(self):
         """Configure les contrôles clavier."""
         self._screen.listen()
 
+        if self._replay is not None:
+            # Lecture d'un replay : les flèches déplacent la lecture
+            self._screen.onkeypress(self._seek_backward, KEY_ARROW_LEFT)
+            self._screen.onkeypress(self._seek_forward, KEY_ARROW_RIGHT)
+            self._setup_common_controls()
+            return
+
         # Contrôles de direction (ZQSD)
         self._screen.onkeypress(self._go_up, KEY_UP)
         self._screen.onkeypress(self._go_down, KEY_DOWN)
@@ -190,6 +281,10 @@ class Game:
         self._screen.onkeypress(self._go_left, KEY_ARROW_LEFT)
         self._screen.onkeypress(self._go_right, KEY_ARROW_RIGHT)
 
+        self._setup_common_controls()
+
+    def _setup_common_controls(self):
+        """Configure les contrôles communs au jeu et à la lecture d'un replay."""
         # Pause et quitter
         self._screen.onkey(self._toggle_pause, KEY_PAUSE)
         self._screen.onkey(self._quit_game, KEY_QUIT)
@@ -206,25 +301,89 @@ class Game:
         except (AttributeError, RuntimeError):
             pass
 
+    def _set_direction(self, direction: str):
+        """
+        Met une direction en attente : elle sera appliquée au début d'un
+        prochain pas (une direction par pas). Sans effet pendant la lecture
+        d'un replay.
+
+        Args:
+            direction: Nouvelle direction.
+        """
+        if self._replay is not None:
+            return
+        self._inputs.push(direction, self._engine.direction, time.perf_counter())
+
+    def _apply_input(self):
+        """
+        Applique la plus ancienne direction en attente au moteur et
+        l'enregistre si elle est acceptée.
+        """
+        queued = self._inputs.pop()
+        if queued is None:
+            return
+        direction, pressed_at = queued
+        if self._snake.set_direction(direction):
+            self._recorder.record(self._engine.ticks, direction)
+            self._unshown_inputs.append(pressed_at)
+
+    def _present(self):
+        """Met à jour l'écran et mesure le délai des touches qu'il montre."""
+        with self._profiler.phase("screen.update"):
+            self._screen.update()
+        if self._unshown_inputs:
+            now = time.perf_counter()
+            for pressed_at in self._unshown_inputs:
+                self._input_latency.add(now - pressed_at)
+            self._unshown_inputs.clear()
+
     def _go_up(self):
         """Change la direction vers le haut."""
         if not self._game_over and not self._countdown_active:
-            self._snake.set_direction(DIRECTION_UP)
+            self._set_direction(DIRECTION_UP)
 
     def _go_down(self):
         """Change la direction vers le bas."""
         if not self._game_over and not self._countdown_active:
-            self._snake.set_direction(DIRECTION_DOWN)
+            self._set_direction(DIRECTION_DOWN)
 
     def _go_left(self):
         """Change la direction vers la gauche."""
         if not self._game_over and not self._countdown_active:
-            self._snake.set_direction(DIRECTION_LEFT)
+            self._set_direction(DIRECTION_LEFT)
 
     def _go_right(self):
         """Change la direction vers la droite."""
         if not self._game_over and not self._countdown_active:
-            self._snake.set_direction(DIRECTION_RIGHT)
+            self._set_direction(DIRECTION_RIGHT)
+
+    def _seek_backward(self):
+        """Recule la lecture du replay."""
+        self._seek(-REPLAY_SEEK_TICKS)
+
+    def _seek_forward(self):
+        """Avance la lecture du replay."""
+        self._seek(REPLAY_SEEK_TICKS)
+
+    def _seek(self, delta: int):
+        """
+        Déplace la lecture du replay et resynchronise l'affichage.
+
+        Args:
+            delta: Nombre de pas à avancer (négatif pour reculer).
+        """
+        if self._game_over or self._countdown_active:
+            return
+
+        self._replay.seek(self._engine.ticks + delta)
+        self._sync_views()
+        self._screen.update()
+
+    def _sync_views(self):
+        """Replace le serpent, la pomme et le score selon l'état du moteur."""
+        self._snake.sync()
+        self._apple.spawn()
+        self._score_manager.set_score(self._engine.score)
 
     def _toggle_pause(self):
         """Active ou désactive la pause."""
@@ -235,15 +394,15 @@ class Game:
 
         if self._paused:
             self._apple.stop_animation()
-            self._pause_display.clear()
             self._write_with_outline(
                 self._pause_display, "PAUSE", 0, -40,
-                "white", ("Arial", 80, "bold")
+                "white", ("Arial", 80, "bold"), persist=True
             )
         else:
             self._apple.start_animation()
-            self._pause_display.clear()
-            self._pause_display.goto(1000, 1000)
+            self._pause_display.hideturtle()
+            # Le temps passé en pause n'est pas à rattraper
+            self._next_tick = None
 
     def _handle_replay(self):
         """Gère l'appui sur ESPACE pour rejouer."""
@@ -266,6 +425,9 @@ class Game:
         Returns:
             Délai en millisecondes entre chaque mouvement.
         """
+        if self._replay is not None and self._replay_speed == SPEED_UNCAPPED:
+            return 1
+
         score = self._score_manager.score
         speed_seconds = max(SPEED_MIN, SPEED_INITIAL -
                             (score * SPEED_DECREASE_PER_POINT))
@@ -280,10 +442,15 @@ class Game:
     def _on_countdown_complete(self):
         """Appelé quand le compte à rebours est terminé."""
         self._countdown_active = False
-        # Démarrer le serpent automatiquement vers la droite
-        self._snake.set_direction(DIRECTION_RIGHT)
+        # Démarrer le serpent automatiquement vers la droite (directement :
+        # ce n'est pas une touche, son délai n'est pas mesuré)
+        self._inputs.clear()
+        self._unshown_inputs.clear()
+        if self._replay is None and self._snake.set_direction(DIRECTION_RIGHT):
+            self._recorder.record(self._engine.ticks, DIRECTION_RIGHT)
         # Incrémenter l'ID pour invalider les anciennes boucles
         self._game_loop_id += 1
+        self._next_tick = None
         self._game_loop(self._game_loop_id)
 
     def _show_game_over(self):
@@ -293,7 +460,6 @@ class Game:
 
         # Cacher la trainée
         self._snake.hide_trail()
-        self._animation_manager.hide_trail()
 
         # Animation de mort
         body_turtles = self._snake.get_body_turtles()
@@ -319,9 +485,16 @@ class Game:
         self._animation_manager.hide_game_over()
 
         # Réinitialiser
-        self._score_manager.reset()
+        if self._replay is not None:
+            # Revoir le replay depuis le début, sans toucher au highscore
+            self._score_manager.set_score(0)
+            self._replay.seek(0)
+        else:
+            self._score_manager.reset()
+            self._engine.reset(self._next_seed())
+            self._recorder = self._create_recorder()
         self._snake.reset()
-        self._apple.spawn(self._snake.get_all_positions())
+        self._apple.spawn()
         self._apple.start_animation()
         self._current_speed = SPEED_INITIAL
 
@@ -331,44 +504,88 @@ class Game:
         # Relancer le compte à rebours
         self._start_countdown()
 
-    def _check_collisions(self) -> bool:
+    def _check_collisions(self, result: StepResult) -> bool:
         """
-        Vérifie toutes les collisions.
+        Vérifie si le dernier pas du moteur a provoqué une collision
+        (murs ou serpent lui-même).
+
+        Args:
+            result: Résultat du dernier pas du moteur.
 
         Returns:
             True si une collision a eu lieu, False sinon.
         """
-        # Collision avec les murs
-        if self._snake.check_wall_collision():
-            self._sound_manager.play_hit()
-            return True
-
-        # Collision avec soi-même
-        if self._snake.check_self_collision():
+        if result.dead:
             self._sound_manager.play_hit()
             return True
 
         return False
 
-    def _check_apple_eaten(self):
-        """Vérifie si la pomme a été mangée et gère la croissance."""
-        head_pos = self._snake.get_head_position()
-        if self._apple.is_eaten(head_pos):
+    def _check_apple_eaten(self, result: StepResult):
+        """
+        Vérifie si la pomme a été mangée et gère les effets associés.
+
+        Args:
+            result: Résultat du dernier pas du moteur.
+        """
+        if result.ate:
             self._sound_manager.play_eat()
             self._score_manager.add_point()
-            self._snake.grow()
 
             # Animation de manger
-            x, y = head_pos
+            x, y = cell_to_pixel(self._snake.get_head_cell())
             self._animation_manager.animate_eat(x, y)
             self._apple.flash_eaten()
 
-            # Nouvelle position pour la pomme
-            self._apple.spawn(self._snake.get_all_positions())
+            # Nouvelle position pour la pomme (choisie par le moteur)
+            with self._profiler.phase("apple.spawn"):
+                self._apple.spawn()
+
+    def _step(self) -> bool:
+        """
+        Avance la simulation d'un pas (ou la lecture du replay).
+
+        Returns:
+            True si la partie continue, False si elle vient de se terminer.
+        """
+        profiler = self._profiler
+        with profiler.phase("engine.step"):
+            if self._replay is not None:
+                result = self._replay.step()
+            else:
+                self._apply_input()
+                result = self._engine.step()
+                self._recorder.on_step(self._engine)
+
+        # Vérifier les collisions
+        with profiler.phase("check_collisions"):
+            dead = self._check_collisions(result)
+        if dead:
+            self._finish_recording()
+            self._show_game_over()
+            return False
+
+        # Déplacer le serpent
+        with profiler.phase("snake.move"):
+            self._snake.move()
+
+        # Vérifier si la pomme est mangée
+        with profiler.phase("check_apple_eaten"):
+            self._check_apple_eaten(result)
+
+        # Fin d'un replay dont la partie a été interrompue
+        if self._replay is not None and self._replay.finished:
+            self._show_game_over()
+            return False
+        return True
 
     def _game_loop(self, loop_id: int):
         """
-        Boucle principale du jeu utilisant ontimer pour la fluidité.
+        Boucle principale du jeu à pas de temps fixe.
+        Chaque image rattrape les pas dont l'échéance (perf_counter) est
+        passée, puis fait glisser le serpent vers sa case suivante : la
+        vitesse réelle ne dépend ni du temps de calcul ni de la précision
+        d'ontimer.
 
         Args:
             loop_id: ID de cette boucle pour éviter les boucles multiples.
@@ -381,29 +598,86 @@ class Game:
             # Ne pas continuer la boucle pendant game over ou countdown
             return
 
-        if not self._paused:
-            # Déplacer le serpent
-            self._snake.move()
+        if self._paused:
+            # En pause, juste mettre à jour l'écran
+            self._screen.update()
+            self._screen.ontimer(lambda: self._game_loop(loop_id), 100)
+            return
 
-            # Vérifier les collisions
-            if self._check_collisions():
-                self._show_game_over()
-                self._screen.update()
+        with self._profiler.phase("frame"):
+            if not self._run_frame():
                 return
 
-            # Vérifier si la pomme est mangée
-            self._check_apple_eaten()
+        if self._profiler.live:
+            self._show_frame_profile()
 
-            # Mettre à jour l'écran
-            self._screen.update()
+        # Prochaine image, ou le prochain pas s'il tombe avant
+        now = time.perf_counter()
+        wake = min(self._next_tick, now + GAME_FRAME_MS / 1000)
+        wait_ms = max(1, math.ceil((wake - now) * 1000))
+        self._screen.ontimer(lambda: self._game_loop(loop_id), wait_ms)
 
+    def _run_frame(self) -> bool:
+        """
+        Une image de la boucle de jeu : les pas en retard, le glissement
+        du serpent, les animations, puis la mise à jour de l'écran.
+
+        Returns:
+            True si la partie continue, False si elle vient de se terminer.
+        """
+        now = time.perf_counter()
+        if self._next_tick is None:
+            # Début de partie ou fin de pause : premier pas immédiat
+            self._next_tick = now
+
+        steps = 0
+        while now >= self._next_tick:
+            if steps == GAME_MAX_CATCHUP:
+                # Trop de retard (fenêtre déplacée, machine lente) : abandonner le reste
+                self._next_tick = now + self._calculate_speed() / 1000
+                break
+            if not self._step():
+                self._present()
+                return False
+            steps += 1
             # Calculer le délai en fonction du score
-            delay = self._calculate_speed()
-            self._screen.ontimer(lambda: self._game_loop(loop_id), delay)
-        else:
-            # En pause, juste mettre à jour l'écran
-            self._screen.update()
-            self._screen.ontimer(lambda: self._game_loop(loop_id), 100)
+            self._next_tick += self._calculate_speed() / 1000
+
+        # Avancement entre le dernier pas et le suivant
+        with self._profiler.phase("animations"):
+            delay = self._calculate_speed() / 1000
+            self._snake.interpolate(1.0 - (self._next_tick - now) / delay)
+            self._animation_manager.advance()
+
+        # Mettre à jour l'écran
+        self._present()
+        return True
+
+    def _show_frame_profile(self):
+        """Affiche en direct le p95 de chaque phase (coin supérieur droit)."""
+        now = time.perf_counter()
+        if now - self._profile_shown_at < FRAME_PROFILE_LIVE_MS / 1000:
+            return
+        self._profile_shown_at = now
+
+        if self._profile_display is None:
+            self._profile_display = self._turtle_pool.acquire("profile_text")
+            self._profile_display.color("#90CAF9")
+            self._profile_display.goto(WINDOW_WIDTH // 2 - 10, WINDOW_HEIGHT // 2 - 30)
+        # Texte changeant : écrit directement, sans passer par le cache des textes
+        self._profile_display.clear()
+        self._profile_display.write(self._profiler.summary_text(), align="right",
+                                    font=("Courier", 10, "normal"))
+
+    def frame_profile(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retourne le résumé des durées de chaque phase de la boucle de jeu.
+
+        Returns:
+            Nombre de mesures, moyenne, maximum, centiles et histogramme de
+            chaque phase, en microsecondes (vide si le profil est désactivé).
+        """
+        return self._profiler.snapshot()
 
     def run(self):
         """Lance le jeu."""
@@ -417,12 +691,14 @@ class Game:
 
         self._running = True
 
-        # Afficher les contrôles à l'écran une seule fois
-        self._show_controls()
-
         try:
-            # Lancer le compte à rebours puis le jeu
-            self._start_countdown()
+            with self._startup.phase("première image"):
+                # Afficher les contrôles à l'écran une seule fois
+                self._show_controls()
+
+                # Lancer le compte à rebours puis le jeu
+                self._start_countdown()
+            self._startup.report()
 
             # Maintenir la fenêtre ouverte
             self._screen.mainloop()
@@ -441,9 +717,21 @@ class Game:
 
         self._running = False
 
+        # Sauvegarder la partie interrompue
+        if not self._game_over:
+            self._finish_recording()
+
         # Sauvegarder le score
         self._score_manager.save_highscore()
 
+        # Délai entre l'appui des touches et leur affichage
+        self._input_latency.report()
+
+        # Durées de chaque phase de la boucle de jeu
+        profile_path = self._profiler.dump()
+        if profile_path:
+            print(f"Profil des images: {profile_path}")
+
         # Nettoyer les composants seulement si la fenêtre n'est pas déjà fermée
         if not self._window_closed:
             try:
@@ -452,6 +740,8 @@ class Game:
                 self._snake.cleanup()
                 self._apple.cleanup()
                 self._animation_manager.cleanup()
+                self._turtle_pool.cleanup()
+                self._text_sprites.cleanup()
             except (turtle.TurtleGraphicsError, AttributeError, RuntimeError):
                 pass
 
@@ -0,0 +1,141 @@
+"""
+Parties sans affichage - Exécution de lots de parties sur plusieurs processus
+
+Utilisé par `main.py --headless` pour les tests de non-régression
+sur des serveurs sans écran : aucun import de Turtle ni de Tk.
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, Optional, TextIO
+
+from src.config import DIRECTION_RIGHT
+from src.core.engine import GameEngine
+from src.core.policies import POLICIES
+from src.core.replay import ReplayRecorder
+
+# Cause de fin de partie quand la limite de pas est atteinte
+DEATH_TIMEOUT = "timeout"
+
+
+def play_game(game_id: int, policy_name: str, seed: int,
+              max_ticks: Optional[int] = None,
+              record_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Joue une partie complète sans affichage.
+    La partie est entièrement déterminée par sa graine.
+
+    Args:
+        game_id: Numéro de la partie dans le lot.
+        policy_name: Nom de la politique (clé de POLICIES).
+        seed: Graine de la partie (moteur et politique).
+        max_ticks: Nombre maximal de pas (None pour illimité).
+        record_dir: Dossier où écrire le replay de la partie (None pour aucun).
+
+    Returns:
+        Dictionnaire des résultats (score, ticks, cause de la mort, durée).
+    """
+    policy = POLICIES[policy_name]
+    rng = random.Random(seed)
+    engine = GameEngine(seed=seed)
+    recorder = ReplayRecorder(seed, engine.cols, engine.rows)
+
+    def set_direction(direction: str):
+        if engine.set_direction(direction):
+            recorder.record(engine.ticks, direction)
+
+    # Comme après le compte à rebours : départ vers la droite
+    set_direction(DIRECTION_RIGHT)
+
+    start = time.perf_counter()
+    death_cause = DEATH_TIMEOUT
+    while max_ticks is None or engine.ticks < max_ticks:
+        set_direction(policy(engine, rng))
+        result = engine.step()
+        recorder.on_step(engine)
+        if result.dead:
+            death_cause = result.death_cause
+            break
+
+    recorder.finish(engine.ticks)
+    replay_path = None
+    if record_dir:
+        replay_path = os.path.join(record_dir, f"game_{game_id:06d}.snkr")
+        recorder.save(replay_path)
+
+    return {
+        "game": game_id,
+        "seed": seed,
+        "policy": policy_name,
+        "score": engine.score,
+        "ticks": engine.ticks,
+        "death_cause": death_cause,
+        "seconds": round(time.perf_counter() - start, 6),
+        "replay": replay_path,
+    }
+
+
+def _play_game_task(args: tuple) -> Dict[str, Any]:
+    """Adaptateur pour Pool.imap_unordered (un seul argument)."""
+    return play_game(*args)
+
+
+def run_headless(games: int, workers: int, policy_name: str, seed: int = 0,
+                 max_ticks: Optional[int] = None, output: TextIO = sys.stdout,
+                 record_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Joue un lot de parties sur un pool de processus et écrit chaque
+    résultat (une ligne JSON) dès que la partie est terminée.
+
+    Args:
+        games: Nombre de parties.
+        workers: Nombre de processus.
+        policy_name: Nom de la politique (clé de POLICIES).
+        seed: Graine de base ; la partie i utilise seed + i.
+        max_ticks: Nombre maximal de pas par partie (None pour illimité).
+        output: Flux où écrire les résultats.
+        record_dir: Dossier où écrire le replay de chaque partie (None pour aucun).
+
+    Returns:
+        Résumé du lot (nombre de parties, score moyen et maximal, pas par seconde).
+    """
+    if policy_name not in POLICIES:
+        raise ValueError(f"Politique inconnue: {policy_name}")
+
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+
+    tasks = [(i, policy_name, seed + i, max_ticks, record_dir)
+             for i in range(games)]
+    total_score = 0
+    best_score = 0
+    total_ticks = 0
+    start = time.perf_counter()
+
+    def emit(result: Dict[str, Any]):
+        nonlocal total_score, best_score, total_ticks
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        total_score += result["score"]
+        best_score = max(best_score, result["score"])
+        total_ticks += result["ticks"]
+
+    if workers <= 1:
+        for task in tasks:
+            emit(_play_game_task(task))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for result in pool.imap_unordered(_play_game_task, tasks, chunksize=4):
+                emit(result)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "games": games,
+        "mean_score": total_score / games if games else 0.0,
+        "best_score": best_score,
+        "ticks_per_second": total_ticks / elapsed if elapsed > 0 else 0.0,
+    }
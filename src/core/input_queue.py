@@ -0,0 +1,148 @@
+"""
+File des directions - Touches mises en attente et appliquées une par pas
+
+Deux touches appuyées pendant le même pas (haut puis gauche pour un
+virage serré) ne s'écrasent plus : chacune est appliquée à son propre
+pas. Le demi-tour est vérifié par rapport à la dernière direction en
+attente, pas seulement par rapport à la direction actuelle du serpent.
+Chaque touche garde l'instant de son appui, ce qui permet de mesurer le
+délai entre la touche et l'image qui montre le virage.
+"""
+
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence, TextIO, Tuple
+
+from src.config import (
+    DIRECTION_STOP,
+    OPPOSITE_DIRECTIONS,
+    INPUT_QUEUE_SIZE,
+    INPUT_LATENCY_SAMPLES,
+)
+
+# Direction en attente et instant de l'appui (time.perf_counter())
+QueuedInput = Tuple[str, float]
+
+
+class InputQueue:
+    """
+    File bornée des directions demandées, vidée d'une direction par pas.
+
+    Méthodes publiques:
+        - push(direction: str, current: str, timestamp: Optional[float]) -> bool: Met une direction en attente
+        - pop() -> Optional[QueuedInput]: Retire la plus ancienne direction en attente
+        - clear(): Vide la file
+    """
+
+    def __init__(self, max_size: int = INPUT_QUEUE_SIZE):
+        """
+        Initialise la file.
+
+        Args:
+            max_size: Nombre de directions en attente au maximum.
+        """
+        self._max_size = max_size
+        self._queue: Deque[QueuedInput] = deque()
+
+    def push(self, direction: str, current: str,
+             timestamp: Optional[float] = None) -> bool:
+        """
+        Met une direction en attente si elle change la trajectoire.
+
+        Args:
+            direction: Direction demandée.
+            current: Direction actuelle du serpent (utilisée si la file est vide).
+            timestamp: Instant de l'appui (time.perf_counter() si None).
+
+        Returns:
+            True si la direction a été mise en attente, False si elle est
+            ignorée (demi-tour, répétition ou file pleine).
+        """
+        previous = self._queue[-1][0] if self._queue else current
+        if direction == previous or (previous != DIRECTION_STOP
+                                     and direction == OPPOSITE_DIRECTIONS.get(previous)):
+            return False
+        if len(self._queue) >= self._max_size:
+            return False
+
+        self._queue.append((direction, time.perf_counter() if timestamp is None else timestamp))
+        return True
+
+    def pop(self) -> Optional[QueuedInput]:
+        """
+        Retire la plus ancienne direction en attente.
+
+        Returns:
+            La direction et l'instant de l'appui, ou None si la file est vide.
+        """
+        return self._queue.popleft() if self._queue else None
+
+    def clear(self):
+        """Vide la file."""
+        self._queue.clear()
+
+
+class LatencyStats:
+    """
+    Délais touche → image des dernières touches appliquées.
+
+    Méthodes publiques:
+        - add(seconds: float): Ajoute une mesure
+        - percentiles(ranks: Sequence[int]) -> Dict[int, float]: Centiles des mesures (en secondes)
+        - report(output: TextIO): Affiche les centiles
+        - count (propriété): Nombre de mesures gardées
+    """
+
+    def __init__(self, max_samples: int = INPUT_LATENCY_SAMPLES):
+        """
+        Initialise les mesures.
+
+        Args:
+            max_samples: Nombre de mesures gardées (les plus récentes).
+        """
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, seconds: float):
+        """
+        Ajoute une mesure.
+
+        Args:
+            seconds: Délai entre l'appui et l'image affichée.
+        """
+        self._samples.append(seconds)
+
+    def percentiles(self, ranks: Sequence[int] = (50, 95, 99)) -> Dict[int, float]:
+        """
+        Calcule des centiles des mesures (méthode du rang le plus proche).
+
+        Args:
+            ranks: Centiles demandés (de 0 à 100).
+
+        Returns:
+            Délai en secondes de chaque centile (vide s'il n'y a aucune mesure).
+        """
+        if not self._samples:
+            return {}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+        return {rank: ordered[min(last, max(0, -(-rank * len(ordered) // 100) - 1))]
+                for rank in ranks}
+
+    def report(self, output: TextIO = sys.stdout):
+        """
+        Affiche les centiles des délais (rien s'il n'y a aucune mesure).
+
+        Args:
+            output: Flux où écrire le rapport.
+        """
+        values = self.percentiles()
+        if not values:
+            return
+        text = ", ".join(f"p{rank} {seconds * 1000:.1f} ms" for rank, seconds in values.items())
+        print(f"Latence touche → image ({self.count} touches): {text}", file=output)
+
+    @property
+    def count(self) -> int:
+        """Nombre de mesures gardées."""
+        return len(self._samples)
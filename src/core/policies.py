@@ -0,0 +1,68 @@
+"""
+Politiques de jeu automatiques pour les parties sans affichage
+
+Une politique reçoit le moteur et un générateur aléatoire, et retourne
+la direction à jouer pour le prochain pas.
+"""
+
+import random
+from typing import Callable, Dict
+
+from src.core.engine import DIRECTION_DELTAS, GameEngine
+
+Policy = Callable[[GameEngine, random.Random], str]
+
+
+def random_policy(engine: GameEngine, rng: random.Random) -> str:
+    """
+    Choisit une direction au hasard.
+
+    Args:
+        engine: Le moteur de la partie.
+        rng: Générateur aléatoire de la partie.
+
+    Returns:
+        La direction à jouer.
+    """
+    return rng.choice(list(DIRECTION_DELTAS))
+
+
+def _is_safe(engine: GameEngine, col: int, row: int) -> bool:
+    """Indique si une case est dans la grille et libre."""
+    return (0 <= col < engine.cols and 0 <= row < engine.rows
+            and not engine.is_occupied((col, row)))
+
+
+def greedy_policy(engine: GameEngine, rng: random.Random) -> str:
+    """
+    Se rapproche de la pomme en évitant les murs et le corps au pas suivant.
+
+    Args:
+        engine: Le moteur de la partie.
+        rng: Générateur aléatoire (départage les égalités).
+
+    Returns:
+        La direction à jouer.
+    """
+    head_col, head_row = engine.head
+    apple_col, apple_row = engine.apple
+
+    best = None
+    for direction, (dx, dy) in DIRECTION_DELTAS.items():
+        col, row = head_col + dx, head_row + dy
+        if not _is_safe(engine, col, row):
+            continue
+        distance = abs(col - apple_col) + abs(row - apple_row)
+        candidate = (distance, rng.random(), direction)
+        if best is None or candidate < best:
+            best = candidate
+
+    # Aucune case sûre : garder la direction actuelle
+    return best[2] if best else engine.direction
+
+
+# Politiques disponibles en ligne de commande
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
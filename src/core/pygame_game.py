@@ -0,0 +1,484 @@
+"""
+Front-end pygame - Les règles du GameEngine affichées dans une fenêtre pygame
+
+Alternative au rendu Turtle/Tk pour les grands plateaux et les fréquences
+d'images élevées : sprites pré-convertis avec convert_alpha(), boucle à pas
+de temps fixe et mise à jour de l'écran limitée aux rectangles modifiés.
+Fonctionne avec le pilote vidéo SDL « dummy » (SDL_VIDEODRIVER=dummy)
+pour mesurer les performances sur un serveur sans écran.
+"""
+
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from src.config import (
+    WINDOW_TITLE,
+    CELL_SIZE,
+    GRID_COLS,
+    GRID_ROWS,
+    IMAGE_SIZE,
+    APPLE_SIZE,
+    HEAD_IMAGE,
+    BODY_IMAGE,
+    APPLE_IMAGE,
+    GRID_IMAGE,
+    SNAKE_BODY_COLOR,
+    SCORE_COLOR,
+    COLOR_GAME_OVER,
+    COLOR_REPLAY_TEXT,
+    KEY_UP,
+    KEY_DOWN,
+    KEY_LEFT,
+    KEY_RIGHT,
+    KEY_ARROW_UP,
+    KEY_ARROW_DOWN,
+    KEY_ARROW_LEFT,
+    KEY_ARROW_RIGHT,
+    KEY_PAUSE,
+    KEY_QUIT,
+    KEY_REPLAY,
+    DIRECTION_UP,
+    DIRECTION_DOWN,
+    DIRECTION_LEFT,
+    DIRECTION_RIGHT,
+    PYGAME_FPS,
+    PYGAME_MAX_CATCHUP,
+)
+from src.core.engine import Cell, GameEngine, SEED_BITS
+from src.core.policies import POLICIES
+from src.core.replay import ReplayRecorder, tick_delay
+from src.managers.score_manager import load_highscore, write_highscore
+from src.managers.sound_manager import SoundManager
+
+try:
+    import pygame
+except ImportError:
+    pygame = None  # type: ignore
+
+# Rotation (degrés, sens trigonométrique) de l'image de la tête selon la
+# direction ; l'image d'origine regarde vers le bas (comme dans Snake)
+HEAD_ROTATIONS = {
+    DIRECTION_UP: 180,
+    DIRECTION_DOWN: 0,
+    DIRECTION_LEFT: 270,
+    DIRECTION_RIGHT: 90,
+}
+
+# Directions associées aux touches de déplacement
+KEY_DIRECTIONS = {
+    KEY_UP: DIRECTION_UP,
+    KEY_DOWN: DIRECTION_DOWN,
+    KEY_LEFT: DIRECTION_LEFT,
+    KEY_RIGHT: DIRECTION_RIGHT,
+    KEY_ARROW_UP: DIRECTION_UP,
+    KEY_ARROW_DOWN: DIRECTION_DOWN,
+    KEY_ARROW_LEFT: DIRECTION_LEFT,
+    KEY_ARROW_RIGHT: DIRECTION_RIGHT,
+}
+
+
+def _key_code(name: str) -> int:
+    """Convertit un nom de touche Tk (config.py) en code de touche pygame."""
+    return pygame.key.key_code(name.lower())
+
+
+class PygameGame:
+    """
+    Jeu Snake affiché avec pygame.
+    Les règles, l'enregistrement des replays et le highscore sont
+    partagés avec la version Turtle.
+
+    Méthodes publiques:
+        - run() -> Dict[str, Any]: Lance le jeu et retourne les statistiques de la session
+    """
+
+    def __init__(self, seed: Optional[int] = None, cols: int = GRID_COLS,
+                 rows: int = GRID_ROWS, cell_size: int = CELL_SIZE,
+                 replay_dir: Optional[str] = None, policy_name: Optional[str] = None,
+                 uncapped: bool = False, max_ticks: Optional[int] = None):
+        """
+        Initialise la fenêtre pygame et le moteur.
+
+        Args:
+            seed: Graine de la session (None pour une graine aléatoire).
+            cols: Nombre de colonnes du plateau.
+            rows: Nombre de lignes du plateau.
+            cell_size: Taille d'une case en pixels.
+            replay_dir: Dossier où enregistrer le replay de chaque partie
+                (None pour ne pas les sauvegarder).
+            policy_name: Politique qui joue à la place du clavier (clé de
+                POLICIES) ; les parties perdues sont relancées automatiquement.
+            uncapped: Si True, un pas de jeu par image, sans attente (mesures).
+            max_ticks: Nombre total de pas après lequel quitter (None pour illimité).
+        """
+        if pygame is None:
+            raise ImportError("pygame est requis pour le front-end pygame")
+        if policy_name is not None and policy_name not in POLICIES:
+            raise ValueError(f"Politique inconnue: {policy_name}")
+
+        pygame.display.init()
+        pygame.font.init()
+
+        self._cols = cols
+        self._rows = rows
+        self._cell = cell_size
+        self._replay_dir = replay_dir
+        self._policy = POLICIES[policy_name] if policy_name else None
+        self._uncapped = uncapped
+        self._max_ticks = max_ticks
+
+        self._rng = random.Random(seed)
+        self._engine = GameEngine(cols, rows, seed=self._rng.getrandbits(SEED_BITS))
+        self._recorder = self._create_recorder()
+
+        self._screen = pygame.display.set_mode((cols * cell_size, rows * cell_size))
+        pygame.display.set_caption(WINDOW_TITLE)
+
+        self._background = self._create_background()
+        self._load_sprites()
+        self._font = pygame.font.SysFont("Arial", max(12, cell_size // 2), bold=True)
+        self._big_font = pygame.font.SysFont("Arial", cell_size * 2, bold=True)
+        # Zone du score : assez grande pour le texte le plus long
+        text_size = self._font.size("Highscore: 00000")
+        self._score_rect = pygame.Rect(0, 0, text_size[0] + 20, 2 * text_size[1] + 20)
+
+        self._sound_manager = SoundManager()
+        self._highscore = load_highscore()
+
+        self._key_directions = {
+            _key_code(key): direction for key, direction in KEY_DIRECTIONS.items()}
+        self._key_pause = _key_code(KEY_PAUSE)
+        self._key_quit = _key_code(KEY_QUIT)
+        self._key_replay = _key_code(KEY_REPLAY)
+
+        self._running = False
+        self._paused = False
+        self._game_over = False
+        self._dirty: List["pygame.Rect"] = []
+        self._total_ticks = 0
+        self._frames = 0
+        self._games = 0
+
+    def _create_recorder(self) -> ReplayRecorder:
+        """Commence l'enregistrement de la partie en cours du moteur."""
+        return ReplayRecorder(self._engine.seed, self._engine.cols, self._engine.rows)
+
+    def _finish_recording(self):
+        """Termine l'enregistrement de la partie et le sauvegarde si demandé."""
+        self._recorder.finish(self._engine.ticks)
+        if not self._replay_dir:
+            return
+
+        filename = f"replay_{time.strftime('%Y%m%d_%H%M%S')}_{self._engine.seed:016x}.snkr"
+        try:
+            os.makedirs(self._replay_dir, exist_ok=True)
+            self._recorder.save(os.path.join(self._replay_dir, filename))
+        except (IOError, OSError) as e:
+            print(f"Avertissement: Impossible de sauvegarder le replay - {e}")
+
+    def _create_background(self) -> "pygame.Surface":
+        """
+        Crée le fond du plateau : l'image de la grille si elle a la taille
+        de la fenêtre, sinon une grille dessinée.
+
+        Returns:
+            La surface du fond, convertie au format de l'écran.
+        """
+        size = self._screen.get_size()
+        try:
+            image = pygame.image.load(GRID_IMAGE)
+            if image.get_size() == size:
+                return image.convert()
+        except (pygame.error, FileNotFoundError, OSError) as e:
+            print(f"Avertissement: Impossible de charger l'image de fond - {e}")
+
+        background = pygame.Surface(size).convert()
+        background.fill((20, 20, 20))
+        for col in range(self._cols + 1):
+            x = col * self._cell
+            pygame.draw.line(background, (45, 45, 45), (x, 0), (x, size[1]))
+        for row in range(self._rows + 1):
+            y = row * self._cell
+            pygame.draw.line(background, (45, 45, 45), (0, y), (size[0], y))
+        return background
+
+    def _load_image(self, path: str, size: tuple, fallback_color: str) -> "pygame.Surface":
+        """
+        Charge une image, la met à l'échelle des cases et la convertit
+        avec convert_alpha() pour des blits rapides.
+
+        Args:
+            path: Chemin de l'image.
+            size: Taille de référence (pour des cases de CELL_SIZE pixels).
+            fallback_color: Couleur du carré utilisé si l'image est introuvable.
+
+        Returns:
+            La surface prête à être blittée.
+        """
+        width = max(1, size[0] * self._cell // CELL_SIZE)
+        height = max(1, size[1] * self._cell // CELL_SIZE)
+        try:
+            image = pygame.image.load(path)
+            # Garder les proportions, comme Image.thumbnail()
+            scale = min(width / image.get_width(), height / image.get_height())
+            image = pygame.transform.smoothscale(
+                image, (max(1, round(image.get_width() * scale)),
+                        max(1, round(image.get_height() * scale))))
+            return image.convert_alpha()
+        except (pygame.error, FileNotFoundError, OSError) as e:
+            print(f"Avertissement: Impossible de charger l'image {path} - {e}")
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill(pygame.Color(fallback_color))
+            return surface.convert_alpha()
+
+    def _load_sprites(self):
+        """Charge et pré-convertit tous les sprites."""
+        head = self._load_image(HEAD_IMAGE, IMAGE_SIZE, SNAKE_BODY_COLOR)
+        self._head_sprites = {
+            direction: pygame.transform.rotate(head, angle).convert_alpha()
+            for direction, angle in HEAD_ROTATIONS.items()
+        }
+        self._body_sprite = self._load_image(BODY_IMAGE, IMAGE_SIZE, SNAKE_BODY_COLOR)
+        self._apple_sprite = self._load_image(APPLE_IMAGE, APPLE_SIZE, "red")
+
+    def _cell_rect(self, cell: Cell) -> "pygame.Rect":
+        """Rectangle à l'écran d'une case (la ligne 0 est en bas)."""
+        col, row = cell
+        return pygame.Rect(col * self._cell, (self._rows - 1 - row) * self._cell,
+                           self._cell, self._cell)
+
+    def _blit_centered(self, sprite: "pygame.Surface", rect: "pygame.Rect"):
+        """Dessine un sprite centré dans un rectangle."""
+        self._screen.blit(sprite, sprite.get_rect(center=rect.center))
+
+    def _erase(self, rect: "pygame.Rect"):
+        """Redessine le fond sous un rectangle et le marque comme modifié."""
+        self._screen.blit(self._background, rect, rect)
+        self._dirty.append(rect)
+
+    def _draw_cell(self, cell: Cell, sprite: "pygame.Surface"):
+        """Dessine un sprite sur une case et la marque comme modifiée."""
+        rect = self._cell_rect(cell)
+        self._screen.blit(self._background, rect, rect)
+        self._blit_centered(sprite, rect)
+        self._dirty.append(rect)
+
+    def _head_sprite(self) -> "pygame.Surface":
+        """Sprite de la tête orienté selon la direction du serpent."""
+        return self._head_sprites.get(self._engine.direction,
+                                      self._head_sprites[DIRECTION_DOWN])
+
+    def _draw_score(self):
+        """
+        Redessine le score et le highscore par-dessus ce qui passe dessous.
+        Appelé quand le score change ou quand une case modifiée touche sa zone.
+        """
+        rect = self._score_rect
+        self._erase(rect)
+
+        # Redessiner en entier les cases du serpent et la pomme sous le texte
+        # (un sprite semi-transparent ne doit pas être mélangé deux fois)
+        engine = self._engine
+        if self._cell_rect(engine.apple).colliderect(rect):
+            self._draw_cell(engine.apple, self._apple_sprite)
+        for offset, cell in enumerate(engine.body):
+            if self._cell_rect(cell).colliderect(rect):
+                self._draw_cell(cell, self._head_sprite() if offset == 0 else self._body_sprite)
+
+        color = pygame.Color(SCORE_COLOR)
+        score = self._font.render(f"Score: {self._engine.score}", True, color)
+        best = self._font.render(f"Highscore: {self._highscore}", True, color)
+        self._screen.blit(score, (10, 10))
+        self._screen.blit(best, (10, 10 + score.get_height()))
+
+    def _draw_text_center(self, text: str, color: str, font: "pygame.font.Font",
+                          dy: int = 0):
+        """Écrit un texte centré à l'écran (avec une ombre noire)."""
+        center = self._screen.get_rect().center
+        shadow = font.render(text, True, (0, 0, 0))
+        label = font.render(text, True, pygame.Color(color))
+        rect = label.get_rect(center=(center[0], center[1] + dy))
+        self._screen.blit(shadow, rect.move(2, 2))
+        self._screen.blit(label, rect)
+
+    def _draw_all(self):
+        """Redessine tout l'écran (début de partie, pause, game over)."""
+        engine = self._engine
+        self._screen.blit(self._background, (0, 0))
+        self._blit_centered(self._apple_sprite, self._cell_rect(engine.apple))
+        for cell in engine.body[1:]:
+            self._blit_centered(self._body_sprite, self._cell_rect(cell))
+        self._blit_centered(self._head_sprite(), self._cell_rect(engine.head))
+        self._draw_score()
+
+        if self._paused:
+            self._draw_text_center("PAUSE", "white", self._big_font)
+        elif self._game_over:
+            self._draw_text_center("GAME OVER", COLOR_GAME_OVER, self._big_font, -self._cell)
+            self._draw_text_center(f"Score: {engine.score}", "#FFEB3B", self._font, self._cell // 2)
+            self._draw_text_center("[ESPACE] Rejouer", COLOR_REPLAY_TEXT, self._font,
+                                   self._cell + self._cell // 2)
+
+        self._dirty.clear()
+        pygame.display.flip()
+
+    def _set_direction(self, direction: str):
+        """Change la direction du serpent et l'enregistre si elle est acceptée."""
+        if self._engine.set_direction(direction):
+            self._recorder.record(self._engine.ticks, direction)
+
+    def _restart_game(self):
+        """Commence une nouvelle partie."""
+        self._engine.reset(self._rng.getrandbits(SEED_BITS))
+        self._recorder = self._create_recorder()
+        self._start_game()
+
+    def _start_game(self):
+        """Démarre la partie en cours du moteur."""
+        self._game_over = False
+        self._paused = False
+        # Comme après le compte à rebours : départ vers la droite
+        self._set_direction(DIRECTION_RIGHT)
+        self._draw_all()
+
+    def _end_game(self):
+        """Termine la partie en cours (collision)."""
+        self._sound_manager.play_hit()
+        self._finish_recording()
+        self._games += 1
+        if self._engine.score > self._highscore:
+            self._highscore = self._engine.score
+            # Les parties automatiques n'écrasent pas le record du joueur
+            if self._policy is None:
+                write_highscore(self._highscore)
+
+        if self._policy is not None:
+            # Partie automatique : relancer sans attendre
+            self._restart_game()
+        else:
+            self._game_over = True
+            self._draw_all()
+
+    def _tick(self):
+        """Avance la partie d'un pas et redessine les cases modifiées."""
+        engine = self._engine
+        if self._policy is not None:
+            self._set_direction(self._policy(engine, self._rng))
+
+        previous_head = engine.head
+        result = engine.step()
+        if not result.moved:
+            return
+        self._total_ticks += 1
+        if result.dead:
+            self._end_game()
+            return
+        self._recorder.on_step(engine)
+
+        # La case quittée par la queue (sauf si le serpent a grandi)
+        if not result.ate:
+            vacated = engine.cell_at(engine.length + 1)
+            if vacated is not None and vacated != engine.head:
+                self._erase(self._cell_rect(vacated))
+
+        if engine.length:
+            self._draw_cell(previous_head, self._body_sprite)
+        self._draw_cell(engine.head, self._head_sprite())
+
+        if result.ate:
+            self._sound_manager.play_eat()
+            self._draw_cell(engine.apple, self._apple_sprite)
+
+        if result.ate or self._score_rect.collidelist(self._dirty) >= 0:
+            self._draw_score()
+
+    def _handle_events(self):
+        """Traite les événements clavier et fenêtre."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self._running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == self._key_quit:
+                    self._running = False
+                elif event.key == self._key_pause and not self._game_over:
+                    self._paused = not self._paused
+                    self._draw_all()
+                elif event.key == self._key_replay and self._game_over:
+                    self._restart_game()
+                elif (event.key in self._key_directions and self._policy is None
+                      and not self._game_over):
+                    self._set_direction(self._key_directions[event.key])
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Lance le jeu jusqu'à la fermeture de la fenêtre (ou max_ticks).
+
+        Returns:
+            Statistiques de la session (images, pas, parties, images par seconde).
+        """
+        self._running = True
+        self._start_game()
+
+        clock = pygame.time.Clock()
+        start = previous = time.perf_counter()
+        accumulator = 0.0
+
+        try:
+            while self._running:
+                self._handle_events()
+
+                if not self._paused and not self._game_over:
+                    if self._uncapped:
+                        self._tick()
+                    else:
+                        # Pas de temps fixe : la durée d'un pas ne dépend que
+                        # du score, pas de la fréquence d'affichage
+                        now = time.perf_counter()
+                        accumulator += now - previous
+                        previous = now
+                        steps = 0
+                        while (accumulator >= tick_delay(self._engine.score)
+                               and steps < PYGAME_MAX_CATCHUP and not self._game_over):
+                            accumulator -= tick_delay(self._engine.score)
+                            self._tick()
+                            steps += 1
+                        if steps == PYGAME_MAX_CATCHUP:
+                            # Trop de retard : abandonner le reste
+                            accumulator = 0.0
+                else:
+                    previous = time.perf_counter()
+                    accumulator = 0.0
+
+                # Ne transmettre à l'écran que les rectangles modifiés
+                if self._dirty:
+                    pygame.display.update(self._dirty)
+                    self._dirty.clear()
+                self._frames += 1
+
+                if self._max_ticks is not None and self._total_ticks >= self._max_ticks:
+                    break
+                if not self._uncapped:
+                    clock.tick(PYGAME_FPS)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            elapsed = time.perf_counter() - start
+            self._cleanup()
+
+        return {
+            "frames": self._frames,
+            "ticks": self._total_ticks,
+            "games": self._games,
+            "seconds": round(elapsed, 3),
+            "fps": self._frames / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _cleanup(self):
+        """Sauvegarde la partie interrompue et ferme la fenêtre."""
+        self._running = False
+        if not self._game_over:
+            self._finish_recording()
+        self._sound_manager.cleanup()
+        pygame.display.quit()
@@ -0,0 +1,366 @@
+"""
+Enregistrement des parties - Format de replay binaire compact
+
+Une partie est entièrement déterminée par sa graine et les directions
+acceptées par le moteur à chaque pas. Format d'un fichier replay :
+
+    en-tête : MAGIC, version (1 octet), puis en varints :
+              graine, colonnes, lignes, colonne et ligne de départ,
+              colonnes et lignes de la zone du score
+    événements : un varint par événement, (delta de pas << 3) | code
+              code 0-3 : direction (ACTION_UP, ...) appliquée avant le pas
+              code 4   : image clé, suivie de la taille (varint) et de
+                         l'instantané du moteur (GameEngine.snapshot)
+              code 7   : fin de partie (delta jusqu'au dernier pas)
+
+Les images clés, écrites tous les REPLAY_KEYFRAME_INTERVAL pas, permettent
+de se placer à n'importe quel pas sans re-simuler toute la partie.
+"""
+
+import bisect
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from src.config import (
+    SNAKE_START_COL,
+    SNAKE_START_ROW,
+    SCORE_ZONE_COLS,
+    SCORE_ZONE_ROWS,
+    REPLAY_KEYFRAME_INTERVAL,
+    SPEED_INITIAL,
+    SPEED_MIN,
+    SPEED_DECREASE_PER_POINT,
+)
+from src.core.engine import ACTION_DIRECTIONS, GameEngine, StepResult
+from src.core.varint import read_varint, write_varint
+
+MAGIC = b"SNKR"
+VERSION = 3
+
+# Codes d'événements (les codes 0-3 sont les directions)
+EVENT_KEYFRAME = 4
+EVENT_END = 7
+EVENT_BITS = 3
+
+# Vitesses de lecture
+SPEED_REALTIME = "realtime"
+SPEED_UNCAPPED = "uncapped"
+
+
+class Replay(NamedTuple):
+    """Contenu décodé d'un replay."""
+    seed: int
+    cols: int
+    rows: int
+    events: List[Tuple[int, str]]
+    end_tick: Optional[int]
+    # (pas, nombre de directions qui précèdent, instantané du moteur)
+    keyframes: List[Tuple[int, int, bytes]]
+
+
+class ReplayRecorder:
+    """
+    Enregistre une partie au format replay binaire.
+
+    Méthodes publiques:
+        - record(tick: int, direction: str): Enregistre un changement de direction accepté par le moteur
+        - on_step(engine: GameEngine): Écrit une image clé quand l'intervalle est atteint
+        - finish(tick: int) -> bytes: Termine l'enregistrement et retourne le replay
+        - save(path: str): Écrit le replay dans un fichier
+        - data (propriété): Octets enregistrés jusqu'ici
+    """
+
+    def __init__(self, seed: int, cols: int, rows: int,
+                 keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL):
+        """
+        Commence un enregistrement.
+
+        Args:
+            seed: Graine de la partie.
+            cols: Nombre de colonnes de la grille.
+            rows: Nombre de lignes de la grille.
+            keyframe_interval: Nombre de pas entre deux images clés
+                (0 pour ne pas en écrire).
+        """
+        self._data = bytearray(MAGIC)
+        self._data.append(VERSION)
+        for value in (seed, cols, rows, SNAKE_START_COL, SNAKE_START_ROW,
+                      SCORE_ZONE_COLS, SCORE_ZONE_ROWS):
+            write_varint(self._data, value)
+        self._last_tick = 0
+        self._last_direction: Optional[str] = None
+        self._finished = False
+        self._keyframe_interval = keyframe_interval
+
+    def _write_event(self, tick: int, code: int):
+        """Écrit un événement encodé en delta de pas."""
+        write_varint(self._data, ((tick - self._last_tick) << EVENT_BITS) | code)
+        self._last_tick = tick
+
+    def record(self, tick: int, direction: str):
+        """
+        Enregistre une direction acceptée par le moteur. Une direction
+        identique à la dernière enregistrée est ignorée : le moteur la
+        suivait déjà (les bots la redonnent à chaque pas).
+
+        Args:
+            tick: Nombre de pas déjà simulés quand la direction a été donnée.
+            direction: Direction acceptée.
+        """
+        if self._finished or direction == self._last_direction:
+            return
+        self._write_event(tick, ACTION_DIRECTIONS.index(direction))
+        self._last_direction = direction
+
+    def on_step(self, engine: GameEngine):
+        """
+        À appeler après chaque pas du moteur : écrit une image clé
+        tous les keyframe_interval pas.
+
+        Args:
+            engine: Le moteur de la partie enregistrée.
+        """
+        if (self._finished or not self._keyframe_interval or not engine.alive
+                or engine.ticks % self._keyframe_interval):
+            return
+
+        snapshot = engine.snapshot()
+        self._write_event(engine.ticks, EVENT_KEYFRAME)
+        write_varint(self._data, len(snapshot))
+        self._data += snapshot
+
+    def finish(self, tick: int) -> bytes:
+        """
+        Termine l'enregistrement.
+
+        Args:
+            tick: Nombre total de pas de la partie.
+
+        Returns:
+            Le replay complet.
+        """
+        if not self._finished:
+            self._write_event(tick, EVENT_END)
+            self._finished = True
+        return bytes(self._data)
+
+    def save(self, path: str):
+        """
+        Écrit le replay dans un fichier.
+
+        Args:
+            path: Chemin du fichier.
+        """
+        with open(path, "wb") as f:
+            f.write(self._data)
+
+    @property
+    def data(self) -> bytes:
+        """Octets enregistrés jusqu'ici."""
+        return bytes(self._data)
+
+
+def read_replay(data: bytes) -> Replay:
+    """
+    Décode un replay.
+
+    Args:
+        data: Contenu du fichier replay.
+
+    Returns:
+        Le replay décodé.
+
+    Raises:
+        ValueError: Si les données ne sont pas un replay valide ou ont été
+            enregistrées avec une autre configuration de jeu.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Ce fichier n'est pas un replay Snake")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Version de replay non supportée: {data[len(MAGIC)]}")
+
+    pos = len(MAGIC) + 1
+    header = []
+    for _ in range(7):
+        value, pos = read_varint(data, pos)
+        header.append(value)
+    seed, cols, rows, start_col, start_row, zone_cols, zone_rows = header
+
+    if (start_col, start_row, zone_cols, zone_rows) != (
+            SNAKE_START_COL, SNAKE_START_ROW, SCORE_ZONE_COLS, SCORE_ZONE_ROWS):
+        raise ValueError("Replay enregistré avec une autre configuration")
+
+    events: List[Tuple[int, str]] = []
+    keyframes: List[Tuple[int, int, bytes]] = []
+    end_tick = None
+    tick = 0
+    while pos < len(data):
+        value, pos = read_varint(data, pos)
+        tick += value >> EVENT_BITS
+        code = value & ((1 << EVENT_BITS) - 1)
+        if code == EVENT_END:
+            end_tick = tick
+            break
+        if code == EVENT_KEYFRAME:
+            size, pos = read_varint(data, pos)
+            if pos + size > len(data):
+                raise ValueError("Replay tronqué")
+            keyframes.append((tick, len(events), bytes(data[pos:pos + size])))
+            pos += size
+        elif code < len(ACTION_DIRECTIONS):
+            events.append((tick, ACTION_DIRECTIONS[code]))
+        else:
+            raise ValueError(f"Événement de replay inconnu: {code}")
+
+    return Replay(seed, cols, rows, events, end_tick, keyframes)
+
+
+def load_replay(path: str) -> Replay:
+    """
+    Lit et décode un fichier replay.
+
+    Args:
+        path: Chemin du fichier.
+
+    Returns:
+        Le replay décodé.
+    """
+    with open(path, "rb") as f:
+        return read_replay(f.read())
+
+
+def tick_delay(score: int) -> float:
+    """
+    Retourne le délai entre deux pas en temps réel, comme en jeu.
+
+    Args:
+        score: Score courant de la partie.
+
+    Returns:
+        Délai en secondes.
+    """
+    return max(SPEED_MIN, SPEED_INITIAL - score * SPEED_DECREASE_PER_POINT)
+
+
+class ReplayPlayer:
+    """
+    Rejoue une partie enregistrée dans un GameEngine.
+    seek() repart de la dernière image clé précédant le pas demandé
+    et ne re-simule que les pas restants.
+
+    Méthodes publiques:
+        - seek(tick: int): Place la lecture au pas donné
+        - step() -> StepResult: Avance la lecture d'un pas
+        - play(speed: str, on_step: Callable): Lit la partie jusqu'à la fin
+        - engine (propriété): Le moteur rejoué
+        - end_tick (propriété): Dernier pas de la partie (None si interrompue sans fin)
+        - finished (propriété): True si la lecture est arrivée à la fin
+    """
+
+    def __init__(self, replay: Replay):
+        """
+        Prépare la lecture d'un replay, positionnée au début de la partie.
+
+        Args:
+            replay: Le replay décodé.
+        """
+        self._replay = replay
+        self._engine = GameEngine(replay.cols, replay.rows, seed=replay.seed)
+        self._keyframe_ticks = [tick for tick, _, _ in replay.keyframes]
+        self._event_index = 0
+
+    def seek(self, tick: int):
+        """
+        Place la lecture au pas donné (borné à la fin de la partie).
+
+        Args:
+            tick: Pas à atteindre.
+        """
+        tick = max(0, tick)
+        if self.end_tick is not None:
+            tick = min(tick, self.end_tick)
+
+        # Repartir de l'image clé la plus proche, ou du début
+        k = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        if k >= 0:
+            _, self._event_index, snapshot = self._replay.keyframes[k]
+            self._engine.restore(snapshot)
+        else:
+            self._engine.reset(self._replay.seed)
+            self._event_index = 0
+
+        while self._engine.ticks < tick and not self.finished:
+            if not self.step().moved:
+                break
+
+    def step(self) -> StepResult:
+        """
+        Avance la lecture d'un pas en appliquant les directions enregistrées.
+
+        Returns:
+            Le résultat du pas du moteur.
+        """
+        engine = self._engine
+        events = self._replay.events
+        # Appliquer les directions données avant ce pas
+        while (self._event_index < len(events)
+               and events[self._event_index][0] <= engine.ticks):
+            engine.set_direction(events[self._event_index][1])
+            self._event_index += 1
+        return engine.step()
+
+    def play(self, speed: str = SPEED_UNCAPPED,
+             on_step: Optional[Callable[[StepResult], None]] = None):
+        """
+        Lit la partie depuis la position courante jusqu'à la fin.
+
+        Args:
+            speed: SPEED_REALTIME (vitesse du jeu) ou SPEED_UNCAPPED (sans attente).
+            on_step: Fonction appelée après chaque pas avec son résultat.
+        """
+        while not self.finished:
+            result = self.step()
+            if on_step is not None:
+                on_step(result)
+            if not result.moved:
+                break
+            if speed == SPEED_REALTIME:
+                time.sleep(tick_delay(self._engine.score))
+
+    @property
+    def engine(self) -> GameEngine:
+        """Le moteur rejoué."""
+        return self._engine
+
+    @property
+    def end_tick(self) -> Optional[int]:
+        """Dernier pas de la partie (None si le replay n'a pas de fin)."""
+        return self._replay.end_tick
+
+    @property
+    def finished(self) -> bool:
+        """True si la lecture est arrivée à la fin de la partie."""
+        if not self._engine.alive:
+            return True
+        return self.end_tick is not None and self._engine.ticks >= self.end_tick
+
+
+def simulate_replay(replay: Replay, until_tick: Optional[int] = None) -> GameEngine:
+    """
+    Re-simule une partie enregistrée.
+
+    Args:
+        replay: Le replay décodé.
+        until_tick: Pas auquel s'arrêter (None pour la fin de la partie).
+
+    Returns:
+        Le moteur dans l'état atteint.
+    """
+    player = ReplayPlayer(replay)
+    if until_tick is None:
+        player.play()
+    else:
+        player.seek(until_tick)
+    return player.engine
+
+
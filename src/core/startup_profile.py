@@ -0,0 +1,82 @@
+"""
+Profil du démarrage - Durée de chaque phase jusqu'à la première image
+
+Utilisé par `main.py --startup-profile` pour repérer les régressions du
+temps de lancement (imports, fenêtre, images, audio...). Ce module ne
+doit rien importer de coûteux : il est chargé avant tout le reste.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, TextIO, Tuple
+
+
+class StartupProfile:
+    """
+    Mesure la durée des phases du démarrage avec time.perf_counter().
+    Un profil désactivé ne mesure rien et n'affiche rien.
+
+    Méthodes publiques:
+        - phase(name: str): Gestionnaire de contexte qui mesure une phase
+        - report(output: TextIO): Affiche la durée de chaque phase et le total
+        - enabled (propriété): True si le profil mesure les phases
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Commence la mesure du démarrage.
+
+        Args:
+            enabled: False pour un profil qui ne mesure rien.
+        """
+        self._enabled = enabled
+        self._start = time.perf_counter()
+        self._phases: List[Tuple[str, float]] = []
+        self._reported = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Mesure la durée du bloc.
+
+        Args:
+            name: Nom de la phase dans le rapport.
+        """
+        if not self._enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def report(self, output: TextIO = sys.stdout):
+        """
+        Affiche la durée de chaque phase (une seule fois), puis le temps
+        écoulé depuis la création du profil.
+
+        Args:
+            output: Flux où écrire le rapport.
+        """
+        if not self._enabled or self._reported:
+            return
+        self._reported = True
+
+        total = time.perf_counter() - self._start
+        measured = sum(seconds for _, seconds in self._phases)
+        width = max([len(name) for name, _ in self._phases] + [len("autres")])
+
+        print("=== Démarrage ===", file=output)
+        for name, seconds in self._phases + [("autres", total - measured)]:
+            share = seconds / total * 100 if total > 0 else 0.0
+            print(f"{name:<{width}}  {seconds * 1000:8.1f} ms  {share:5.1f} %", file=output)
+        print(f"{'total':<{width}}  {total * 1000:8.1f} ms (première image)", file=output)
+        output.flush()
+
+    @property
+    def enabled(self) -> bool:
+        """True si le profil mesure les phases."""
+        return self._enabled
@@ -0,0 +1,408 @@
+"""
+Front-end terminal - Le jeu Snake dans un terminal avec curses
+
+Pour jouer par SSH ou sur une machine sans écran : le plateau est dessiné
+en caractères (deux colonnes par case). Un double tampon mémorise ce qui
+est affiché : à chaque pas, seules les cases modifiées sont réécrites.
+"""
+
+import os
+import random
+import time
+from typing import Dict, List, Optional
+
+from src.config import (
+    WINDOW_TITLE,
+    KEY_UP,
+    KEY_DOWN,
+    KEY_LEFT,
+    KEY_RIGHT,
+    KEY_ARROW_UP,
+    KEY_ARROW_DOWN,
+    KEY_ARROW_LEFT,
+    KEY_ARROW_RIGHT,
+    KEY_PAUSE,
+    KEY_QUIT,
+    KEY_REPLAY,
+    DIRECTION_UP,
+    DIRECTION_DOWN,
+    DIRECTION_LEFT,
+    DIRECTION_RIGHT,
+)
+from src.core.engine import Cell, GameEngine, SEED_BITS
+from src.core.replay import ReplayRecorder, tick_delay
+from src.managers.score_manager import load_highscore, write_highscore
+
+try:
+    import curses
+except ImportError:
+    curses = None  # type: ignore
+
+# Contenu d'une case dans les tampons
+GLYPH_EMPTY = 0
+GLYPH_BODY = 1
+GLYPH_HEAD = 2
+GLYPH_APPLE = 3
+
+# Caractères de chaque contenu (deux colonnes par case)
+GLYPH_TEXT = {
+    GLYPH_EMPTY: "  ",
+    GLYPH_BODY: "[]",
+    GLYPH_HEAD: "@@",
+    GLYPH_APPLE: "()",
+}
+
+# Directions associées aux touches de déplacement
+KEY_DIRECTIONS = {
+    KEY_UP: DIRECTION_UP,
+    KEY_DOWN: DIRECTION_DOWN,
+    KEY_LEFT: DIRECTION_LEFT,
+    KEY_RIGHT: DIRECTION_RIGHT,
+    KEY_ARROW_UP: DIRECTION_UP,
+    KEY_ARROW_DOWN: DIRECTION_DOWN,
+    KEY_ARROW_LEFT: DIRECTION_LEFT,
+    KEY_ARROW_RIGHT: DIRECTION_RIGHT,
+}
+
+
+def curses_keys(name: str) -> List[int]:
+    """
+    Convertit un nom de touche Tk (constantes KEY_* de config.py)
+    en codes de touche curses.
+
+    Args:
+        name: Nom de la touche ("z", "Up", "Escape", "space"...).
+
+    Returns:
+        Les codes curses correspondants (minuscule et majuscule pour une lettre).
+    """
+    special = {
+        "Up": curses.KEY_UP,
+        "Down": curses.KEY_DOWN,
+        "Left": curses.KEY_LEFT,
+        "Right": curses.KEY_RIGHT,
+        "Escape": 27,
+        "space": ord(" "),
+        "Return": ord("\n"),
+    }
+    if name in special:
+        return [special[name]]
+    if len(name) == 1:
+        return sorted({ord(name.lower()), ord(name.upper())})
+    raise ValueError(f"Touche non supportée en mode terminal: {name}")
+
+
+class TuiGame:
+    """
+    Jeu Snake dans un terminal (curses).
+    Les règles, l'enregistrement des replays et le highscore sont
+    partagés avec la version Turtle.
+
+    Méthodes publiques:
+        - run(): Lance le jeu jusqu'à ce que le joueur quitte
+    """
+
+    def __init__(self, seed: Optional[int] = None, replay_dir: Optional[str] = None):
+        """
+        Initialise le jeu.
+
+        Args:
+            seed: Graine de la session (None pour une graine aléatoire).
+            replay_dir: Dossier où enregistrer le replay de chaque partie
+                (None pour ne pas les sauvegarder).
+        """
+        if curses is None:
+            raise ImportError("curses est requis pour le mode terminal")
+
+        self._rng = random.Random(seed)
+        self._replay_dir = replay_dir
+        self._engine = GameEngine(seed=self._rng.getrandbits(SEED_BITS))
+        self._recorder = self._create_recorder()
+        self._highscore = load_highscore()
+
+        self._key_directions: Dict[int, str] = {}
+        for key, direction in KEY_DIRECTIONS.items():
+            for code in curses_keys(key):
+                self._key_directions[code] = direction
+        self._keys_pause = curses_keys(KEY_PAUSE)
+        self._keys_quit = curses_keys(KEY_QUIT)
+        self._keys_replay = curses_keys(KEY_REPLAY)
+
+        cells = self._engine.cols * self._engine.rows
+        # Double tampon : _front est ce qui est affiché, _back ce qui doit l'être
+        self._front = bytearray(cells)
+        self._back = bytearray(cells)
+        self._dirty: List[int] = []
+        self._status: Optional[str] = None
+        # Messages affichés après la fermeture de l'écran curses
+        self._messages: List[str] = []
+
+        self._stdscr = None
+        self._colors: Dict[int, int] = {}
+        self._running = False
+        self._paused = False
+        self._game_over = False
+        # Terminal devenu trop petit : la partie est suspendue et rien n'est dessiné
+        self._too_small = False
+
+    def _create_recorder(self) -> ReplayRecorder:
+        """Commence l'enregistrement de la partie en cours du moteur."""
+        return ReplayRecorder(self._engine.seed, self._engine.cols, self._engine.rows)
+
+    def _finish_recording(self):
+        """Termine l'enregistrement de la partie et le sauvegarde si demandé."""
+        self._recorder.finish(self._engine.ticks)
+        if not self._replay_dir:
+            return
+
+        filename = f"replay_{time.strftime('%Y%m%d_%H%M%S')}_{self._engine.seed:016x}.snkr"
+        try:
+            os.makedirs(self._replay_dir, exist_ok=True)
+            self._recorder.save(os.path.join(self._replay_dir, filename))
+        except (IOError, OSError) as e:
+            self._messages.append(f"Avertissement: Impossible de sauvegarder le replay - {e}")
+
+    def _index(self, cell: Cell) -> int:
+        """Indice d'une case dans les tampons."""
+        col, row = cell
+        return row * self._engine.cols + col
+
+    def _set(self, cell: Optional[Cell], glyph: int):
+        """
+        Écrit le contenu d'une case dans le tampon arrière.
+
+        Args:
+            cell: Case à modifier (None est ignoré).
+            glyph: Nouveau contenu (GLYPH_*).
+        """
+        if cell is None:
+            return
+        index = self._index(cell)
+        if self._back[index] != glyph:
+            self._back[index] = glyph
+            self._dirty.append(index)
+
+    def _fill_back(self):
+        """Reconstruit tout le tampon arrière depuis le moteur (nouvelle partie)."""
+        for index in range(len(self._back)):
+            if self._back[index] != GLYPH_EMPTY:
+                self._back[index] = GLYPH_EMPTY
+                self._dirty.append(index)
+        engine = self._engine
+        self._set(engine.apple, GLYPH_APPLE)
+        for cell in engine.body[1:]:
+            self._set(cell, GLYPH_BODY)
+        self._set(engine.head, GLYPH_HEAD)
+
+    def _setup_screen(self, stdscr):
+        """Configure le terminal (sans écho, touches spéciales, couleurs)."""
+        self._stdscr = stdscr
+        curses.curs_set(0)
+        stdscr.keypad(True)
+
+        self._colors = {glyph: curses.A_NORMAL for glyph in GLYPH_TEXT}
+        if curses.has_colors():
+            curses.start_color()
+            curses.use_default_colors()
+            for pair, (glyph, color, attr) in enumerate((
+                    (GLYPH_BODY, curses.COLOR_GREEN, curses.A_NORMAL),
+                    (GLYPH_HEAD, curses.COLOR_YELLOW, curses.A_BOLD),
+                    (GLYPH_APPLE, curses.COLOR_RED, curses.A_BOLD)), start=1):
+                curses.init_pair(pair, color, -1)
+                self._colors[glyph] = curses.color_pair(pair) | attr
+
+    def _fits(self) -> bool:
+        """Indique si le terminal est assez grand pour le plateau."""
+        height, width = self._stdscr.getmaxyx()
+        return height >= self._engine.rows + 3 and width >= 2 * self._engine.cols + 2
+
+    def _size_message(self) -> str:
+        """Message affiché quand le terminal est trop petit pour le plateau."""
+        return (f"Terminal trop petit: {2 * self._engine.cols + 2}x"
+                f"{self._engine.rows + 3} caractères nécessaires")
+
+    def _draw_frame(self):
+        """
+        Efface l'écran et dessine le cadre ; tout le plateau sera réécrit.
+        Si le terminal est trop petit, seul un message est affiché et la
+        partie reste suspendue jusqu'au prochain redimensionnement.
+        """
+        stdscr = self._stdscr
+        stdscr.erase()
+        self._too_small = not self._fits()
+        if self._too_small:
+            width = stdscr.getmaxyx()[1]
+            try:
+                stdscr.addstr(0, 0, self._size_message()[:max(0, width - 1)])
+            except curses.error:
+                pass
+            stdscr.noutrefresh()
+            curses.doupdate()
+            return
+
+        cols, rows = self._engine.cols, self._engine.rows
+        horizontal = "+" + "-" * (2 * cols) + "+"
+        stdscr.addstr(0, 0, horizontal)
+        for y in range(1, rows + 1):
+            stdscr.addstr(y, 0, "|")
+            stdscr.addstr(y, 2 * cols + 1, "|")
+        stdscr.addstr(rows + 1, 0, horizontal)
+
+        # L'écran est vide : toutes les cases non vides sont à réécrire
+        self._front = bytearray(len(self._back))
+        self._dirty = [i for i, glyph in enumerate(self._back) if glyph != GLYPH_EMPTY]
+        self._status = None
+
+    def _flush(self):
+        """Réécrit uniquement les cases qui diffèrent de ce qui est affiché."""
+        if self._too_small:
+            # Les cases modifiées seront réécrites par le prochain _draw_frame()
+            return
+
+        stdscr = self._stdscr
+        cols, rows = self._engine.cols, self._engine.rows
+        try:
+            for index in self._dirty:
+                glyph = self._back[index]
+                if self._front[index] == glyph:
+                    continue
+                self._front[index] = glyph
+                col, row = index % cols, index // cols
+                stdscr.addstr(rows - row, 1 + 2 * col, GLYPH_TEXT[glyph], self._colors[glyph])
+            self._dirty.clear()
+
+            status = self._status_text()
+            if status != self._status:
+                self._status = status
+                width = self._stdscr.getmaxyx()[1]
+                stdscr.move(rows + 2, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(rows + 2, 0, status[:width - 1])
+        except curses.error:
+            # Terminal réduit avant que KEY_RESIZE ne soit lu : _draw_frame()
+            # réécrira tout le plateau
+            return
+
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+    def _status_text(self) -> str:
+        """Ligne d'état sous le plateau."""
+        text = f"{WINDOW_TITLE} | Score: {self._engine.score} | Highscore: {self._highscore}"
+        if self._game_over:
+            return text + " | GAME OVER - ESPACE : Rejouer | X : Quitter"
+        if self._paused:
+            return text + " | PAUSE - ESC : Reprendre"
+        return text + " | ZQSD/Flèches : Déplacer | ESC : Pause | X : Quitter"
+
+    def _set_direction(self, direction: str):
+        """Change la direction du serpent et l'enregistre si elle est acceptée."""
+        if self._engine.set_direction(direction):
+            self._recorder.record(self._engine.ticks, direction)
+
+    def _start_game(self):
+        """Démarre la partie en cours du moteur."""
+        self._game_over = False
+        self._paused = False
+        self._fill_back()
+        # Pas de compte à rebours : départ immédiat vers la droite
+        self._set_direction(DIRECTION_RIGHT)
+
+    def _restart_game(self):
+        """Commence une nouvelle partie."""
+        self._engine.reset(self._rng.getrandbits(SEED_BITS))
+        self._recorder = self._create_recorder()
+        self._start_game()
+
+    def _tick(self):
+        """Avance la partie d'un pas et met à jour le tampon arrière."""
+        engine = self._engine
+        previous_head = engine.head
+        result = engine.step()
+        if not result.moved:
+            return
+        if result.dead:
+            self._finish_recording()
+            self._game_over = True
+            if engine.score > self._highscore:
+                self._highscore = engine.score
+                write_highscore(self._highscore)
+            return
+        self._recorder.on_step(engine)
+
+        # Seules trois ou quatre cases changent à chaque pas
+        if not result.ate:
+            self._set(engine.cell_at(engine.length + 1), GLYPH_EMPTY)
+        if engine.length:
+            self._set(previous_head, GLYPH_BODY)
+        self._set(engine.head, GLYPH_HEAD)
+        if result.ate:
+            self._set(engine.apple, GLYPH_APPLE)
+
+    def _handle_key(self, key: int):
+        """
+        Traite une touche.
+
+        Args:
+            key: Code de touche curses.
+        """
+        if key in self._keys_quit:
+            self._running = False
+        elif key == curses.KEY_RESIZE:
+            self._draw_frame()
+        elif key in self._keys_pause and not self._game_over:
+            self._paused = not self._paused
+        elif key in self._keys_replay and self._game_over:
+            self._restart_game()
+        elif key in self._key_directions and not self._game_over and not self._paused:
+            self._set_direction(self._key_directions[key])
+
+    def _main(self, stdscr):
+        """Boucle principale (appelée par curses.wrapper)."""
+        self._setup_screen(stdscr)
+        if not self._fits():
+            self._messages.append(self._size_message())
+            return
+
+        self._draw_frame()
+        self._start_game()
+        self._running = True
+
+        next_tick = time.perf_counter()
+        while self._running:
+            # Attendre une touche jusqu'au prochain pas, puis lire celles en attente
+            wait = max(0.0, next_tick - time.perf_counter())
+            stdscr.timeout(int(wait * 1000))
+            key = stdscr.getch()
+            while key != -1 and self._running:
+                self._handle_key(key)
+                stdscr.timeout(0)
+                key = stdscr.getch()
+
+            now = time.perf_counter()
+            if self._paused or self._game_over or self._too_small:
+                next_tick = now + tick_delay(self._engine.score)
+            elif now >= next_tick:
+                self._tick()
+                next_tick += tick_delay(self._engine.score)
+                if next_tick < now:
+                    # Trop de retard : ne pas rattraper les pas manqués
+                    next_tick = now + tick_delay(self._engine.score)
+
+            self._flush()
+
+    def run(self):
+        """Lance le jeu dans le terminal jusqu'à ce que le joueur quitte."""
+        # Touche Échap sans délai (25 ms au lieu d'une seconde)
+        os.environ.setdefault("ESCDELAY", "25")
+        try:
+            curses.wrapper(self._main)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if not self._game_over:
+                self._finish_recording()
+
+        for message in self._messages:
+            print(message)
+        print(f"Score: {self._engine.score} | Highscore: {self._highscore}")
@@ -0,0 +1,49 @@
+"""
+Encodage varint (LEB128) des entiers positifs
+
+Utilisé par les replays et les instantanés du moteur : les petites
+valeurs (deltas de pas, indices de cases) tiennent sur un seul octet.
+"""
+
+from typing import Tuple
+
+
+def write_varint(buffer: bytearray, value: int):
+    """
+    Ajoute un entier positif encodé en varint (LEB128) à un tampon.
+
+    Args:
+        buffer: Tampon de destination.
+        value: Entier positif ou nul.
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """
+    Lit un entier encodé en varint (LEB128).
+
+    Args:
+        data: Données à lire.
+        pos: Position de départ.
+
+    Returns:
+        Tuple (valeur, position suivante).
+
+    Raises:
+        ValueError: Si les données sont tronquées.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Données varint tronquées")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
@@ -1,333 +1,276 @@
 """
-Classe Snake - Gestion du serpent dans le jeu
+Classe Snake - Affichage du serpent dans le jeu
 """
 
 import turtle
-from typing import List, Tuple, TYPE_CHECKING
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from turtle import _Screen
-
-from PIL import Image
+    from src.core.engine import Cell, GameEngine
+    from src.managers.turtle_pool import TurtlePool
+    from src.render.sprite_atlas import SpriteAtlas
 
 from src.config import (
-    HEAD_IMAGE,
-    BODY_IMAGE,
-    IMAGE_SIZE,
-    TEMP_HEAD_NORTH_GIF,
-    TEMP_HEAD_SOUTH_GIF,
-    TEMP_HEAD_EAST_GIF,
-    TEMP_HEAD_WEST_GIF,
-    TEMP_BODY_GIF,
-    SNAKE_START_X,
-    SNAKE_START_Y,
     SNAKE_BODY_COLOR,
     CELL_SIZE,
-    BOUNDARY_X,
-    BOUNDARY_Y,
     DIRECTION_UP,
     DIRECTION_DOWN,
     DIRECTION_LEFT,
     DIRECTION_RIGHT,
     DIRECTION_STOP,
-    OPPOSITE_DIRECTIONS,
-    TRAIL_LENGTH,
-    TRAIL_COLORS,
 )
+from src.core.engine import cell_to_pixel
+from src.entities.trail import Trail
+
+# Images de la tête dans l'atlas (une par angle de HEAD_ROTATIONS)
+HEAD_NORTH, HEAD_SOUTH, HEAD_EAST, HEAD_WEST = (f"head_{i}" for i in range(4))
+
+# Image de la tête à afficher selon la direction
+HEAD_FRAMES = {
+    DIRECTION_UP: HEAD_SOUTH,
+    DIRECTION_DOWN: HEAD_NORTH,
+    DIRECTION_LEFT: HEAD_EAST,
+    DIRECTION_RIGHT: HEAD_WEST,
+}
 
 
 class Snake:
     """
-    Représente le serpent contrôlé par le joueur.
-    Inclut des animations fluides et une trainée visuelle.
+    Vue du serpent contrôlé par le joueur.
+    L'état (cases, direction, collisions) appartient au GameEngine ;
+    cette classe ne fait que l'afficher, avec une trainée visuelle.
+    Entre deux pas, la tête et la queue glissent d'une case à l'autre
+    (voir interpolate()).
 
     Méthodes publiques:
-        - move(): Déplace le serpent dans la direction actuelle avec animation fluide
+        - move(): Déplace les sprites selon le dernier pas du moteur
+        - interpolate(alpha: float): Place la tête et la queue entre deux cases
         - hide_trail(): Cache la trainée du serpent
-        - set_direction(direction: str): Change la direction du serpent (empêche les demi-tours)
-        - grow(): Ajoute un segment au corps du serpent
-        - check_wall_collision() -> bool: Vérifie si le serpent touche les bords
-        - check_self_collision() -> bool: Vérifie si le serpent se mord la queue
-        - get_head_position() -> Tuple[float, float]: Retourne la position de la tête
-        - get_all_positions() -> List[Tuple[float, float]]: Retourne toutes les positions occupées
+        - set_direction(direction: str) -> bool: Change la direction du serpent (empêche les demi-tours)
+        - grow(cell: Cell): Ajoute un segment au corps du serpent
+        - get_head_cell() -> Cell: Retourne la case de la tête
+        - get_all_cells() -> List[Cell]: Retourne toutes les cases occupées
         - is_moving (propriété): Retourne True si le serpent est en mouvement
         - reset(): Réinitialise le serpent à son état initial
+        - sync(): Replace tous les sprites selon l'état du moteur
         - get_body_turtles() -> List[turtle.Turtle]: Retourne la liste des turtles du corps
         - hide_head(): Cache la tête du serpent
         - show_head(): Affiche la tête du serpent
         - cleanup(): Nettoie toutes les ressources du serpent
     """
 
-    def __init__(self, screen: "_Screen"):
+    def __init__(self, screen: "_Screen", engine: "GameEngine", pool: "TurtlePool",
+                 atlas: "SpriteAtlas"):
         """
         Initialise le serpent.
 
         Args:
             screen: L'écran Turtle sur lequel afficher le serpent.
+            engine: Le moteur de jeu dont le serpent est la vue.
+            pool: Réserve de turtles où emprunter les segments du corps.
+            atlas: Atlas des sprites (tête dans chaque orientation, corps).
         """
         self._screen = screen
-        self._direction = DIRECTION_STOP
-        # Pour éviter les changements multiples par frame
-        self._next_direction = DIRECTION_STOP
-        self._body: List[turtle.Turtle] = []  # Segments du corps
-        # Historique des positions
-        self._positions: List[Tuple[float, float]] = []
-        self._length = 0  # Longueur du serpent
-
-        self._trail_turtles: List[turtle.Turtle] = []  # Trainée visuelle
-        self._init_trail()
-
-        # Préparer les images
-        self._prepare_images()
+        self._engine = engine
+        self._pool = pool
+        # Segments du corps, du cou vers la queue (rotation en O(1))
+        self._body: Deque[turtle.Turtle] = deque()
+
+        self._trail = Trail(self._engine, self._pool)  # Trainée visuelle
+
+        # Images de l'atlas (formes par défaut si elles sont introuvables)
+        self._head_default = atlas.frame(HEAD_NORTH)
+        self._head_shapes: Dict[str, str] = {
+            direction: atlas.frame(frame) for direction, frame in HEAD_FRAMES.items()
+        }
+        self._body_shape = atlas.frame("body", default="square")
+
+        # Glissement entre deux pas : départ et arrivée (en pixels) de la
+        # tête et de la queue. La case quittée par la queue est couverte
+        # par un segment fantôme qui rejoint la nouvelle queue.
+        self._head_from: Tuple[float, float] = cell_to_pixel(self._engine.head)
+        self._head_to: Tuple[float, float] = self._head_from
+        self._tail_from: Optional[Tuple[float, float]] = None
+        self._tail_to: Optional[Tuple[float, float]] = None
+        self._tail_ghost = self._pool.acquire("snake_body", self._setup_segment)
 
         # Créer la tête du serpent
-        self._head = turtle.Turtle()
-        self._head.speed(0)
-        self._head.shape(TEMP_HEAD_NORTH_GIF)
+        self._head = self._pool.acquire("snake_head")
+        self._head.shape(self._head_default)
         self._head.shapesize(1)
         self._head.color("black")
-        self._head.penup()
-        self._head.goto(SNAKE_START_X, SNAKE_START_Y)
-
-        # Ajouter la position initiale
-        self._positions.append(self._head.position())
-
-    def _init_trail(self):
-        """Initialise les turtles pour la trainée visuelle."""
-        for i in range(TRAIL_LENGTH):
-            t = turtle.Turtle()
-            t.speed(0)
-            t.shape("circle")
-            # Taille décroissante
-            size = max(0.3, 1.0 - (i * 0.15))
-            t.shapesize(size, size)
-            # Couleur de la trainée
-            color_index = min(i, len(TRAIL_COLORS) - 1)
-            t.color(TRAIL_COLORS[color_index])
-            t.penup()
-            t.hideturtle()
-            self._trail_turtles.append(t)
-
-    def _prepare_images(self):
-        """Prépare toutes les images du serpent."""
-        try:
-            # Image de la tête
-            head_image = Image.open(HEAD_IMAGE)
-            head_image.thumbnail(IMAGE_SIZE)
-
-            # Sauvegarder les rotations pour chaque direction
-            head_image.save(TEMP_HEAD_NORTH_GIF)  # Nord (par défaut)
-
-            head_south = head_image.rotate(180)
-            head_south.save(TEMP_HEAD_SOUTH_GIF)
-
-            head_east = head_image.rotate(270)
-            head_east.save(TEMP_HEAD_EAST_GIF)
-
-            head_west = head_image.rotate(90)
-            head_west.save(TEMP_HEAD_WEST_GIF)
-
-            # Enregistrer les formes
-            self._screen.register_shape(TEMP_HEAD_NORTH_GIF)
-            self._screen.register_shape(TEMP_HEAD_SOUTH_GIF)
-            self._screen.register_shape(TEMP_HEAD_EAST_GIF)
-            self._screen.register_shape(TEMP_HEAD_WEST_GIF)
-
-        except (FileNotFoundError, OSError, IOError) as e:
-            print(
-                f"Avertissement: Impossible de charger l'image de la tête - {e}")
+        self._head.goto(cell_to_pixel(self._engine.head))
+        self._head.showturtle()
 
+    def _setup_segment(self, segment: turtle.Turtle):
+        """Configure un segment du corps nouvellement créé."""
         try:
-            # Image du corps
-            body_image = Image.open(BODY_IMAGE)
-            body_image.thumbnail(IMAGE_SIZE)
-            body_image.save(TEMP_BODY_GIF)
-            self._screen.register_shape(TEMP_BODY_GIF)
+            segment.shape(self._body_shape)
+        except turtle.TurtleGraphicsError:
+            segment.shape("square")
 
-        except (FileNotFoundError, OSError, IOError) as e:
-            print(
-                f"Avertissement: Impossible de charger l'image du corps - {e}")
+        segment.shapesize(CELL_SIZE // 20)
+        segment.color(SNAKE_BODY_COLOR)
 
     def move(self):
-        """Déplace le serpent dans la direction actuelle avec animation fluide."""
-        # Appliquer la direction en attente
-        self._direction = self._next_direction
-
-        if self._direction == DIRECTION_STOP:
+        """
+        Déplace les sprites du serpent selon le dernier pas du moteur.
+        La tête et la queue ne sont placées que par interpolate().
+        """
+        direction = self._engine.direction
+        if direction == DIRECTION_STOP:
             return
 
-        # Sauvegarder la position précédente
-        prev_x, prev_y = self._head.xcor(), self._head.ycor()
+        self._head.shape(self._head_shapes[direction])
+        prev_cell = self._engine.cell_at(1)
+        self._head_from = cell_to_pixel(prev_cell)
+        self._head_to = cell_to_pixel(self._engine.head)
+
+        # Déplacer le corps : le dernier segment prend la place de l'ancienne tête
+        # (si le serpent a grandi, la queue n'a pas bougé)
+        self._tail_from = self._tail_to = None
+        if self._engine.length > len(self._body):
+            self.grow(prev_cell)
+        elif self._body:
+            self._body[-1].goto(self._head_from)
+            self._body.rotate(1)
+            self._tail_from = cell_to_pixel(self._engine.cell_at(self._engine.length + 1))
+            self._tail_to = cell_to_pixel(self._engine.cell_at(self._engine.length))
 
-        # Calculer la nouvelle position
-        if self._direction == DIRECTION_UP:
-            self._head.shape(TEMP_HEAD_SOUTH_GIF)
-            new_x, new_y = prev_x, prev_y + CELL_SIZE
+        # Mettre à jour la trainée
+        self._update_trail()
 
-        elif self._direction == DIRECTION_DOWN:
-            self._head.shape(TEMP_HEAD_NORTH_GIF)
-            new_x, new_y = prev_x, prev_y - CELL_SIZE
+    def interpolate(self, alpha: float):
+        """
+        Place la tête et la queue entre leur case précédente et leur case
+        actuelle : deux sprites déplacés par image, quelle que soit la
+        longueur du serpent.
 
-        elif self._direction == DIRECTION_LEFT:
-            self._head.shape(TEMP_HEAD_EAST_GIF)
-            new_x, new_y = prev_x - CELL_SIZE, prev_y
+        Args:
+            alpha: Avancement depuis le dernier pas (0 : case précédente, 1 : case actuelle).
+        """
+        alpha = min(1.0, max(0.0, alpha))
+        (x0, y0), (x1, y1) = self._head_from, self._head_to
+        self._head.goto(x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
 
-        elif self._direction == DIRECTION_RIGHT:
-            self._head.shape(TEMP_HEAD_WEST_GIF)
-            new_x, new_y = prev_x + CELL_SIZE, prev_y
-        else:
+        if self._tail_from is None or alpha >= 1.0:
+            # Arrivé : le fantôme serait confondu avec la queue
+            self._tail_ghost.hideturtle()
             return
+        (x0, y0), (x1, y1) = self._tail_from, self._tail_to
+        self._tail_ghost.goto(x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
+        self._tail_ghost.showturtle()
 
-        # Déplacer la tête directement (plus fluide)
-        self._head.goto(new_x, new_y)
-
-        # Enregistrer la nouvelle position
-        self._positions.append(self._head.position())
-
-        # Déplacer le corps
-        if self._length > 0:
-            x, y = self._positions[-2]
-            self._body[-1].goto(x, y)
-            self._body.insert(0, self._body.pop())
-
-        # Mettre à jour la trainée
-        self._update_trail()
-
-        # Nettoyer les anciennes positions (garder plus pour la trainée)
-        max_positions = max(self._length + 1, TRAIL_LENGTH + 2)
-        if len(self._positions) > max_positions:
-            del self._positions[:-max_positions]
+    def _snap(self):
+        """Arrête le glissement : la tête est placée sur sa case."""
+        self._head_from = self._head_to = cell_to_pixel(self._engine.head)
+        self._tail_from = self._tail_to = None
+        self._tail_ghost.hideturtle()
 
     def _update_trail(self):
         """Met à jour la trainée visuelle derrière le serpent."""
         # Ne montrer la trainée que si le serpent bouge
-        if self._direction == DIRECTION_STOP or len(self._positions) < 2:
-            for t in self._trail_turtles:
-                t.hideturtle()
+        if not self.is_moving:
+            self.hide_trail()
             return
 
-        # Prendre les positions pour la trainée (après le corps)
-        body_end_index = -(self._length + 1) if self._length > 0 else -1
-        trail_positions = self._positions[:body_end_index][-TRAIL_LENGTH:]
-
-        for i, trail_turtle in enumerate(self._trail_turtles):
-            pos_index = len(trail_positions) - 1 - i
-            if pos_index >= 0 and pos_index < len(trail_positions):
-                trail_turtle.goto(trail_positions[pos_index])
-                trail_turtle.showturtle()
-            else:
-                trail_turtle.hideturtle()
+        self._trail.update()
 
     def hide_trail(self):
         """Cache la trainée du serpent."""
-        for t in self._trail_turtles:
-            t.hideturtle()
+        self._trail.hide()
 
-    def set_direction(self, direction: str):
+    def set_direction(self, direction: str) -> bool:
         """
         Change la direction du serpent.
         Empêche le demi-tour (aller dans la direction opposée).
 
         Args:
             direction: Nouvelle direction (Up, Down, Left, Right).
-        """
-        # Vérifier par rapport à la direction actuelle OU la prochaine direction
-        current = self._direction if self._direction != DIRECTION_STOP else self._next_direction
-        if current != OPPOSITE_DIRECTIONS.get(direction):
-            self._next_direction = direction
-
-    def grow(self):
-        """Ajoute un segment au corps du serpent."""
-        self._length += 1
-
-        # Créer un nouveau segment
-        segment = turtle.Turtle()
-        segment.speed(0)
-
-        try:
-            segment.shape(TEMP_BODY_GIF)
-        except turtle.TurtleGraphicsError:
-            segment.shape("square")
-
-        segment.shapesize(CELL_SIZE // 20)
-        segment.color(SNAKE_BODY_COLOR)
-        segment.penup()
-
-        # Placer le segment à la dernière position
-        if len(self._positions) >= self._length:
-            segment.goto(self._positions[-self._length])
-
-        self._body.append(segment)
-
-    def check_wall_collision(self) -> bool:
-        """
-        Vérifie si le serpent touche les bords.
 
         Returns:
-            True si collision, False sinon.
+            True si la direction a été acceptée, False sinon.
         """
-        x, y = self._head.xcor(), self._head.ycor()
-        return (
-            x > BOUNDARY_X or
-            x < -BOUNDARY_X or
-            y > BOUNDARY_Y or
-            y < -BOUNDARY_Y
-        )
-
-    def check_self_collision(self) -> bool:
+        return self._engine.set_direction(direction)
+
+    def grow(self, cell: "Cell"):
         """
-        Vérifie si le serpent se mord la queue.
+        Ajoute un segment au corps du serpent.
 
-        Returns:
-            True si collision, False sinon.
+        Args:
+            cell: Case du nouveau segment, juste derrière la tête.
         """
-        head_pos = self._head.position()
-        return head_pos in self._positions[:-1]
+        # Emprunter un segment (déjà configuré s'il a servi dans une partie précédente)
+        segment = self._pool.acquire("snake_body", self._setup_segment)
+        segment.goto(cell_to_pixel(cell))
+        segment.showturtle()
 
-    def get_head_position(self) -> Tuple[float, float]:
+        self._body.appendleft(segment)
+
+    def get_head_cell(self) -> "Cell":
         """
-        Retourne la position de la tête.
+        Retourne la case de la tête.
 
         Returns:
-            Tuple (x, y) de la position de la tête.
+            Tuple (colonne, ligne) de la tête.
         """
-        return self._head.position()
+        return self._engine.head
 
-    def get_all_positions(self) -> List[Tuple[float, float]]:
+    def get_all_cells(self) -> List["Cell"]:
         """
-        Retourne toutes les positions occupées par le serpent.
+        Retourne toutes les cases occupées par le serpent.
 
         Returns:
-            Liste des positions.
+            Liste des cases, de la tête vers la queue.
         """
-        return list(self._positions)
+        return self._engine.body
 
     @property
     def is_moving(self) -> bool:
         """Retourne True si le serpent est en mouvement."""
-        return self._direction != DIRECTION_STOP
+        return self._engine.direction != DIRECTION_STOP
 
     def reset(self):
-        """Réinitialise le serpent à son état initial."""
-        # Cacher et supprimer les segments du corps
+        """Réinitialise l'affichage du serpent selon l'état initial du moteur."""
+        # Rendre les segments du corps à la réserve
         for segment in self._body:
-            segment.goto(1000, 1000)
-            segment.hideturtle()
+            self._pool.release(segment)
 
         self._body.clear()
-        self._positions.clear()
-        self._length = 0
-        self._direction = DIRECTION_STOP
-        self._next_direction = DIRECTION_STOP
 
         # Cacher la trainée
         self.hide_trail()
 
         # Repositionner la tête
-        self._head.goto(SNAKE_START_X, SNAKE_START_Y)
-        self._head.shape(TEMP_HEAD_NORTH_GIF)
+        self._snap()
+        self._head.goto(self._head_to)
+        self._head.shape(self._head_default)
         self._head.showturtle()
-        self._positions.append(self._head.position())
+
+    def sync(self):
+        """
+        Replace tous les sprites selon l'état courant du moteur.
+        Utilisé après un saut dans un replay, quand le moteur n'a pas
+        avancé d'un seul pas.
+        """
+        # Ajuster le nombre de segments à la longueur du serpent
+        while len(self._body) > self._engine.length:
+            self._pool.release(self._body.pop())
+        while len(self._body) < self._engine.length:
+            self.grow(self._engine.cell_at(1))
+
+        for offset, segment in enumerate(self._body, start=1):
+            segment.goto(cell_to_pixel(self._engine.cell_at(offset)))
+
+        direction = self._engine.direction
+        self._head.shape(self._head_shapes.get(direction, self._head_default))
+        self._snap()
+        self._head.goto(self._head_to)
+        self._head.showturtle()
+
+        self._update_trail()
 
     def get_body_turtles(self) -> List[turtle.Turtle]:
         """
@@ -337,11 +280,12 @@ class Snake:
         Returns:
             Liste des segments du corps.
         """
-        return self._body.copy()
+        return list(self._body)
 
     def hide_head(self):
-        """Cache la tête du serpent."""
+        """Cache la tête du serpent (et le bout de queue qui glissait)."""
         self._head.hideturtle()
+        self._tail_ghost.hideturtle()
 
     def show_head(self):
         """Affiche la tête du serpent."""
@@ -355,8 +299,8 @@ class Snake:
             for segment in self._body:
                 segment.hideturtle()
                 segment.clear()
-            for t in self._trail_turtles:
-                t.hideturtle()
+            self._tail_ghost.hideturtle()
+            self._trail.cleanup()
         except (turtle.TurtleGraphicsError, Exception):
             # Ignorer toutes les erreurs liées à la destruction de la fenêtre
             pass
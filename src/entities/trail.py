@@ -0,0 +1,95 @@
+"""
+Classe Trail - Trainée visuelle derrière le serpent
+
+Les cases de la trainée sont celles que la queue vient de quitter : le
+moteur les garde juste derrière le corps dans son anneau de positions,
+elles sont lues une par une avec cell_at() (aucune liste copiée).
+"""
+
+import turtle
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.engine import Cell, GameEngine
+    from src.managers.turtle_pool import TurtlePool
+
+from src.config import (
+    TRAIL_LENGTH,
+    TRAIL_COLORS,
+    TRAIL_SIZE_START,
+    TRAIL_SIZE_STEP,
+    TRAIL_SIZE_MIN,
+)
+from src.core.engine import cell_to_pixel
+
+
+class Trail:
+    """
+    Trainée du serpent : un sprite par position, de plus en plus petit et
+    sombre en s'éloignant de la queue. Seuls les sprites dont la case a
+    changé sont déplacés.
+
+    Méthodes publiques:
+        - update(): Suit les dernières cases quittées par la queue
+        - hide(): Cache la trainée
+        - cleanup(): Rend les sprites de la trainée à la réserve
+    """
+
+    def __init__(self, engine: "GameEngine", pool: "TurtlePool",
+                 length: int = TRAIL_LENGTH, colors: Sequence[str] = TRAIL_COLORS):
+        """
+        Crée les sprites de la trainée (cachés).
+
+        Args:
+            engine: Le moteur dont l'anneau de positions est lu (son
+                historique doit couvrir au moins length cases).
+            pool: Réserve de turtles où emprunter les sprites.
+            length: Nombre de positions de la trainée.
+            colors: Couleurs de la plus proche à la plus éloignée de la queue
+                (la dernière est répétée si la trainée est plus longue).
+        """
+        self._engine = engine
+        self._pool = pool
+        self._sprites: List[turtle.Turtle] = []
+        # Case affichée par chaque sprite (None : sprite caché)
+        self._cells: List[Optional["Cell"]] = []
+
+        for i in range(length):
+            sprite = pool.acquire("snake_trail")
+            sprite.shape("circle")
+            # Taille décroissante
+            size = max(TRAIL_SIZE_MIN, TRAIL_SIZE_START - i * TRAIL_SIZE_STEP)
+            sprite.shapesize(size, size)
+            sprite.color(colors[min(i, len(colors) - 1)])
+            self._sprites.append(sprite)
+            self._cells.append(None)
+
+    def update(self):
+        """Place la trainée sur les dernières cases quittées par la queue."""
+        # Juste derrière la queue dans l'anneau du moteur
+        offset = self._engine.length + 1
+        for i, sprite in enumerate(self._sprites):
+            cell = self._engine.cell_at(offset + i)
+            if cell == self._cells[i]:
+                continue
+            if cell is None:
+                sprite.hideturtle()
+            else:
+                sprite.goto(cell_to_pixel(cell))
+                if self._cells[i] is None:
+                    sprite.showturtle()
+            self._cells[i] = cell
+
+    def hide(self):
+        """Cache la trainée."""
+        for i, sprite in enumerate(self._sprites):
+            if self._cells[i] is not None:
+                sprite.hideturtle()
+                self._cells[i] = None
+
+    def cleanup(self):
+        """Rend les sprites de la trainée à la réserve."""
+        for sprite in self._sprites:
+            self._pool.release(sprite)
+        self._sprites.clear()
+        self._cells.clear()
@@ -1,12 +1,20 @@
 """
 Gestionnaire d'animations pour le jeu Snake
+
+Toutes les animations (pulsation de la pomme, popups, compte à rebours,
+mort) sont des Tween avancés par une seule horloge : une passe par image
+et un seul screen.update(), au lieu d'une chaîne de screen.ontimer()
+par effet.
 """
 
+import time
 import turtle
-from typing import List, Tuple, Callable, Optional, TYPE_CHECKING
+from typing import List, Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from turtle import _Screen
+    from src.managers.turtle_pool import TurtlePool
+    from src.render.text_sprites import TextSpriteCache
 
 from src.config import (
     POPUP_DURATION,
@@ -18,22 +26,71 @@ from src.config import (
     COLOR_REPLAY_TEXT,
     DEATH_ANIMATION_STEPS,
     DEATH_ANIMATION_DELAY,
-    TRAIL_LENGTH,
-    TRAIL_COLORS,
     COUNTDOWN_DELAY,
     GO_DELAY,
     ANIMATION_FRAME_MS,
 )
 
+# Groupes d'animations (annulables ensemble avec AnimationManager.cancel)
+GROUP_EFFECTS = "effects"      # Popups
+GROUP_COUNTDOWN = "countdown"  # Compte à rebours
+GROUP_DEATH = "death"          # Mort du serpent
+GROUP_APPLE = "apple"          # Pulsation de la pomme
+
+
+class Tween:
+    """
+    Animation avancée par l'horloge d'AnimationManager : une fonction
+    appelée à chaque image avec l'avancement, de 0 à 1.
+
+    Méthodes publiques:
+        - cancel(): Arrête l'animation (sans appeler on_complete)
+        - active (propriété): True tant que l'animation n'est ni finie ni annulée
+    """
+
+    def __init__(self, duration_ms: float, update: Callable[[float], None],
+                 on_complete: Optional[Callable[[], None]], group: str,
+                 loop: bool, start: float):
+        """
+        Initialise l'animation (voir AnimationManager.add_tween).
+
+        Args:
+            duration_ms: Durée de l'animation (d'un cycle si loop) en millisecondes.
+            update: Fonction appelée à chaque image avec l'avancement.
+            on_complete: Fonction appelée à la fin (jamais si loop).
+            group: Groupe de l'animation.
+            loop: True pour recommencer indéfiniment.
+            start: Instant de départ (time.perf_counter()).
+        """
+        self.duration = max(duration_ms, 1) / 1000
+        self.update = update
+        self.on_complete = on_complete
+        self.group = group
+        self.loop = loop
+        self.start = start
+        self._active = True
+
+    def cancel(self):
+        """Arrête l'animation (sans appeler on_complete)."""
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """True tant que l'animation n'est ni finie ni annulée."""
+        return self._active
+
 
 class AnimationManager:
     """
     Gère toutes les animations du jeu Snake.
-    Utilise les timers Turtle pour des animations fluides.
+    Une seule horloge fait avancer toutes les animations : la boucle de
+    jeu l'avance à chaque image (advance()), et son propre timer prend le
+    relais quand le jeu est arrêté (compte à rebours, Game Over, pause).
 
     Méthodes publiques:
-        update_trail: Met à jour la trainée visuelle du serpent.
-        hide_trail: Cache toute la trainée.
+        add_tween: Ajoute une animation à l'horloge.
+        advance: Avance toutes les animations (sans mettre à jour l'écran).
+        cancel: Annule toutes les animations d'un groupe.
         show_score_popup: Affiche un popup animé qui monte et disparaît.
         show_countdown: Affiche le compte à rebours (3, 2, 1, GO!).
         show_game_over: Affiche l'écran Game Over.
@@ -43,60 +100,119 @@ class AnimationManager:
         cleanup: Nettoie toutes les ressources d'animation.
     """
 
-    def __init__(self, screen: "_Screen"):
+    def __init__(self, screen: "_Screen", pool: "TurtlePool", text_sprites: "TextSpriteCache"):
         """
         Initialise le gestionnaire d'animations.
 
         Args:
             screen: L'écran Turtle pour les animations.
+            pool: Réserve de turtles où emprunter les popups et les textes.
+            text_sprites: Cache des textes avec contour (compte à rebours, Game Over).
         """
         self._screen = screen
+        self._pool = pool
+        self._text_sprites = text_sprites
         self._popup_turtles: List[turtle.Turtle] = []
-        self._trail_turtles: List[turtle.Turtle] = []
         self._countdown_turtle: Optional[turtle.Turtle] = None
-        self._game_over_turtle: Optional[turtle.Turtle] = None
-
-        # Initialiser les turtles pour la trainée
-        self._init_trail_turtles()
-
-    def _init_trail_turtles(self):
-        """Crée les turtles pour la trainée du serpent."""
-        for i in range(TRAIL_LENGTH):
-            t = turtle.Turtle()
-            t.speed(0)
-            t.shape("circle")
-            t.shapesize(1.5 - (i * 0.2))  # Taille décroissante
-            t.color(TRAIL_COLORS[min(i, len(TRAIL_COLORS) - 1)])
-            t.penup()
-            t.hideturtle()
-            self._trail_turtles.append(t)
-
-    def update_trail(self, positions: List[Tuple[float, float]]):
+        self._game_over_lines: List[turtle.Turtle] = []  # Titre, score, record, rejouer
+
+        # Horloge des animations
+        self._tweens: List[Tween] = []
+        self._clock_running = False
+        self._last_advance = 0.0  # Instant de la dernière passe (perf_counter)
+
+    def add_tween(self, duration_ms: float, update: Callable[[float], None],
+                  on_complete: Optional[Callable[[], None]] = None,
+                  group: str = GROUP_EFFECTS, loop: bool = False) -> Tween:
         """
-        Met à jour la trainée visuelle du serpent.
+        Ajoute une animation à l'horloge ; update(0) est appelé tout de suite.
 
         Args:
-            positions: Liste des dernières positions du serpent.
+            duration_ms: Durée de l'animation (d'un cycle si loop) en millisecondes.
+            update: Fonction appelée à chaque image avec l'avancement (de 0 à 1).
+            on_complete: Fonction appelée une fois l'animation terminée.
+            group: Groupe de l'animation (voir cancel()).
+            loop: True pour recommencer indéfiniment (jusqu'à cancel()).
+
+        Returns:
+            L'animation, qui peut être annulée seule avec Tween.cancel().
         """
-        # Prendre les dernières positions (en excluant la tête)
-        trail_positions = positions[-(TRAIL_LENGTH + 2)                                    :-1] if len(positions) > 1 else []
-
-        for i, trail_turtle in enumerate(self._trail_turtles):
-            if i < len(trail_positions):
-                pos = trail_positions[-(i + 1)] if i + \
-                    1 <= len(trail_positions) else None
-                if pos:
-                    trail_turtle.goto(pos)
-                    trail_turtle.showturtle()
-                else:
-                    trail_turtle.hideturtle()
-            else:
-                trail_turtle.hideturtle()
+        tween = Tween(duration_ms, update, on_complete, group, loop, time.perf_counter())
+        self._tweens.append(tween)
+        update(0.0)
+        self._start_clock()
+        return tween
 
-    def hide_trail(self):
-        """Cache toute la trainée."""
-        for t in self._trail_turtles:
-            t.hideturtle()
+    def cancel(self, group: str):
+        """
+        Annule toutes les animations d'un groupe (sans appeler on_complete).
+
+        Args:
+            group: Groupe à annuler.
+        """
+        for tween in self._tweens:
+            if tween.group == group:
+                tween.cancel()
+
+    def advance(self):
+        """
+        Avance toutes les animations en une passe, sans mettre à jour
+        l'écran (la boucle de jeu l'appelle juste avant son image).
+        """
+        now = time.perf_counter()
+        self._last_advance = now
+        finished: List[Callable[[], None]] = []
+
+        for tween in self._tweens:
+            if not tween.active:
+                continue
+            progress = (now - tween.start) / tween.duration
+            if tween.loop:
+                progress %= 1.0
+            elif progress >= 1.0:
+                progress = 1.0
+                tween.cancel()
+                if tween.on_complete is not None:
+                    finished.append(tween.on_complete)
+            try:
+                tween.update(progress)
+            except turtle.TurtleGraphicsError:
+                tween.cancel()
+
+        self._tweens = [tween for tween in self._tweens if tween.active]
+
+        # Après la passe : une fin d'animation peut en démarrer une autre
+        for on_complete in finished:
+            on_complete()
+
+    def _start_clock(self):
+        """Démarre le timer de l'horloge s'il est arrêté."""
+        if not self._clock_running:
+            self._clock_running = True
+            self._screen.ontimer(self._clock_tick, ANIMATION_FRAME_MS)
+
+    def _clock_tick(self):
+        """
+        Image de l'horloge : avance les animations et met à jour l'écran,
+        sauf si la boucle de jeu vient de le faire.
+        """
+        if not self._tweens:
+            self._clock_running = False
+            return
+
+        if time.perf_counter() - self._last_advance >= ANIMATION_FRAME_MS / 1000:
+            self.advance()
+            try:
+                self._screen.update()
+            except (turtle.Terminator, turtle.TurtleGraphicsError, RuntimeError):
+                # Fenêtre fermée
+                self._clock_running = False
+                return
+
+        try:
+            self._screen.ontimer(self._clock_tick, ANIMATION_FRAME_MS)
+        except (turtle.TurtleGraphicsError, RuntimeError):
+            self._clock_running = False
 
     def show_score_popup(self, x: float, y: float, text: str = "+1"):
         """
@@ -107,53 +223,24 @@ class AnimationManager:
             y: Position Y du popup.
             text: Texte à afficher.
         """
-        popup = turtle.Turtle()
-        popup.speed(0)
-        popup.color(COLOR_POPUP)
-        popup.penup()
-        popup.hideturtle()
-        popup.goto(x, y + 20)
-
+        popup = self._pool.acquire("text_sprite")
         self._popup_turtles.append(popup)
+        start_y = y + 20
 
-        # Démarrer l'animation
-        self._animate_popup(popup, y + 20, 0)
-
-    def _animate_popup(self, popup: turtle.Turtle, start_y: float, step: int):
-        """
-        Animation du popup montant.
+        def update(progress: float):
+            # Le popup monte et rétrécit pour simuler la disparition ; chaque
+            # taille n'est dessinée qu'une fois, les popups suivants réutilisent l'image
+            font_size = int(24 * (1 - progress * 0.5))
+            self._text_sprites.write(popup, text, x, start_y + POPUP_RISE_DISTANCE * progress,
+                                     COLOR_POPUP, ("Arial", font_size, "bold"), outline=0)
 
-        Args:
-            popup: La turtle du popup.
-            start_y: Position Y de départ.
-            step: Étape actuelle de l'animation.
-        """
-        total_steps = int(POPUP_DURATION * 1000 / ANIMATION_FRAME_MS)
-
-        if step >= total_steps:
-            # Fin de l'animation
-            popup.clear()
+        def on_complete():
+            # Fin de l'animation : rendre la turtle à la réserve
             if popup in self._popup_turtles:
                 self._popup_turtles.remove(popup)
-            return
+                self._pool.release(popup)
 
-        # Calculer la nouvelle position et opacité
-        progress = step / total_steps
-        new_y = start_y + (POPUP_RISE_DISTANCE * progress)
-
-        # Mettre à jour le popup
-        popup.clear()
-        popup.goto(popup.xcor(), new_y)
-
-        # Taille décroissante pour simuler la disparition
-        font_size = int(24 * (1 - progress * 0.5))
-        popup.write("+1", align="center", font=("Arial", font_size, "bold"))
-
-        # Continuer l'animation
-        self._screen.ontimer(
-            lambda: self._animate_popup(popup, start_y, step + 1),
-            ANIMATION_FRAME_MS
-        )
+        self.add_tween(POPUP_DURATION * 1000, update, on_complete, GROUP_EFFECTS)
 
     def show_countdown(self, on_complete: Callable):
         """
@@ -163,28 +250,35 @@ class AnimationManager:
             on_complete: Fonction à appeler quand le compte à rebours est terminé.
         """
         if not self._countdown_turtle:
-            self._countdown_turtle = turtle.Turtle()
-            self._countdown_turtle.speed(0)
-            self._countdown_turtle.penup()
-            self._countdown_turtle.hideturtle()
+            self._countdown_turtle = self._pool.acquire("text_sprite")
+
+        # Une seule animation : 3, 2, 1 (COUNTDOWN_DELAY chacun), puis GO!
+        duration = 3 * COUNTDOWN_DELAY + GO_DELAY
+        shown: Optional[int] = None
+
+        def update(progress: float):
+            nonlocal shown
+            count = 3 - min(3, int(progress * duration // COUNTDOWN_DELAY))
+            if count != shown:
+                shown = count
+                self._show_countdown_step(count)
+
+        def finish():
+            if self._countdown_turtle:
+                self._countdown_turtle.hideturtle()
+            on_complete()
 
-        self._countdown_turtle.clear()
-        self._countdown_step(3, on_complete)
+        self.cancel(GROUP_COUNTDOWN)
+        self.add_tween(duration, update, finish, GROUP_COUNTDOWN)
+        self._screen.update()
 
-    def _countdown_step(self, count: int, on_complete: Callable):
+    def _show_countdown_step(self, count: int):
         """
         Affiche une étape du compte à rebours.
 
         Args:
-            count: Nombre actuel du compte à rebours.
-            on_complete: Fonction à appeler à la fin.
+            count: Nombre actuel du compte à rebours (0 pour "GO!").
         """
-        if not self._countdown_turtle:
-            return
-
-        self._countdown_turtle.clear()
-        self._countdown_turtle.goto(0, -30)
-
         if count > 0:
             # Couleur selon le chiffre
             if count == 3:
@@ -194,67 +288,15 @@ class AnimationManager:
             else:
                 color = "#FFEB3B"  # Jaune
 
-            # Contour noir
-            self._countdown_turtle.color("black")
-            for dx in [-3, 0, 3]:
-                for dy in [-3, 0, 3]:
-                    if dx != 0 or dy != 0:
-                        self._countdown_turtle.goto(0 + dx, -30 + dy)
-                        self._countdown_turtle.write(
-                            str(count),
-                            align="center",
-                            font=("Arial", 100, "bold")
-                        )
-
-            # Afficher le nombre en couleur
-            self._countdown_turtle.color(color)
-            self._countdown_turtle.goto(0, -30)
-            self._countdown_turtle.write(
-                str(count),
-                align="center",
-                font=("Arial", 100, "bold")
-            )
-            self._screen.update()
-
-            # Prochaine étape rapidement
-            self._screen.ontimer(
-                lambda: self._countdown_step(count - 1, on_complete),
-                COUNTDOWN_DELAY
-            )
+            # Afficher le nombre en couleur, avec contour noir
+            self._text_sprites.write(
+                self._countdown_turtle, str(count), 0, -30, color,
+                ("Arial", 100, "bold"), outline=3, persist=True)
         else:
-            # Contour noir pour GO!
-            self._countdown_turtle.color("black")
-            for dx in [-3, 0, 3]:
-                for dy in [-3, 0, 3]:
-                    if dx != 0 or dy != 0:
-                        self._countdown_turtle.goto(0 + dx, -30 + dy)
-                        self._countdown_turtle.write(
-                            "GO!",
-                            align="center",
-                            font=("Arial", 80, "bold")
-                        )
-
-            # Afficher "GO!" en couleur
-            self._countdown_turtle.color(COLOR_GO)
-            self._countdown_turtle.goto(0, -30)
-            self._countdown_turtle.write(
-                "GO!",
-                align="center",
-                font=("Arial", 80, "bold")
-            )
-            self._screen.update()
-
-            # Effacer rapidement et démarrer le jeu
-            self._screen.ontimer(
-                lambda: self._finish_countdown(on_complete),
-                GO_DELAY
-            )
-
-    def _finish_countdown(self, on_complete: Callable):
-        """Termine le compte à rebours."""
-        if self._countdown_turtle:
-            self._countdown_turtle.clear()
-        on_complete()
+            # Afficher "GO!" en couleur, avec contour noir
+            self._text_sprites.write(
+                self._countdown_turtle, "GO!", 0, -30, COLOR_GO,
+                ("Arial", 80, "bold"), outline=3, persist=True)
 
     def show_game_over(self, score: int, highscore: int, on_replay: Callable):
         """
@@ -267,82 +309,45 @@ class AnimationManager:
         """
         self._game_over_visible = True
 
-        if not self._game_over_turtle:
-            self._game_over_turtle = turtle.Turtle()
-            self._game_over_turtle.speed(0)
-            self._game_over_turtle.penup()
-            self._game_over_turtle.hideturtle()
-
-        self._game_over_turtle.clear()
+        if not self._game_over_lines:
+            self._game_over_lines = [self._pool.acquire("text_sprite") for _ in range(4)]
+        title, score_line, highscore_line, replay_line = self._game_over_lines
 
         # Titre "GAME OVER" avec contour
-        self._game_over_turtle.color("black")
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    self._game_over_turtle.goto(0 + dx, 60 + dy)
-                    self._game_over_turtle.write(
-                        "GAME OVER", align="center", font=("Arial", 50, "bold"))
-        self._game_over_turtle.color(COLOR_GAME_OVER)
-        self._game_over_turtle.goto(0, 60)
-        self._game_over_turtle.write(
-            "GAME OVER", align="center", font=("Arial", 50, "bold"))
+        self._text_sprites.write(
+            title, "GAME OVER", 0, 60, COLOR_GAME_OVER, ("Arial", 50, "bold"), persist=True)
 
         # Score avec contour
-        self._game_over_turtle.color("black")
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    self._game_over_turtle.goto(0 + dx, 10 + dy)
-                    self._game_over_turtle.write(
-                        f"Score: {score}", align="center", font=("Arial", 28, "bold"))
-        self._game_over_turtle.color("#FFEB3B")  # Jaune vif
-        self._game_over_turtle.goto(0, 10)
-        self._game_over_turtle.write(
-            f"Score: {score}", align="center", font=("Arial", 28, "bold"))
-
-        # Highscore avec contour
-        highscore_text = "Nouveau record!" if score >= highscore and score > 0 else f"Meilleur: {highscore}"
-        highscore_color = "#4CAF50" if score >= highscore and score > 0 else "#90CAF9"
-        highscore_font = ("Arial", 22, "bold") if score >= highscore and score > 0 else (
-            "Arial", 22, "normal")
-
-        self._game_over_turtle.color("black")
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    self._game_over_turtle.goto(0 + dx, -35 + dy)
-                    self._game_over_turtle.write(
-                        highscore_text, align="center", font=highscore_font)
-        self._game_over_turtle.color(highscore_color)
-        self._game_over_turtle.goto(0, -35)
-        self._game_over_turtle.write(
-            highscore_text, align="center", font=highscore_font)
+        self._text_sprites.write(
+            score_line, f"Score: {score}", 0, 10, "#FFEB3B",  # Jaune vif
+            ("Arial", 28, "bold"))
+
+        # Highscore avec contour (seul "Nouveau record!" est un texte fixe)
+        new_record = score >= highscore and score > 0
+        highscore_text = "Nouveau record!" if new_record else f"Meilleur: {highscore}"
+        highscore_color = "#4CAF50" if new_record else "#90CAF9"
+        highscore_font = ("Arial", 22, "bold") if new_record else ("Arial", 22, "normal")
+        self._text_sprites.write(
+            highscore_line, highscore_text, 0, -35, highscore_color, highscore_font,
+            persist=new_record)
 
         # Instructions pour rejouer avec contour
-        self._game_over_turtle.color("black")
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    self._game_over_turtle.goto(0 + dx, -90 + dy)
-                    self._game_over_turtle.write(
-                        "[ESPACE] Rejouer", align="center", font=("Arial", 16, "bold"))
-        self._game_over_turtle.color(COLOR_REPLAY_TEXT)
-        self._game_over_turtle.goto(0, -90)
-        self._game_over_turtle.write(
-            "[ESPACE] Rejouer", align="center", font=("Arial", 16, "bold"))
+        self._text_sprites.write(
+            replay_line, "[ESPACE] Rejouer", 0, -90, COLOR_REPLAY_TEXT,
+            ("Arial", 16, "bold"), outline=1, persist=True)
 
         self._screen.update()
 
     def hide_game_over(self):
         """Cache l'écran Game Over."""
         self._game_over_visible = False
-        if self._game_over_turtle:
-            self._game_over_turtle.clear()
+        for line in self._game_over_lines:
+            line.hideturtle()
 
     def animate_death(self, body_turtles: List[turtle.Turtle], on_complete: Callable):
         """
-        Anime la mort du serpent (disparition progressive).
+        Anime la mort du serpent (disparition progressive, en un temps
+        borné même pour un très long serpent).
 
         Args:
             body_turtles: Liste des segments du corps.
@@ -352,30 +357,21 @@ class AnimationManager:
             on_complete()
             return
 
-        self._death_step(body_turtles, 0, on_complete)
+        # Les segments disparaissent par lots, de la queue vers la tête : au
+        # plus DEATH_ANIMATION_STEPS étapes, quelle que soit la longueur
+        total = len(body_turtles)
+        steps = min(total, DEATH_ANIMATION_STEPS)
+        hidden = 0
 
-    def _death_step(self, body_turtles: List[turtle.Turtle], step: int, on_complete: Callable):
-        """
-        Une étape de l'animation de mort.
+        def update(progress: float):
+            nonlocal hidden
+            step = min(steps, int(progress * steps))
+            count = total * step // steps
+            while hidden < count:
+                hidden += 1
+                body_turtles[-hidden].hideturtle()
 
-        Args:
-            body_turtles: Liste des segments.
-            step: Étape actuelle.
-            on_complete: Fonction à appeler à la fin.
-        """
-        if step >= len(body_turtles):
-            on_complete()
-            return
-
-        # Cacher un segment
-        segment = body_turtles[-(step + 1)]
-        segment.hideturtle()
-
-        # Prochaine étape
-        self._screen.ontimer(
-            lambda: self._death_step(body_turtles, step + 1, on_complete),
-            DEATH_ANIMATION_DELAY
-        )
+        self.add_tween(steps * DEATH_ANIMATION_DELAY, update, on_complete, GROUP_DEATH)
 
     def animate_eat(self, x: float, y: float):
         """
@@ -390,33 +386,30 @@ class AnimationManager:
 
     def cleanup(self):
         """Nettoie toutes les ressources d'animation."""
+        # Arrêter toutes les animations
+        for tween in self._tweens:
+            tween.cancel()
+        self._tweens.clear()
+
         # Nettoyer les popups
         for popup in self._popup_turtles:
             try:
-                popup.clear()
-                popup.hideturtle()
+                self._pool.release(popup)
             except (turtle.TurtleGraphicsError, Exception):
                 # Ignorer toutes les erreurs liées à la destruction de la fenêtre
                 pass
         self._popup_turtles.clear()
 
-        # Nettoyer la trainée
-        for t in self._trail_turtles:
-            try:
-                t.hideturtle()
-            except (turtle.TurtleGraphicsError, Exception):
-                pass
-
         # Nettoyer le compte à rebours
         if self._countdown_turtle:
             try:
-                self._countdown_turtle.clear()
+                self._countdown_turtle.hideturtle()
             except (turtle.TurtleGraphicsError, Exception):
                 pass
 
         # Nettoyer game over
-        if self._game_over_turtle:
+        for line in self._game_over_lines:
             try:
-                self._game_over_turtle.clear()
+                line.hideturtle()
             except (turtle.TurtleGraphicsError, Exception):
                 pass
@@ -4,7 +4,55 @@ Gestionnaire de score avec sauvegarde persistante
 
 import os
 import turtle
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.turtle_pool import TurtlePool
+    from src.render.text_sprites import TextSpriteCache
+
 from src.config import SCORE_FILE, SCORE_COLOR
+from src.render.text_sprites import OutlinedCounter
+
+# Police des scores
+SCORE_FONT = ("Arial", 16, "bold")
+
+
+def load_highscore() -> int:
+    """
+    Charge le highscore depuis le fichier.
+
+    Returns:
+        Le highscore, ou 0 si le fichier n'existe pas ou est corrompu.
+    """
+    try:
+        if os.path.exists(SCORE_FILE):
+            with open(SCORE_FILE, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+                if content:
+                    return int(content)
+    except (ValueError, IOError, OSError) as e:
+        print(f"Avertissement: Impossible de charger le highscore - {e}")
+    return 0
+
+
+def write_highscore(highscore: int):
+    """
+    Sauvegarde le highscore dans le fichier.
+
+    Args:
+        highscore: Meilleur score à sauvegarder.
+    """
+    try:
+        # Créer le dossier si nécessaire
+        score_dir = os.path.dirname(SCORE_FILE)
+        if score_dir and not os.path.exists(score_dir):
+            os.makedirs(score_dir, exist_ok=True)
+
+        with open(SCORE_FILE, "w", encoding="utf-8") as f:
+            f.write(str(highscore))
+    except (IOError, OSError) as e:
+        print(
+            f"Avertissement: Impossible de sauvegarder le highscore - {e}")
 
 
 class ScoreManager:
@@ -17,107 +65,48 @@ class ScoreManager:
         - score (propriété): Retourne le score actuel
         - highscore (propriété): Retourne le meilleur score
         - add_point(): Ajoute un point au score et met à jour l'affichage
+        - set_score(score: int): Affiche un score donné sans toucher au highscore
         - reset(): Réinitialise le score et met à jour le highscore si nécessaire
         - cleanup(): Nettoie les ressources Turtle
     """
 
-    def __init__(self):
-        """Initialise le gestionnaire de score."""
+    def __init__(self, pool: "TurtlePool", text_sprites: "TextSpriteCache"):
+        """
+        Initialise le gestionnaire de score.
+
+        Args:
+            pool: Réserve de turtles où emprunter les affichages.
+            text_sprites: Cache des textes avec contour (libellés et chiffres).
+        """
+        self._pool = pool
+        self._text_sprites = text_sprites
         self._score = 0
-        self._highscore = self._load_highscore()
+        self._highscore = load_highscore()
 
-        # Créer les affichages Turtle
-        self._score_display = self._create_display(-390, 270)
-        self._highscore_display = self._create_display(-390, 240)
+        # Créer les affichages (libellé + chiffres de l'atlas)
+        self._score_display = self._create_display("Score: ", -390, 270)
+        self._highscore_display = self._create_display("Highscore: ", -390, 240)
 
         # Afficher les scores initiaux
         self._update_score_display()
         self._update_highscore_display()
 
-    def _create_display(self, x: int, y: int) -> turtle.Turtle:
-        """Crée un objet Turtle pour afficher du texte."""
-        display = turtle.Turtle()
-        display.speed(0)
-        display.color(SCORE_COLOR)
-        display.penup()
-        display.hideturtle()
-        display.goto(x, y)
-        return display
-
-    def _load_highscore(self) -> int:
-        """
-        Charge le highscore depuis le fichier.
-        Retourne 0 si le fichier n'existe pas ou est corrompu.
-        """
-        try:
-            if os.path.exists(SCORE_FILE):
-                with open(SCORE_FILE, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        return int(content)
-        except (ValueError, IOError, OSError) as e:
-            print(f"Avertissement: Impossible de charger le highscore - {e}")
-        return 0
+    def _create_display(self, label: str, x: int, y: int) -> OutlinedCounter:
+        """Crée l'affichage d'un libellé suivi d'un nombre."""
+        return OutlinedCounter(self._pool, self._text_sprites, label, x, y,
+                               SCORE_COLOR, SCORE_FONT, outline=1)
 
     def save_highscore(self):
         """Sauvegarde le highscore dans le fichier."""
-        try:
-            # Créer le dossier si nécessaire
-            score_dir = os.path.dirname(SCORE_FILE)
-            if score_dir and not os.path.exists(score_dir):
-                os.makedirs(score_dir, exist_ok=True)
-
-            with open(SCORE_FILE, "w", encoding="utf-8") as f:
-                f.write(str(self._highscore))
-        except (IOError, OSError) as e:
-            print(
-                f"Avertissement: Impossible de sauvegarder le highscore - {e}")
+        write_highscore(self._highscore)
 
     def _update_score_display(self):
-        """Met à jour l'affichage du score actuel."""
-        self._score_display.clear()
-        # Contour noir
-        self._score_display.color("black")
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    self._score_display.goto(-390 + dx, 270 + dy)
-                    self._score_display.write(
-                        f"Score: {self._score}",
-                        align="left",
-                        font=("Arial", 16, "bold")
-                    )
-        # Texte en couleur
-        self._score_display.color(SCORE_COLOR)
-        self._score_display.goto(-390, 270)
-        self._score_display.write(
-            f"Score: {self._score}",
-            align="left",
-            font=("Arial", 16, "bold")
-        )
+        """Met à jour l'affichage du score actuel (seuls les chiffres modifiés changent)."""
+        self._score_display.set_value(self._score)
 
     def _update_highscore_display(self):
         """Met à jour l'affichage du highscore."""
-        self._highscore_display.clear()
-        # Contour noir
-        self._highscore_display.color("black")
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    self._highscore_display.goto(-390 + dx, 240 + dy)
-                    self._highscore_display.write(
-                        f"Highscore: {self._highscore}",
-                        align="left",
-                        font=("Arial", 16, "bold")
-                    )
-        # Texte en couleur
-        self._highscore_display.color(SCORE_COLOR)
-        self._highscore_display.goto(-390, 240)
-        self._highscore_display.write(
-            f"Highscore: {self._highscore}",
-            align="left",
-            font=("Arial", 16, "bold")
-        )
+        self._highscore_display.set_value(self._highscore)
 
     @property
     def score(self) -> int:
@@ -134,6 +123,16 @@ class ScoreManager:
         self._score += 1
         self._update_score_display()
 
+    def set_score(self, score: int):
+        """
+        Affiche un score donné sans toucher au highscore (lecture d'un replay).
+
+        Args:
+            score: Score à afficher.
+        """
+        self._score = score
+        self._update_score_display()
+
     def reset(self):
         """
         Réinitialise le score.
@@ -150,8 +149,8 @@ class ScoreManager:
     def cleanup(self):
         """Nettoie les ressources Turtle."""
         try:
-            self._score_display.clear()
-            self._highscore_display.clear()
+            self._score_display.release()
+            self._highscore_display.release()
         except (turtle.TurtleGraphicsError, Exception):
             # Ignorer toutes les erreurs liées à la destruction de la fenêtre
             pass
@@ -1,85 +1,179 @@
 """
 Gestionnaire de sons cross-platform utilisant pygame.mixer
+
+L'audio est démarré sur un thread en arrière-plan : l'ouverture du
+périphérique et le décodage des WAV ne retardent pas la première image.
+Les demandes de lecture passent par une file bornée, vidée par ce même
+thread, et chaque effet a son canal réservé : une rafale de pommes ne
+bloque jamais le tick du jeu et ne coupe pas le son de collision (quand
+la file est pleine, c'est la nouvelle pomme qui est ignorée).
 """
 
 import os
-from src.config import SOUND_EAT, SOUND_HIT
+import queue
+import threading
+from typing import Dict, Optional
+
+from src.config import SOUND_EAT, SOUND_HIT, SOUND_QUEUE_SIZE, SOUND_INIT_TIMEOUT
+
+# Canaux réservés du mixer (pygame ne les attribue jamais à Sound.play())
+EAT_CHANNEL = 0
+HIT_CHANNEL = 1
 
-try:
-    import pygame
-except ImportError:
-    pygame = None  # type: ignore
+# Événement qui arrête le thread audio
+_STOP = None
+
+
+def _import_pygame():
+    """
+    Importe pygame au moment d'initialiser l'audio : l'import est coûteux
+    et ne doit pas retarder l'ouverture de la fenêtre.
+
+    Returns:
+        Le module pygame, ou None s'il n'est pas installé.
+    """
+    try:
+        import pygame
+    except ImportError:
+        return None
+    return pygame
 
 
 class SoundManager:
     """
     Gère la lecture des effets sonores du jeu.
     Utilise pygame.mixer pour la compatibilité cross-platform.
+    Tant que l'audio n'est pas prêt, les demandes de lecture sont ignorées.
 
     Méthodes publiques:
         - play_eat(): Joue le son quand le serpent mange une pomme
         - play_hit(): Joue le son quand le serpent entre en collision
         - cleanup(): Libère les ressources audio
+        - ready (propriété): True si l'audio est initialisé
     """
 
     def __init__(self):
-        """Initialise le système audio pygame."""
-        self._initialized = False
-        self._sound_eat = None
-        self._sound_hit = None
+        """Démarre l'initialisation de l'audio en arrière-plan."""
+        self._pygame = None
+        self._sounds: Dict[str, object] = {}
+        self._channels: Dict[str, object] = {}
+        self._ready = threading.Event()
+        # Initialisation terminée, réussie ou non
+        self._init_done = threading.Event()
+        self._events: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=SOUND_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self._thread.start()
 
+    def _run(self):
+        """Thread audio : initialise le mixer, puis joue les sons demandés."""
+        try:
+            initialized = self._initialize()
+        finally:
+            self._init_done.set()
+        if not initialized:
+            return
+
+        while True:
+            event = self._events.get()
+            if event is _STOP:
+                return
+            try:
+                self._channels[event].play(self._sounds[event])
+            except Exception:
+                pass
+
+    def _initialize(self) -> bool:
+        """
+        Ouvre le mixer, réserve un canal par effet et charge les sons.
+
+        Returns:
+            True si l'audio est prêt.
+        """
+        pygame = _import_pygame()
         try:
             if pygame is None:
                 raise ImportError("pygame n'est pas disponible")
             pygame.mixer.init(frequency=22050, size=-
                               16, channels=2, buffer=512)
-            self._initialized = True
-            self._load_sounds()
+            pygame.mixer.set_reserved(2)
         except (ImportError, AttributeError, Exception) as e:
             print(f"Avertissement: Impossible d'initialiser l'audio - {e}")
-            self._initialized = False
+            return False
+
+        self._pygame = pygame
+        self._load_sounds()
+        for name, channel in (("eat", EAT_CHANNEL), ("hit", HIT_CHANNEL)):
+            if name in self._sounds:
+                self._channels[name] = pygame.mixer.Channel(channel)
+        self._ready.set()
+        return True
 
     def _load_sounds(self):
         """Charge les fichiers audio en mémoire."""
-        if not self._initialized or pygame is None:
-            return
+        pygame = self._pygame
 
-        # Charger le son de manger
-        if os.path.exists(SOUND_EAT):
-            try:
-                self._sound_eat = pygame.mixer.Sound(SOUND_EAT)
-            except (Exception, FileNotFoundError, OSError) as e:
-                print(
-                    f"Avertissement: Impossible de charger le son 'eat' - {e}")
+        for name, path in (("eat", SOUND_EAT), ("hit", SOUND_HIT)):
+            if os.path.exists(path):
+                try:
+                    self._sounds[name] = pygame.mixer.Sound(path)
+                except (Exception, FileNotFoundError, OSError) as e:
+                    print(
+                        f"Avertissement: Impossible de charger le son '{name}' - {e}")
+
+    def _request(self, name: str):
+        """
+        Ajoute une demande de lecture à la file sans jamais attendre.
+        File pleine : une pomme est ignorée, une collision prend la place
+        de la demande la plus ancienne.
+
+        Args:
+            name: Nom de l'effet ("eat" ou "hit").
+        """
+        if not self._ready.is_set() or name not in self._channels:
+            return
 
-        # Charger le son de collision
-        if os.path.exists(SOUND_HIT):
+        try:
+            self._events.put_nowait(name)
+        except queue.Full:
+            if name != "hit":
+                return
             try:
-                self._sound_hit = pygame.mixer.Sound(SOUND_HIT)
-            except (Exception, FileNotFoundError, OSError) as e:
-                print(
-                    f"Avertissement: Impossible de charger le son 'hit' - {e}")
+                self._events.get_nowait()
+                self._events.put_nowait(name)
+            except (queue.Empty, queue.Full):
+                pass
 
     def play_eat(self):
         """Joue le son quand le serpent mange une pomme."""
-        if self._initialized and self._sound_eat:
-            try:
-                self._sound_eat.play()
-            except Exception:
-                pass
+        self._request("eat")
 
     def play_hit(self):
         """Joue le son quand le serpent entre en collision."""
-        if self._initialized and self._sound_hit:
+        self._request("hit")
+
+    def cleanup(self):
+        """Arrête le thread audio et libère les ressources audio."""
+        # Attendre (brièvement) la fin de l'initialisation : un mixer ouvert
+        # pendant la fermeture du jeu doit être fermé lui aussi. Un mixer
+        # bloqué ne retarde pas la fermeture : le thread est un démon.
+        if not self._init_done.wait(timeout=SOUND_INIT_TIMEOUT):
+            return
+        self._ready.clear()
+        if self._thread.is_alive():
             try:
-                self._sound_hit.play()
-            except Exception:
+                self._events.put(_STOP, timeout=0.5)
+            except queue.Full:
                 pass
+            self._thread.join(timeout=1.0)
 
-    def cleanup(self):
-        """Libère les ressources audio."""
-        if self._initialized and pygame is not None:
+        if self._pygame is not None:
             try:
-                pygame.mixer.quit()
+                self._pygame.mixer.quit()
             except Exception:
                 pass
+            self._pygame = None
+
+    @property
+    def ready(self) -> bool:
+        """True si l'audio est initialisé."""
+        return self._ready.is_set()
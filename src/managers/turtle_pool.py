@@ -0,0 +1,109 @@
+"""
+Réserve de turtles - Recyclage des objets Turtle entre les parties
+
+Chaque turtle créée reste enregistrée auprès de l'écran, et chaque
+screen.update() les parcourt toutes : au lieu d'en créer de nouvelles
+à chaque segment, popup ou texte, les composants les empruntent à
+cette réserve et les y rendent quand ils n'en ont plus besoin.
+"""
+
+import turtle
+from typing import Callable, Dict, List, Optional
+
+# Configuration appliquée une seule fois à une turtle nouvellement créée
+TurtleSetup = Callable[[turtle.Turtle], None]
+# Création d'une turtle (ou d'un sprite du moteur de rendu)
+TurtleFactory = Callable[[], turtle.Turtle]
+
+
+class TurtlePool:
+    """
+    Réserve de turtles partagée par le serpent, les animations et les textes.
+    Les turtles sont rangées par sorte : une turtle rendue garde sa forme
+    et sa couleur, et n'est reconfigurée que si elle est nouvelle.
+    Les turtles sont créées par le moteur de rendu (turtle.Turtle ou
+    sprite dessiné directement sur le canvas).
+
+    Méthodes publiques:
+        - acquire(kind: str, setup: TurtleSetup) -> turtle.Turtle: Emprunte une turtle cachée
+        - release(t: turtle.Turtle): Rend une turtle à la réserve
+        - live_count (propriété): Nombre de turtles empruntées
+        - pooled_count (propriété): Nombre de turtles disponibles dans la réserve
+        - cleanup(): Cache toutes les turtles créées par la réserve
+    """
+
+    def __init__(self, factory: TurtleFactory = turtle.Turtle):
+        """
+        Initialise une réserve vide.
+
+        Args:
+            factory: Fonction qui crée une nouvelle turtle.
+        """
+        self._factory = factory
+        self._free: Dict[str, List[turtle.Turtle]] = {}
+        self._kinds: Dict[int, str] = {}  # Sorte de chaque turtle empruntée
+        self._all: List[turtle.Turtle] = []
+
+    def acquire(self, kind: str = "default",
+                setup: Optional[TurtleSetup] = None) -> turtle.Turtle:
+        """
+        Emprunte une turtle cachée, lève le crayon, vitesse maximale.
+
+        Args:
+            kind: Sorte de turtle (les turtles d'une même sorte sont interchangeables).
+            setup: Configuration à appliquer si la turtle est nouvelle
+                (forme, taille, couleur...).
+
+        Returns:
+            La turtle empruntée.
+        """
+        free = self._free.get(kind)
+        if free:
+            t = free.pop()
+        else:
+            t = self._factory()
+            t.speed(0)
+            t.penup()
+            t.hideturtle()
+            if setup is not None:
+                setup(t)
+            self._all.append(t)
+
+        self._kinds[id(t)] = kind
+        return t
+
+    def release(self, t: turtle.Turtle):
+        """
+        Rend une turtle à la réserve : elle est effacée et cachée.
+
+        Args:
+            t: Turtle empruntée avec acquire().
+        """
+        kind = self._kinds.pop(id(t), None)
+        if kind is None:
+            # Turtle déjà rendue (ou qui ne vient pas de la réserve)
+            return
+
+        t.clear()
+        t.hideturtle()
+        self._free.setdefault(kind, []).append(t)
+
+    @property
+    def live_count(self) -> int:
+        """Nombre de turtles empruntées."""
+        return len(self._kinds)
+
+    @property
+    def pooled_count(self) -> int:
+        """Nombre de turtles disponibles dans la réserve."""
+        return sum(len(free) for free in self._free.values())
+
+    def cleanup(self):
+        """Cache toutes les turtles créées par la réserve."""
+        for t in self._all:
+            try:
+                t.clear()
+                t.hideturtle()
+            except (turtle.TurtleGraphicsError, Exception):
+                # Ignorer toutes les erreurs liées à la destruction de la fenêtre
+                pass
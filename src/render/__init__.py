@@ -0,0 +1,37 @@
+"""Module render contenant les moteurs de rendu (Turtle, Canvas Tk)."""
+
+from typing import TYPE_CHECKING
+
+from src.render.turtle_renderer import TurtleRenderer
+from src.render.canvas_renderer import CanvasRenderer, CanvasSprite
+
+if TYPE_CHECKING:
+    from turtle import _Screen
+
+# Moteurs de rendu disponibles (option --renderer)
+RENDERERS = {
+    "turtle": TurtleRenderer,
+    "canvas": CanvasRenderer,
+}
+
+
+def create_renderer(name: str, screen: "_Screen"):
+    """
+    Crée le moteur de rendu demandé.
+
+    Args:
+        name: Nom du moteur (clé de RENDERERS).
+        screen: L'écran Turtle de la fenêtre.
+
+    Returns:
+        Le moteur de rendu.
+
+    Raises:
+        ValueError: Si le moteur est inconnu.
+    """
+    if name not in RENDERERS:
+        raise ValueError(f"Moteur de rendu inconnu: {name}")
+    return RENDERERS[name](screen)
+
+
+__all__ = ["CanvasRenderer", "CanvasSprite", "RENDERERS", "TurtleRenderer", "create_renderer"]
@@ -0,0 +1,243 @@
+"""
+Cache de l'atlas des sprites - Images converties une fois, gardées d'un lancement à l'autre
+
+Toutes les images du jeu (tête dans chaque orientation, corps, pomme à
+chaque taille de pulsation) sont réunies dans une seule planche PNG,
+accompagnée d'un fichier JSON qui donne la position de chaque image.
+La planche est rangée dans le dossier utilisateur, nommée d'après une
+empreinte des octets des sources et des conversions demandées : tant
+que les images sources ne changent pas, Pillow n'est même pas importé.
+Les textes avec contour (voir text_sprites.py) sont rangés au même endroit.
+L'exécutable PyInstaller embarque une planche pré-calculée (voir
+prebake_assets() et SnakeGame.spec).
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+from src.config import (
+    ASSET_CACHE_DIR,
+    BUNDLED_ASSET_CACHE_DIR,
+    APPLE_IMAGE,
+    APPLE_SIZE,
+    APPLE_PULSE_MIN,
+    APPLE_PULSE_MAX,
+    APPLE_PULSE_FRAMES,
+    APPLE_FLASH_SCALE,
+    BODY_IMAGE,
+    HEAD_IMAGE,
+    HEAD_ROTATIONS,
+    IMAGE_SIZE,
+)
+
+# À incrémenter si la conversion change (invalide tous les caches existants)
+CACHE_FORMAT_VERSION = 2
+
+# Espace entre deux images de la planche (évite les débordements de filtrage)
+ATLAS_PADDING = 1
+
+# Rectangle d'une image dans la planche : (x, y, largeur, hauteur)
+Rect = Tuple[int, int, int, int]
+# Image de l'atlas : (nom, source, taille maximale, rotation en degrés, échelle)
+FrameSpec = Tuple[str, str, Tuple[int, int], int, float]
+
+
+def pulse_scales() -> List[float]:
+    """
+    Échelles des images de pulsation de la pomme, de la plus petite à la plus grande.
+
+    Returns:
+        APPLE_PULSE_FRAMES échelles réparties de APPLE_PULSE_MIN à APPLE_PULSE_MAX.
+    """
+    if APPLE_PULSE_FRAMES <= 1:
+        return [1.0]
+    step = (APPLE_PULSE_MAX - APPLE_PULSE_MIN) / (APPLE_PULSE_FRAMES - 1)
+    return [round(APPLE_PULSE_MIN + i * step, 4) for i in range(APPLE_PULSE_FRAMES)]
+
+
+def atlas_frames() -> List[FrameSpec]:
+    """
+    Liste les images de l'atlas utilisées par le jeu.
+
+    Returns:
+        Les images : head_0..head_3 (une par angle de HEAD_ROTATIONS), body,
+        apple_0..apple_N (pulsation) et apple_flash.
+    """
+    frames: List[FrameSpec] = [
+        (f"head_{i}", HEAD_IMAGE, IMAGE_SIZE, rotation, 1.0)
+        for i, rotation in enumerate(HEAD_ROTATIONS)
+    ]
+    frames.append(("body", BODY_IMAGE, IMAGE_SIZE, 0, 1.0))
+    frames.extend(
+        (f"apple_{i}", APPLE_IMAGE, APPLE_SIZE, 0, scale)
+        for i, scale in enumerate(pulse_scales())
+    )
+    frames.append(("apple_flash", APPLE_IMAGE, APPLE_SIZE, 0, APPLE_FLASH_SCALE))
+    return frames
+
+
+def cache_key(*parts) -> str:
+    """
+    Calcule l'empreinte d'une conversion décrite par des valeurs simples.
+
+    Args:
+        parts: Paramètres de la conversion (textes, nombres, tuples).
+
+    Returns:
+        Empreinte hexadécimale (16 caractères).
+    """
+    text = repr((CACHE_FORMAT_VERSION,) + parts)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def atlas_key(frames: List[FrameSpec]) -> str:
+    """
+    Calcule l'empreinte de l'atlas : octets des sources et conversions demandées.
+
+    Args:
+        frames: Images de l'atlas.
+
+    Returns:
+        Empreinte hexadécimale (16 caractères).
+
+    Raises:
+        OSError: Si une image source est illisible.
+    """
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode("ascii"))
+    for source in sorted({frame[1] for frame in frames}):
+        with open(source, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    digest.update(repr([(name, os.path.basename(source), size, rotation, scale)
+                        for name, source, size, rotation, scale in frames]).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def build_atlas(frames: List[FrameSpec]) -> Tuple["Image.Image", Dict[str, Rect]]:
+    """
+    Dessine la planche : chaque image est redimensionnée depuis la source
+    (pas depuis une miniature), tournée, puis placée sur une seule ligne.
+
+    Args:
+        frames: Images de l'atlas.
+
+    Returns:
+        La planche RGBA et le rectangle de chaque image.
+
+    Raises:
+        OSError: Si une image source est illisible.
+    """
+    # Import tardif : Pillow n'est chargé que si le cache est froid
+    from PIL import Image
+
+    sources: Dict[str, Image.Image] = {}
+    images: List[Tuple[str, Image.Image]] = []
+    for name, source, size, rotation, scale in frames:
+        if source not in sources:
+            sources[source] = Image.open(source).convert("RGBA")
+        image = sources[source].copy()
+        image.thumbnail((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))),
+                        Image.LANCZOS)
+        if rotation:
+            image = image.rotate(rotation, expand=True)
+        images.append((name, image))
+
+    width = sum(image.width + ATLAS_PADDING for _, image in images)
+    height = max(image.height for _, image in images)
+    sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    layout: Dict[str, Rect] = {}
+    x = 0
+    for name, image in images:
+        sheet.paste(image, (x, 0))
+        layout[name] = (x, 0, image.width, image.height)
+        x += image.width + ATLAS_PADDING
+    return sheet, layout
+
+
+def write_atomic(path: str, write: Callable[[str], None]):
+    """
+    Écrit un fichier sous un nom temporaire puis le renomme : un autre
+    lancement qui lit le même cache ne voit jamais un fichier incomplet.
+
+    Args:
+        path: Chemin final du fichier.
+        write: Fonction qui écrit le contenu dans le chemin qu'on lui passe.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    write(temp_path)
+    os.replace(temp_path, path)
+
+
+def converted_atlas(cache_dir: str = ASSET_CACHE_DIR,
+                    bundled_dir: Optional[str] = BUNDLED_ASSET_CACHE_DIR
+                    ) -> Tuple[str, Dict[str, Rect]]:
+    """
+    Retourne la planche de l'atlas, construite seulement si elle n'est pas déjà en cache.
+
+    Args:
+        cache_dir: Dossier du cache où écrire la planche si elle manque.
+        bundled_dir: Cache en lecture seule consulté d'abord (None pour l'ignorer).
+
+    Returns:
+        Le chemin de la planche PNG et le rectangle de chaque image.
+
+    Raises:
+        OSError: Si une source est illisible ou si le cache ne peut pas être écrit.
+    """
+    frames = atlas_frames()
+    stem = f"sprites_{atlas_key(frames)}"
+
+    for directory in (bundled_dir, cache_dir):
+        if not directory:
+            continue
+        sheet_path = os.path.join(directory, f"{stem}.png")
+        layout_path = os.path.join(directory, f"{stem}.json")
+        if os.path.exists(sheet_path) and os.path.exists(layout_path):
+            try:
+                with open(layout_path, "r", encoding="utf-8") as f:
+                    layout = {name: tuple(rect) for name, rect in json.load(f).items()}
+                return sheet_path, layout
+            except (ValueError, OSError) as e:
+                print(f"Avertissement: Cache d'images illisible, reconstruction - {e}")
+
+    sheet, layout = build_atlas(frames)
+    os.makedirs(cache_dir, exist_ok=True)
+    sheet_path = os.path.join(cache_dir, f"{stem}.png")
+    layout_path = os.path.join(cache_dir, f"{stem}.json")
+
+    def write_layout(path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(layout, f)
+
+    # La planche d'abord : le JSON indique que le couple est complet
+    write_atomic(sheet_path, lambda path: sheet.save(path, format="PNG"))
+    write_atomic(layout_path, write_layout)
+
+    # Les planches précédentes (sources modifiées, ancien format) ne servent plus
+    for filename in os.listdir(cache_dir):
+        if not filename.startswith(stem) and (filename.startswith("sprites_")
+                                              or filename.endswith(".gif")):
+            try:
+                os.remove(os.path.join(cache_dir, filename))
+            except OSError:
+                pass
+    return sheet_path, layout
+
+
+def prebake_assets(cache_dir: str) -> List[str]:
+    """
+    Construit l'atlas dans un dossier (étape de build : le dossier est
+    embarqué dans l'exécutable comme cache en lecture seule).
+
+    Args:
+        cache_dir: Dossier de destination.
+
+    Returns:
+        Les chemins de la planche et de son fichier JSON.
+    """
+    sheet_path, _ = converted_atlas(cache_dir=cache_dir, bundled_dir=None)
+    return [sheet_path, os.path.splitext(sheet_path)[0] + ".json"]
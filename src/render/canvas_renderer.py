@@ -0,0 +1,347 @@
+"""
+Moteur de rendu Canvas - Dessin direct sur le tkinter.Canvas de la fenêtre
+
+Chaque sprite possède un seul élément du canvas, créé une fois puis
+déplacé avec coords() : un pas de jeu ne touche que les éléments qui
+changent (tête, segment déplacé, trainée, pomme), quelle que soit la
+longueur du serpent. Tk ne redessine que les zones modifiées, et
+screen.update() n'a plus aucune turtle à parcourir. Il n'utilise pas
+non plus les attributs privés de Turtle (voir turtle_renderer.py).
+"""
+
+import os
+import tkinter
+import turtle
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from turtle import _Screen
+
+# Formes géométriques connues (demi-taille en pixels pour une échelle de 1)
+PRIMITIVE_SHAPES = {
+    "circle": 10,
+    "square": 10,
+}
+
+# Ancrage du texte selon l'alignement (comme turtle.write)
+TEXT_ANCHORS = {
+    "left": "sw",
+    "center": "s",
+    "right": "se",
+}
+
+
+class CanvasRenderer:
+    """
+    Rendu direct sur le canvas Tk de l'écran Turtle.
+
+    Méthodes publiques:
+        - create_sprite() -> CanvasSprite: Crée un sprite
+        - image(name: str) -> Optional[tkinter.PhotoImage]: Image d'une forme enregistrée
+        - register_image(name: str, image: tkinter.PhotoImage): Enregistre une image comme forme
+        - unregister_image(name: str) -> bool: Oublie une image enregistrée
+        - raise_sprite(sprite: CanvasSprite): Place un sprite au premier plan
+        - canvas (propriété): Le canvas Tk de la fenêtre
+    """
+
+    def __init__(self, screen: "_Screen"):
+        """
+        Initialise le moteur de rendu.
+
+        Args:
+            screen: L'écran Turtle dont on utilise le canvas.
+        """
+        self._screen = screen
+        self._canvas = screen.getcanvas()
+        self._images: Dict[str, tkinter.PhotoImage] = {}
+
+    def create_sprite(self) -> "CanvasSprite":
+        """
+        Crée un sprite.
+
+        Returns:
+            Un sprite dessiné sur le canvas.
+        """
+        return CanvasSprite(self)
+
+    def image(self, name: str) -> Optional[tkinter.PhotoImage]:
+        """
+        Retourne l'image d'une forme (chemin d'un fichier GIF), chargée une seule fois.
+
+        Args:
+            name: Nom de la forme, tel que passé à screen.register_shape().
+
+        Returns:
+            L'image, ou None si la forme n'est pas un fichier image.
+        """
+        if name in self._images:
+            return self._images[name]
+        if not name.lower().endswith(".gif") or not os.path.exists(name):
+            return None
+
+        try:
+            image = tkinter.PhotoImage(file=name, master=self._canvas)
+        except tkinter.TclError as e:
+            print(f"Avertissement: Impossible de charger l'image {name} - {e}")
+            return None
+
+        # Garder une référence : Tk n'affiche plus une image libérée
+        self._images[name] = image
+        return image
+
+    def register_image(self, name: str, image: tkinter.PhotoImage):
+        """
+        Enregistre une image en mémoire comme forme de sprite.
+
+        Args:
+            name: Nom de la forme.
+            image: Image Tk à afficher.
+        """
+        self._images[name] = image
+
+    def unregister_image(self, name: str) -> bool:
+        """
+        Oublie une image enregistrée avec register_image().
+        Les sprites qui l'affichent gardent leur propre référence à l'image.
+
+        Args:
+            name: Nom de la forme.
+
+        Returns:
+            True (l'image est toujours oubliée).
+        """
+        self._images.pop(name, None)
+        return True
+
+    def raise_sprite(self, sprite: "CanvasSprite"):
+        """
+        Place un sprite au premier plan (au-dessus des segments créés après lui).
+
+        Args:
+            sprite: Sprite créé par create_sprite().
+        """
+        if sprite.item is not None:
+            self._canvas.tag_raise(sprite.item)
+
+    @property
+    def canvas(self):
+        """Le canvas Tk de la fenêtre."""
+        return self._canvas
+
+
+class CanvasSprite:
+    """
+    Sprite dessiné directement sur le canvas.
+    Reprend le sous-ensemble de l'interface de turtle.Turtle utilisé par
+    les vues (goto, shape, shapesize, color, write...) : Snake, Apple,
+    ScoreManager et AnimationManager fonctionnent sans modification.
+
+    Méthodes publiques:
+        - goto(x, y): Déplace le sprite
+        - shape(name: str): Change la forme (image GIF ou forme géométrique)
+        - shapesize(stretch: float): Change la taille d'une forme géométrique
+        - color(*colors: str): Change la couleur (forme et texte)
+        - write(text: str, align: str, font: tuple): Écrit du texte à la position du sprite
+        - clear(): Efface le texte écrit
+        - hideturtle() / showturtle(): Cache ou affiche le sprite
+        - position() -> Tuple[float, float]: Retourne la position
+        - item (propriété): Élément du canvas (None tant que le sprite n'a pas de forme)
+    """
+
+    def __init__(self, renderer: CanvasRenderer):
+        """
+        Initialise un sprite vide (sans forme, donc invisible).
+
+        Args:
+            renderer: Le moteur de rendu propriétaire.
+        """
+        self._renderer = renderer
+        self._canvas = renderer.canvas
+        self._x = 0.0
+        self._y = 0.0
+        self._visible = True
+        self._shape: Optional[str] = None
+        self._image: Optional[tkinter.PhotoImage] = None
+        self._scale = 1.0
+        self._color = "black"
+        self._item: Optional[int] = None
+        self._texts: List[int] = []
+
+    def _state(self) -> str:
+        """État Tk de l'élément selon la visibilité."""
+        return "normal" if self._visible else "hidden"
+
+    def _primitive_coords(self) -> Tuple[float, float, float, float]:
+        """Rectangle englobant d'une forme géométrique (coordonnées du canvas)."""
+        half = PRIMITIVE_SHAPES[self._shape] * self._scale
+        return (self._x - half, -self._y - half, self._x + half, -self._y + half)
+
+    def _create_item(self):
+        """Crée l'élément du canvas correspondant à la forme courante."""
+        if self._image is not None:
+            self._item = self._canvas.create_image(
+                self._x, -self._y, image=self._image, state=self._state())
+        elif self._shape == "circle":
+            self._item = self._canvas.create_oval(
+                *self._primitive_coords(), fill=self._color, outline=self._color,
+                state=self._state())
+        else:
+            self._item = self._canvas.create_rectangle(
+                *self._primitive_coords(), fill=self._color, outline=self._color,
+                state=self._state())
+
+    def speed(self, *args):
+        """Sans effet (les sprites se déplacent toujours instantanément)."""
+
+    def penup(self):
+        """Sans effet (les sprites ne tracent jamais)."""
+
+    def shape(self, name: Optional[str] = None) -> Optional[str]:
+        """
+        Change la forme du sprite.
+
+        Args:
+            name: Image enregistrée (fichier GIF) ou forme géométrique
+                ("circle", "square") ; None pour lire la forme actuelle.
+
+        Returns:
+            La forme actuelle si name vaut None.
+
+        Raises:
+            turtle.TurtleGraphicsError: Si la forme est inconnue.
+        """
+        if name is None:
+            return self._shape
+        if name == self._shape:
+            return None
+
+        image = self._renderer.image(name)
+        if image is None and name not in PRIMITIVE_SHAPES:
+            raise turtle.TurtleGraphicsError(f"Forme inconnue: {name}")
+
+        if image is not None and self._image is not None:
+            # Image vers image : simple changement d'image
+            self._canvas.itemconfigure(self._item, image=image)
+            self._shape, self._image = name, image
+            return None
+
+        if self._item is not None:
+            self._canvas.delete(self._item)
+        self._shape, self._image = name, image
+        self._create_item()
+        return None
+
+    def shapesize(self, stretch_wid: float = 1.0, stretch_len: Optional[float] = None,
+                  outline: Optional[float] = None):
+        """
+        Change la taille d'une forme géométrique.
+        Comme avec Turtle, les images ne sont pas redimensionnées.
+
+        Args:
+            stretch_wid: Facteur d'échelle.
+            stretch_len: Ignoré (les formes restent carrées).
+            outline: Ignoré.
+        """
+        if stretch_wid == self._scale:
+            return
+        self._scale = stretch_wid
+        if self._item is not None and self._image is None:
+            self._canvas.coords(self._item, *self._primitive_coords())
+
+    def color(self, *colors: str):
+        """
+        Change la couleur de la forme et du texte.
+
+        Args:
+            colors: Une couleur, ou (couleur du crayon, couleur de remplissage).
+        """
+        if not colors:
+            return
+        self._color = colors[-1]
+        if self._item is not None and self._image is None:
+            self._canvas.itemconfigure(self._item, fill=self._color, outline=self._color)
+
+    def goto(self, x, y: Optional[float] = None):
+        """
+        Déplace le sprite.
+
+        Args:
+            x: Position X, ou tuple (x, y).
+            y: Position Y.
+        """
+        if y is None:
+            x, y = x
+        if x == self._x and y == self._y:
+            return
+
+        self._x, self._y = x, y
+        if self._item is None:
+            return
+        if self._image is not None:
+            self._canvas.coords(self._item, x, -y)
+        else:
+            self._canvas.coords(self._item, *self._primitive_coords())
+
+    setposition = goto
+
+    def position(self) -> Tuple[float, float]:
+        """Retourne la position (x, y) du sprite."""
+        return (self._x, self._y)
+
+    pos = position
+
+    def xcor(self) -> float:
+        """Retourne la position X du sprite."""
+        return self._x
+
+    def ycor(self) -> float:
+        """Retourne la position Y du sprite."""
+        return self._y
+
+    def hideturtle(self):
+        """Cache le sprite (le texte écrit reste affiché, comme avec Turtle)."""
+        if self._visible:
+            self._visible = False
+            if self._item is not None:
+                self._canvas.itemconfigure(self._item, state="hidden")
+
+    ht = hideturtle
+
+    def showturtle(self):
+        """Affiche le sprite."""
+        if not self._visible:
+            self._visible = True
+            if self._item is not None:
+                self._canvas.itemconfigure(self._item, state="normal")
+
+    st = showturtle
+
+    def isvisible(self) -> bool:
+        """Retourne True si le sprite est visible."""
+        return self._visible
+
+    @property
+    def item(self) -> Optional[int]:
+        """Élément du canvas (None tant que le sprite n'a pas de forme)."""
+        return self._item
+
+    def write(self, text: str, move: bool = False, align: str = "left",
+              font: tuple = ("Arial", 8, "normal")):
+        """
+        Écrit du texte à la position du sprite.
+
+        Args:
+            text: Texte à afficher.
+            move: Ignoré.
+            align: Alignement ("left", "center", "right").
+            font: Tuple (nom, taille, style) pour la police.
+        """
+        self._texts.append(self._canvas.create_text(
+            self._x - 1, -self._y, text=str(text), anchor=TEXT_ANCHORS[align],
+            fill=self._color, font=font))
+
+    def clear(self):
+        """Efface le texte écrit par ce sprite."""
+        for item in self._texts:
+            self._canvas.delete(item)
+        self._texts.clear()
@@ -0,0 +1,71 @@
+"""
+Atlas des sprites - Toutes les images du jeu chargées une seule fois
+
+La planche (voir asset_cache.py) est lue en une fois, puis découpée par
+Tk en une image par orientation de la tête et par étape de pulsation de
+la pomme. Les animations ne font que changer d'image : plus de GIF
+séparés, ni de redimensionnement de l'image par Tk pendant le jeu.
+"""
+
+import tkinter
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from turtle import _Screen
+
+from src.render.asset_cache import converted_atlas
+
+
+class SpriteAtlas:
+    """
+    Images de l'atlas, enregistrées comme formes du moteur de rendu.
+
+    Méthodes publiques:
+        - frame(name: str, default: str) -> str: Forme d'une image de l'atlas
+        - loaded (propriété): True si la planche a été chargée
+    """
+
+    def __init__(self, screen: "_Screen", renderer):
+        """
+        Charge la planche et enregistre chacune de ses images.
+
+        Args:
+            screen: L'écran Turtle (propriétaire des images Tk).
+            renderer: Moteur de rendu où enregistrer les images.
+        """
+        self._frames: Dict[str, str] = {}
+        # Références gardées : Tk n'affiche plus une image libérée
+        self._images: Dict[str, tkinter.PhotoImage] = {}
+
+        try:
+            sheet_path, layout = converted_atlas()
+            master = screen.getcanvas()
+            sheet = tkinter.PhotoImage(file=sheet_path, master=master)
+            for name, (x, y, width, height) in layout.items():
+                image = tkinter.PhotoImage(width=width, height=height, master=master)
+                # Copie de la zone de la planche (PhotoImage.copy() ne prend pas de zone)
+                image.tk.call(image, "copy", sheet, "-from", x, y, x + width, y + height)
+                shape = f"atlas_{name}"
+                renderer.register_image(shape, image)
+                self._images[name] = image
+                self._frames[name] = shape
+        except (OSError, tkinter.TclError) as e:
+            print(f"Avertissement: Impossible de charger les images du jeu - {e}")
+
+    def frame(self, name: str, default: str = "circle") -> str:
+        """
+        Retourne la forme d'une image de l'atlas.
+
+        Args:
+            name: Nom de l'image (ex. "head_0", "body", "apple_3").
+            default: Forme utilisée si l'image n'a pas pu être chargée.
+
+        Returns:
+            Le nom de la forme à passer à turtle.shape().
+        """
+        return self._frames.get(name, default)
+
+    @property
+    def loaded(self) -> bool:
+        """True si la planche a été chargée."""
+        return bool(self._frames)
@@ -0,0 +1,457 @@
+"""
+Textes avec contour - Rendus une seule fois avec Pillow, affichés comme sprites
+
+Le contour était simulé en écrivant chaque texte 9 fois avec turtle.write :
+chaque changement effaçait puis recréait 9 éléments de texte Tk. Ici,
+le texte et son contour sont dessinés une fois dans une image, gardée
+dans un cache LRU ; l'afficher revient à changer l'image d'un sprite.
+Les nombres (score) utilisent un atlas de chiffres : incrémenter le
+score ne change en général que l'image du chiffre des unités.
+Les images des textes fixes (libellés, titres, atlas de chiffres) sont
+aussi gardées sur disque avec celles de l'atlas des sprites : au
+lancement suivant, Pillow n'est pas importé pour elles. Les textes qui
+changent (valeurs, tailles des popups) restent en mémoire seulement.
+"""
+
+import base64
+import io
+import math
+import os
+import tkinter
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import turtle
+    from turtle import _Screen
+    from PIL import Image, ImageFont
+    from src.managers.turtle_pool import TurtlePool
+
+from src.config import ASSET_CACHE_DIR, TEXT_CACHE_SIZE, TEXT_POINT_SCALE
+from src.render.asset_cache import cache_key, write_atomic
+
+# Police Tk : (nom, taille en points, style)
+Font = Tuple[str, int, str]
+
+# Fichiers de police essayés pour chaque style (Windows, macOS, Linux) ;
+# Pillow les cherche dans les dossiers de polices du système
+FONT_FILES = {
+    "normal": ("arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf", "DejaVuSans.ttf"),
+    "bold": ("arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+# Chiffres de l'atlas utilisé pour les nombres
+DIGITS = "0123456789"
+
+# Décalage horizontal du centre de l'image selon l'alignement (comme turtle.write)
+ALIGN_OFFSETS = {
+    "left": 0.5,
+    "center": 0.0,
+    "right": -0.5,
+}
+
+
+class TextImage(NamedTuple):
+    """Image d'un texte enregistrée comme forme de sprite."""
+    name: str                   # Nom de la forme
+    width: int                  # Largeur en pixels
+    height: int                 # Hauteur en pixels
+    image: tkinter.PhotoImage   # Référence gardée : Tk n'affiche plus une image libérée
+
+
+class GlyphAtlas(NamedTuple):
+    """Images de caractères placées dans des cases de même taille, pour composer un nombre."""
+    names: Dict[str, str]       # Nom de la forme de chaque caractère
+    advance: int                # Distance entre deux caractères
+    width: int                  # Largeur d'une case (image la plus large)
+    height: int                 # Hauteur d'une case
+
+
+@lru_cache(maxsize=None)
+def load_font(family: str, size: int, style: str = "normal") -> "ImageFont.FreeTypeFont":
+    """
+    Charge la police Pillow la plus proche d'une police Tk.
+
+    Args:
+        family: Nom de la police Tk (utilisé pour trouver le fichier).
+        size: Taille en points.
+        style: Style Tk ("normal" ou "bold").
+
+    Returns:
+        La police, ou la police par défaut de Pillow si aucun fichier n'est trouvé.
+    """
+    from PIL import ImageFont
+
+    pixels = max(1, round(size * TEXT_POINT_SCALE))
+    bold = "bold" in style
+    candidates = (f"{family}{' Bold' if bold else ''}.ttf",) + FONT_FILES["bold" if bold else "normal"]
+    for filename in candidates:
+        try:
+            return ImageFont.truetype(filename, pixels)
+        except OSError:
+            continue
+    return ImageFont.load_default(pixels)
+
+
+def render_outlined_text(text: str, font: Font, color: str, outline_color: str = "black",
+                         outline: int = 2) -> "Image.Image":
+    """
+    Dessine un texte avec son contour dans une image transparente.
+    La hauteur ne dépend que de la police : des textes différents
+    écrits avec la même police restent alignés.
+
+    Args:
+        text: Texte à dessiner.
+        font: Police Tk (nom, taille, style).
+        color: Couleur du texte.
+        outline_color: Couleur du contour.
+        outline: Épaisseur du contour en pixels (0 pour aucun).
+
+    Returns:
+        L'image RGBA.
+    """
+    from PIL import Image, ImageDraw
+
+    pil_font = load_font(*font)
+    ascent, descent = pil_font.getmetrics()
+    # Certains glyphes dépassent leur avance (italiques, "R" gras...)
+    text_width = math.ceil(max(pil_font.getlength(text), pil_font.getbbox(text)[2]))
+    width = text_width + 2 * outline
+    height = ascent + descent + 2 * outline
+
+    image = Image.new("RGBA", (max(1, width), max(1, height)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.text((outline, outline), text, font=pil_font, fill=color,
+              stroke_width=outline, stroke_fill=outline_color)
+    return image
+
+
+def text_image_file(text: str, font: Font, color: str, outline_color: str = "black",
+                    outline: int = 2, cache_dir: str = ASSET_CACHE_DIR) -> str:
+    """
+    Retourne le PNG d'un texte avec contour, dessiné seulement s'il n'est pas déjà sur disque.
+
+    Args:
+        text: Texte à dessiner.
+        font: Police Tk (nom, taille, style).
+        color: Couleur du texte.
+        outline_color: Couleur du contour.
+        outline: Épaisseur du contour en pixels (0 pour aucun).
+        cache_dir: Dossier du cache.
+
+    Returns:
+        Le chemin du PNG.
+
+    Raises:
+        OSError: Si le cache ne peut pas être écrit.
+    """
+    key = cache_key("text", text, tuple(font), color, outline_color, outline)
+    path = os.path.join(cache_dir, f"text_{key}.png")
+    if not os.path.exists(path):
+        image = render_outlined_text(text, font, color, outline_color, outline)
+        os.makedirs(cache_dir, exist_ok=True)
+        write_atomic(path, lambda temp_path: image.save(temp_path, format="PNG"))
+    return path
+
+
+def to_photo_image(image: "Image.Image", master) -> tkinter.PhotoImage:
+    """
+    Convertit une image Pillow en image Tk (PNG : la transparence est conservée).
+
+    Args:
+        image: Image à convertir.
+        master: Widget Tk propriétaire de l'image.
+
+    Returns:
+        L'image Tk.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return tkinter.PhotoImage(data=data, format="png", master=master)
+
+
+class TextSpriteCache:
+    """
+    Cache LRU des textes avec contour, enregistrés comme formes du moteur de rendu.
+    Un texte n'est oublié que si aucun sprite ne l'affiche (même caché ou
+    rendu à la réserve) : Turtle relit la forme de chaque turtle à chaque
+    screen.update(). Si tous les textes sont utilisés, le cache dépasse
+    sa taille jusqu'à ce que des sprites changent de texte.
+
+    Méthodes publiques:
+        - text(text: str, font: Font, color: str, outline_color: str, outline: int, persist: bool) -> TextImage: Image d'un texte
+        - glyphs(chars: str, font: Font, color: str, outline_color: str, outline: int) -> GlyphAtlas: Atlas de caractères
+        - write(sprite, text: str, x: float, y: float, color: str, font: Font, ...): Affiche un texte sur un sprite
+        - raise_sprite(sprite): Place un sprite de texte au premier plan
+        - cleanup(): Oublie toutes les images
+    """
+
+    def __init__(self, screen: "_Screen", renderer, max_entries: int = TEXT_CACHE_SIZE):
+        """
+        Initialise un cache vide.
+
+        Args:
+            screen: L'écran Turtle (propriétaire des images Tk).
+            renderer: Moteur de rendu où enregistrer les images.
+            max_entries: Nombre maximal de textes gardés en mémoire.
+        """
+        self._master = screen.getcanvas()
+        self._renderer = renderer
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple, TextImage]" = OrderedDict()
+        # Texte affiché par chaque sprite, et nombre de sprites par texte
+        self._sprite_keys: Dict[object, tuple] = {}
+        self._users: Dict[tuple, int] = {}
+        # Les atlas restent en mémoire (hors LRU) : ils servent à chaque point
+        self._atlases: Dict[tuple, GlyphAtlas] = {}
+        self._atlas_images: List[TextImage] = []
+        self._next_id = 0
+
+    def _register(self, text: str, font: Font, color: str, outline_color: str,
+                  outline: int, persist: bool) -> TextImage:
+        """
+        Dessine l'image d'un texte et l'enregistre comme forme.
+        Un texte fixe (persist) est lu depuis le cache disque, et y est
+        écrit la première fois ; les autres restent en mémoire seulement.
+        """
+        name = f"text_sprite_{self._next_id}"
+        self._next_id += 1
+        photo = None
+        if persist:
+            try:
+                photo = tkinter.PhotoImage(
+                    file=text_image_file(text, font, color, outline_color, outline),
+                    master=self._master)
+            except (OSError, tkinter.TclError):
+                # Cache illisible ou en lecture seule : image gardée en mémoire seulement
+                pass
+        if photo is None:
+            photo = to_photo_image(
+                render_outlined_text(text, font, color, outline_color, outline), self._master)
+        self._renderer.register_image(name, photo)
+        return TextImage(name, photo.width(), photo.height(), photo)
+
+    def text(self, text: str, font: Font, color: str, outline_color: str = "black",
+             outline: int = 2, persist: bool = False) -> TextImage:
+        """
+        Retourne l'image d'un texte, dessinée au premier appel.
+
+        Args:
+            text: Texte à afficher.
+            font: Police Tk (nom, taille, style).
+            color: Couleur du texte.
+            outline_color: Couleur du contour.
+            outline: Épaisseur du contour en pixels (0 pour aucun).
+            persist: True pour un texte fixe, gardé aussi dans le cache disque.
+
+        Returns:
+            L'image enregistrée.
+        """
+        key = (text, font, color, outline_color, outline)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        entry = self._register(text, font, color, outline_color, outline, persist)
+        self._entries[key] = entry
+        self._evict(keep=key)
+        return entry
+
+    def _evict(self, keep: tuple):
+        """
+        Oublie les textes les moins récents qu'aucun sprite n'affiche,
+        jusqu'à revenir à la taille du cache.
+
+        Args:
+            keep: Texte qui vient d'être ajouté (pas encore affiché).
+        """
+        while len(self._entries) > self._max_entries:
+            for key in self._entries:
+                if key != keep and not self._users.get(key):
+                    break
+            else:
+                # Tous les textes sont affichés
+                return
+            if not self._renderer.unregister_image(self._entries[key].name):
+                # Forme encore utilisée hors du cache : la garder
+                self._entries.move_to_end(key)
+                return
+            del self._entries[key]
+
+    def _use(self, sprite, key: tuple):
+        """
+        Note qu'un sprite affiche désormais un texte du cache.
+
+        Args:
+            sprite: Sprite qui affiche le texte.
+            key: Clé du texte affiché.
+        """
+        previous = self._sprite_keys.get(sprite)
+        if previous == key:
+            return
+        if previous is not None:
+            self._users[previous] -= 1
+            if not self._users[previous]:
+                del self._users[previous]
+        self._sprite_keys[sprite] = key
+        self._users[key] = self._users.get(key, 0) + 1
+
+    def glyphs(self, chars: str, font: Font, color: str, outline_color: str = "black",
+               outline: int = 2) -> GlyphAtlas:
+        """
+        Retourne un atlas de caractères placés à intervalles réguliers (chiffres d'un score).
+        Les caractères sont gardés dans le cache disque : leur nombre est fixe.
+
+        Args:
+            chars: Caractères de l'atlas.
+            font: Police Tk (nom, taille, style).
+            color: Couleur du texte.
+            outline_color: Couleur du contour.
+            outline: Épaisseur du contour en pixels.
+
+        Returns:
+            L'atlas, créé au premier appel.
+        """
+        key = (chars, font, color, outline_color, outline)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            return atlas
+
+        names = {}
+        width = height = 0
+        for char in chars:
+            entry = self._register(char, font, color, outline_color, outline, persist=True)
+            self._atlas_images.append(entry)
+            names[char] = entry.name
+            width = max(width, entry.width)
+            height = max(height, entry.height)
+
+        # Chaque caractère est centré dans une case de la largeur du plus large
+        atlas = GlyphAtlas(names, width - 2 * outline, width, height)
+        self._atlases[key] = atlas
+        return atlas
+
+    def write(self, sprite: "turtle.Turtle", text: str, x: float, y: float, color: str,
+              font: Font, align: str = "center", outline_color: str = "black",
+              outline: int = 2, persist: bool = False) -> TextImage:
+        """
+        Affiche un texte avec contour sur un sprite, placé comme avec turtle.write
+        (le bas du texte en y).
+
+        Args:
+            sprite: Sprite (turtle) qui affiche le texte.
+            text: Texte à afficher.
+            x: Position X.
+            y: Position Y.
+            color: Couleur du texte.
+            font: Police Tk (nom, taille, style).
+            align: Alignement du texte ("left", "center", "right").
+            outline_color: Couleur du contour.
+            outline: Épaisseur du contour en pixels (0 pour aucun).
+            persist: True pour un texte fixe, gardé aussi dans le cache disque.
+
+        Returns:
+            L'image affichée.
+        """
+        entry = self.text(text, font, color, outline_color, outline, persist)
+        sprite.shape(entry.name)
+        self._use(sprite, (text, font, color, outline_color, outline))
+        sprite.goto(x + entry.width * ALIGN_OFFSETS[align], y + entry.height / 2)
+        sprite.showturtle()
+        self._renderer.raise_sprite(sprite)
+        return entry
+
+    def raise_sprite(self, sprite: "turtle.Turtle"):
+        """
+        Place un sprite de texte au premier plan.
+
+        Args:
+            sprite: Sprite qui affiche un texte du cache.
+        """
+        self._renderer.raise_sprite(sprite)
+
+    def cleanup(self):
+        """Oublie toutes les images (cache et atlas)."""
+        for entry in list(self._entries.values()) + self._atlas_images:
+            self._renderer.unregister_image(entry.name)
+        self._entries.clear()
+        self._sprite_keys.clear()
+        self._users.clear()
+        self._atlases.clear()
+        self._atlas_images.clear()
+
+
+class OutlinedCounter:
+    """
+    Libellé suivi d'un nombre (ex. "Score: 12"), avec contour.
+    Le libellé est une seule image ; chaque chiffre est un sprite dont
+    l'image vient d'un atlas : changer la valeur ne touche que les
+    chiffres qui changent.
+
+    Méthodes publiques:
+        - set_value(value: int): Affiche une nouvelle valeur
+        - release(): Rend tous les sprites à la réserve
+    """
+
+    def __init__(self, pool: "TurtlePool", cache: TextSpriteCache, label: str,
+                 x: float, y: float, color: str, font: Font, outline: int = 1):
+        """
+        Affiche le libellé, aligné à gauche en (x, y).
+
+        Args:
+            pool: Réserve où emprunter les sprites.
+            cache: Cache des textes avec contour.
+            label: Libellé affiché avant le nombre.
+            x: Position X du début du libellé.
+            y: Position Y du bas du texte.
+            color: Couleur du texte.
+            font: Police Tk (nom, taille, style).
+            outline: Épaisseur du contour en pixels.
+        """
+        self._pool = pool
+        self._cache = cache
+        self._y = y
+        self._label = pool.acquire("text_sprite")
+        label_image = cache.write(self._label, label, x, y, color, font,
+                                  align="left", outline=outline, persist=True)
+        self._atlas = cache.glyphs(DIGITS, font, color, outline=outline)
+        # Les contours du libellé et du premier chiffre se chevauchent
+        self._digits_x = x + label_image.width - 2 * outline
+        self._digits: List["turtle.Turtle"] = []
+        self._text = ""
+
+    def set_value(self, value: int):
+        """
+        Affiche une nouvelle valeur.
+
+        Args:
+            value: Nombre à afficher.
+        """
+        text = str(value)
+        atlas = self._atlas
+        for i, char in enumerate(text):
+            if i == len(self._digits):
+                digit = self._pool.acquire("text_sprite")
+                digit.goto(self._digits_x + i * atlas.advance + atlas.width / 2,
+                           self._y + atlas.height / 2)
+                self._digits.append(digit)
+            elif i < len(self._text) and self._text[i] == char:
+                continue
+            self._digits[i].shape(atlas.names[char])
+            self._digits[i].showturtle()
+            self._cache.raise_sprite(self._digits[i])
+
+        while len(self._digits) > len(text):
+            self._pool.release(self._digits.pop())
+        self._text = text
+
+    def release(self):
+        """Rend tous les sprites à la réserve."""
+        for digit in self._digits:
+            self._pool.release(digit)
+        self._digits.clear()
+        self._pool.release(self._label)
+        self._text = ""
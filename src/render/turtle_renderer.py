@@ -0,0 +1,86 @@
+"""
+Moteur de rendu Turtle - Chaque élément visuel est une turtle.Turtle
+
+Deux opérations n'ont pas d'équivalent dans l'API publique de Turtle et
+passent par ses attributs privés : retirer une forme (screen._shapes)
+et mettre un sprite au premier plan (turtle._item, l'élément du canvas).
+Turtle relit screen._shapes pour chaque turtle à chaque screen.update() :
+une forme n'est donc retirée que si aucune turtle ne l'utilise. Le
+moteur Canvas (canvas_renderer.py) possède ses propres éléments et
+n'a pas cette dépendance.
+"""
+
+import tkinter
+import turtle
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from turtle import _Screen
+
+
+class TurtleRenderer:
+    """
+    Rendu historique : les sprites sont des turtles, redessinées par
+    screen.update() (qui parcourt toutes les turtles de l'écran).
+
+    Méthodes publiques:
+        - create_sprite() -> turtle.Turtle: Crée un sprite (une turtle)
+        - register_image(name: str, image: tkinter.PhotoImage): Enregistre une image comme forme
+        - unregister_image(name: str) -> bool: Oublie une image qu'aucune turtle n'utilise
+        - raise_sprite(sprite: turtle.Turtle): Place un sprite au premier plan
+    """
+
+    def __init__(self, screen: "_Screen"):
+        """
+        Initialise le moteur de rendu.
+
+        Args:
+            screen: L'écran Turtle de la fenêtre.
+        """
+        self._screen = screen
+
+    def create_sprite(self) -> turtle.Turtle:
+        """
+        Crée un sprite.
+
+        Returns:
+            Une nouvelle turtle.
+        """
+        return turtle.Turtle()
+
+    def register_image(self, name: str, image: tkinter.PhotoImage):
+        """
+        Enregistre une image en mémoire comme forme de turtle.
+
+        Args:
+            name: Nom de la forme.
+            image: Image Tk à afficher.
+        """
+        self._screen.register_shape(name, turtle.Shape("image", image))
+
+    def unregister_image(self, name: str) -> bool:
+        """
+        Oublie une image enregistrée avec register_image(), sauf si une
+        turtle (même cachée) l'utilise encore comme forme.
+
+        Args:
+            name: Nom de la forme.
+
+        Returns:
+            True si l'image a été oubliée.
+        """
+        if any(t.shape() == name for t in self._screen.turtles()):
+            return False
+        # Turtle n'offre pas de moyen public de retirer une forme
+        self._screen._shapes.pop(name, None)
+        return True
+
+    def raise_sprite(self, sprite: turtle.Turtle):
+        """
+        Place un sprite au premier plan (au-dessus des segments créés après lui).
+
+        Args:
+            sprite: Turtle créée par create_sprite().
+        """
+        # L'élément du canvas d'une turtle n'est pas exposé par l'API publique
+        self._screen.getcanvas().tag_raise(sprite.turtle._item)